@@ -1,220 +1,3196 @@
+import bz2
+import codecs
+import functools
+import glob
+import gzip
+import inspect
+import io
+import json
+import logging
+import lzma
+import math
+import os
+import threading
+import time
+import warnings
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
 import pandas as pd
 import numpy as np
 
-class Preprocessor:
-    def __init__(self, csv_file_path=None):
+
+# ---------------------------------------------------------------------------
+# Ölçüm (instrumentation)
+# ---------------------------------------------------------------------------
+# @_instrumented ile işaretlenen metotlar, Preprocessor'a sink eklenmişse her çağrı için
+# yapılandırılmış bir olay (sözlük) üretir. Sink yoksa ve verbose=True ise metot doğrudan
+# çağrılır (tek bir öznitelik kontrolü), bu yüzden ölçüm kapalıyken ek maliyet yok denecek kadar azdır.
+
+class MemorySink:
+    """
+    Olayları bellekte biriktirir. to_frame() ile DataFrame olarak alınabilir.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+    def to_frame(self):
+        return pd.DataFrame(self.events)
+
+
+class LoggingSink:
+    """
+    Olayları JSON metni olarak bir logging.Logger'a yazar.
+    """
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger("Preprocess4data")
+        self.level = level
+
+    def __call__(self, event):
+        self.logger.log(self.level, json.dumps(event, ensure_ascii=False, default=str))
+
+
+class JsonLinesSink:
+    """
+    Her olayı bir JSON satırı olarak dosyanın sonuna ekler.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, event):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+
+
+# verbose=False olan bir çağrı sürerken mesajlar o iş parçacığının yakalama tamponuna yazılır.
+# sys.stdout değiştirilmez; paralel iş parçacıklarındaki çağrılar birbirini etkilemez.
+_capture = threading.local()
+
+
+def _emit(*args, **kwargs):
+    """
+    Modülün tüm mesajları bu fonksiyonla yazılır (print ile aynı parametreler). Geçerli iş
+    parçacığında sessiz bir çağrı sürüyorsa mesaj ekrana değil yakalama tamponuna gider.
+    """
+    buffer = getattr(_capture, "buffer", None)
+    if buffer is not None:
+        kwargs["file"] = buffer
+    print(*args, **kwargs)
+
+
+def _with_capture(func):
+    """
+    func'ı çağıran iş parçacığının yakalama tamponuyla çalışacak şekilde sarar. İş parçacığı
+    havuzlarına verilen fonksiyonlar bununla sarılır; böylece verbose=False olan bir çağrının
+    işçilerindeki mesajlar da ekrana değil çağrının tamponuna yazılır.
+    """
+    buffer = getattr(_capture, "buffer", None)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        outer_buffer = getattr(_capture, "buffer", None)
+        _capture.buffer = buffer
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _capture.buffer = outer_buffer
+    return wrapper
+
+
+def _frame_stats(data):
+    if data is None:
+        return 0, 0, 0
+    return len(data), data.shape[1], int(data.memory_usage(index=True, deep=False).sum())
+
+
+def _instrumented(columns_arg=None):
+    """
+    Metot çağrısını ölçen dekoratör. Olay alanları: op, columns, seconds, rows_in, rows_out,
+    columns_in, columns_out, memory_in, memory_out, memory_delta (bayt, memory_usage ile),
+    timestamp, error ve verbose=False iken ekrana yazılmayan mesajlar (messages).
+    İç içe çağrılarda (örn. bir metodun başka bir ölçülen metodu çağırması) yalnızca en dıştaki
+    çağrı için olay üretilir.
+
+    columns_arg: Olaydaki 'columns' alanının alınacağı parametre adı
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            # LazyPipeline gibi yardımcı sınıflar kendi Preprocessor'larının ayarlarını kullanır
+            pre = getattr(self, "preprocessor", self)
+            state = pre._instrument_state
+            if getattr(state, "depth", 0) or (not pre.sinks and pre.verbose):
+                return func(self, *args, **kwargs)
+
+            columns = None
+            if columns_arg is not None:
+                columns = signature.bind(self, *args, **kwargs).arguments.get(columns_arg)
+                if columns is not None:
+                    columns = list(columns) if isinstance(columns, (list, tuple, pd.Index)) else [columns]
+            rows_in, cols_in, memory_in = _frame_stats(pre.data)
+            captured = io.StringIO()
+            error = None
+            outer_buffer = getattr(_capture, "buffer", None)
+            if not pre.verbose:
+                _capture.buffer = captured
+            state.depth = 1
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+                raise
+            finally:
+                seconds = time.perf_counter() - start
+                state.depth = 0
+                _capture.buffer = outer_buffer
+                if pre.sinks:
+                    rows_out, cols_out, memory_out = _frame_stats(pre.data)
+                    event = {
+                        "op": func.__name__,
+                        "columns": columns,
+                        "seconds": seconds,
+                        "rows_in": rows_in,
+                        "rows_out": rows_out,
+                        "columns_in": cols_in,
+                        "columns_out": cols_out,
+                        "memory_in": memory_in,
+                        "memory_out": memory_out,
+                        "memory_delta": memory_out - memory_in,
+                        "timestamp": time.time(),
+                        "error": error,
+                    }
+                    if not pre.verbose:
+                        event["messages"] = captured.getvalue().splitlines()
+                    for sink in pre.sinks:
+                        sink(event)
+        return wrapper
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# Birleştirilebilir istatistik özetleri (sketch)
+# ---------------------------------------------------------------------------
+# Bu özetler veriyi parça parça (update) okuyarak sabit/sınırlı bellekle istatistik
+# tutar ve farklı parçalardan/işçilerden gelen özetler merge() ile birleştirilebilir.
+# Belleğe sığmayan veride medyan, benzersiz değer sayısı ve en sık değerler için
+# yaklaşık (approx) mod bu sınıfları kullanır.
+
+def _merge_moments(count, mean, m2, col):
+    """
+    Welford/Chan birleştirmesi: (count, mean, M2) özetini yeni bir parçayla günceller.
+    """
+    values = col.dropna().to_numpy(dtype=float) if isinstance(col, pd.Series) else col[~np.isnan(col)]
+    n_b = len(values)
+    if n_b == 0:
+        return count, mean, m2
+    mean_b = values.mean()
+    m2_b = ((values - mean_b) ** 2).sum()
+    total = count + n_b
+    delta = mean_b - mean
+    mean = mean + delta * n_b / total
+    m2 = m2 + m2_b + delta ** 2 * count * n_b / total
+    return total, mean, m2
+
+
+class MomentSketch:
+    """
+    Welford tarzı count/mean/M2 ile min ve max. Sonuçlar kesindir (yaklaşık değildir).
+    """
+
+    def __init__(self):
+        self.count, self.mean, self.m2 = 0, 0.0, 0.0
+        self.min, self.max = np.nan, np.nan
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.count, self.mean, self.m2 = _merge_moments(self.count, self.mean, self.m2, values)
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        return self
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * other.count / total
+        self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * other.count / total
+        self.count = total
+        self.min, self.max = np.fmin(self.min, other.min), np.fmax(self.max, other.max)
+        return self
+
+    @property
+    def var(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self):
+        return float(np.sqrt(self.var))
+
+
+class QuantileSketch:
+    """
+    KLL tarzı birleştirilebilir kantil özeti. Her seviyedeki tampon dolduğunda sıralanır ve
+    elemanların yarısı (rastgele ofsetle) ağırlığı iki katına çıkarak üst seviyeye taşınır.
+
+    eps: Hedef sıra (rank) hatası; tüm kantiller için geçerlidir. Örn. eps=0.01 ile quantile(0.9)
+         sonucunun gerçek sırası yüksek olasılıkla [%89, %91] aralığındadır. En üst seviyenin
+         kapasitesi k = 4/eps, alt seviyelerinki en az MIN_CAPACITY'dir; bellek ~7/eps elemandır.
+    """
+
+    # update() girdiyi en fazla bu boyutta bloklar halinde ekler; her sıkıştırmada sadece bir blok
+    # (ve O(1/eps) boyutlu üst seviyeler) sıralanır.
+    BLOCK_SIZE = 65_536
+    # Alt seviyelerin en küçük kapasitesi; çok küçük tamponlar her sıkıştırmada orantısız hata ekler.
+    MIN_CAPACITY = 8
+
+    def __init__(self, eps=0.01, seed=0):
+        self.eps = eps
+        self.k = max(int(math.ceil(4 / eps)), self.MIN_CAPACITY)
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - 1 - level
+        return max(int(self.k * (2 / 3) ** depth), self.MIN_CAPACITY)
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            buffer = self.levels[level]
+            if len(buffer) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                buffer = np.sort(buffer)
+                # Tek sayıda eleman varsa sonuncusu bu seviyede kalır.
+                keep = buffer[-1:] if len(buffer) % 2 else buffer[:0]
+                even = buffer[: len(buffer) - len(keep)]
+                promoted = even[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.count += len(values)
+        # Büyük parçalar sınırlı bloklar halinde eklenip seviye seviye sıkıştırılır (vektörel);
+        # tüm parçanın tek seferde sıralanması gerekmez.
+        for start in range(0, len(values), self.BLOCK_SIZE):
+            self.levels[0] = np.concatenate([self.levels[0], values[start:start + self.BLOCK_SIZE]])
+            self._compress()
+        return self
+
+    def merge(self, other):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, buffer in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], buffer])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """
+        q (0-1 arası, skaler veya liste) için yaklaşık kantil değer(ler)i.
+        """
+        values = np.concatenate(self.levels)
+        if len(values) == 0:
+            return np.nan
+        weights = np.concatenate([np.full(len(buf), 2.0 ** level) for level, buf in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values, cum = values[order], np.cumsum(weights[order])
+        ranks = np.asarray(q, dtype=float) * cum[-1]
+        idx = np.searchsorted(cum, ranks, side="left").clip(0, len(values) - 1)
+        result = values[idx]
+        return float(result) if np.ndim(result) == 0 else result
+
+    def median(self):
+        return self.quantile(0.5)
+
+
+class DistinctSketch:
+    """
+    HyperLogLog benzersiz değer sayısı tahmincisi. Değerler 64-bit hash'lenir ve
+    2**p sayaçlık bir dizide tutulur; bellek satır sayısından bağımsızdır.
+
+    eps: Hedef göreli standart hata (1.04 / sqrt(2**p)); örn. eps=0.01 için p=14 (16 KB).
+    """
+
+    def __init__(self, eps=0.01):
+        self.eps = eps
+        self.p = int(min(max(math.ceil(math.log2((1.04 / eps) ** 2)), 4), 18))
+        self.m = 1 << self.p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def update(self, values):
+        values = pd.Series(values).dropna()
+        if len(values) == 0:
+            return self
+        # Satır özetleriyle aynı kanonik biçim: sayılar float64 (+0.0) olarak hash'lenir, böylece aynı
+        # değer int/float parçalarda veya -0.0/0.0 olarak gelse de aynı sayaca düşer.
+        hashes = _column_digests(values)
+        idx = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = hashes << np.uint64(self.p)
+        # Vektörel baştaki sıfır sayısı (ikili arama ile)
+        zeros = np.zeros(len(rest), dtype=np.uint8)
+        for shift in (32, 16, 8, 4, 2, 1):
+            small = rest < (np.uint64(1) << np.uint64(64 - shift))
+            zeros[small] += shift
+            rest[small] <<= np.uint64(shift)
+        rho = np.minimum(zeros + 1, 64 - self.p + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rho)
+        return self
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        raw = alpha * self.m ** 2 / np.sum(2.0 ** -self.registers.astype(np.float64))
+        empty = int((self.registers == 0).sum())
+        if raw <= 2.5 * self.m and empty > 0:
+            # Küçük kardinalitelerde doğrusal sayım daha doğrudur.
+            return int(round(self.m * math.log(self.m / empty)))
+        return int(round(raw))
+
+
+class HeavyHitters:
+    """
+    Misra-Gries en sık değerler (heavy hitters) özeti. En fazla k sayaç tutulur; bir değerin
+    sayısı gerçek sayıdan en fazla n / (k + 1) kadar düşük tahmin edilir. Birleştirilebilir.
+
+    eps: Hedef hata (sayım hatası <= eps * n), k = ceil(1 / eps)
+    """
+
+    def __init__(self, eps=0.001):
+        self.eps = eps
+        self.k = int(math.ceil(1 / eps))
+        self.counters = pd.Series(dtype=np.float64)
+        self.count = 0
+
+    def _prune(self):
+        if len(self.counters) > self.k:
+            threshold = self.counters.nlargest(self.k + 1).iloc[-1]
+            self.counters = self.counters - threshold
+            self.counters = self.counters[self.counters > 0]
+
+    def update(self, values):
+        counts = pd.Series(values).value_counts(dropna=True)
+        self.count += int(counts.sum())
+        self.counters = counts.astype(np.float64) if self.counters.empty else self.counters.add(counts, fill_value=0)
+        self._prune()
+        return self
+
+    def merge(self, other):
+        self.counters = self.counters.add(other.counters, fill_value=0)
+        self.count += other.count
+        self._prune()
+        return self
+
+    def top(self, n=5):
+        """
+        En sık n değer ve tahmini (alt sınır) sayıları.
+        """
+        return self.counters.nlargest(n).astype(np.int64)
+
+
+class ColumnSketch:
+    """
+    Bir sütun için tüm özetler: sayısal sütunlarda moment ve kantil, tüm sütunlarda
+    benzersiz değer ve en sık değer özetleri. update() ile parça parça güncellenir,
+    merge() ile başka işçilerin özetleriyle birleştirilir.
+    """
+
+    def __init__(self, quantile_eps=0.01, distinct_eps=0.01, heavy_eps=0.001):
+        self.rows = 0
+        self.missing = 0
+        self.moments = MomentSketch()
+        self.quantiles = QuantileSketch(quantile_eps)
+        self.distinct = DistinctSketch(distinct_eps)
+        self.heavy = HeavyHitters(heavy_eps)
+        self.numeric = True
+
+    def update(self, series):
+        self.rows += len(series)
+        self.missing += int(series.isna().sum())
+        self.numeric = self.numeric and pd.api.types.is_numeric_dtype(series)
+        if self.numeric:
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            self.moments.update(values)
+            self.quantiles.update(values)
+        self.distinct.update(series)
+        self.heavy.update(series)
+        return self
+
+    def merge(self, other):
+        self.rows += other.rows
+        self.missing += other.missing
+        self.numeric = self.numeric and other.numeric
+        self.moments.merge(other.moments)
+        self.quantiles.merge(other.quantiles)
+        self.distinct.merge(other.distinct)
+        self.heavy.merge(other.heavy)
+        return self
+
+
+# ---------------------------------------------------------------------------
+# Satır özetleri ve tekrar tespiti (deduplication)
+# ---------------------------------------------------------------------------
+# Satırlar (veya seçilen anahtar sütunları) 64-bit sabit genişlikli özetlere (digest)
+# indirgenir; tekrar tespiti satır genişliğinden bağımsız olarak bu özetler üzerinden yapılır.
+# Özetler sütunların kanonik biçiminden hesaplanır: sayılar float64 (veya 2^53'ü aşan tam sayılarda
+# kendi tipleri), metin/nesne değerleri tip etiketli kanonik metin biçimi üzerinden pd.util.hash_array ile
+# özetlenir; eksik değerler hangi dtype'ta olursa olsun aynı özeti verir. deduplicate_csv parçaları
+# metin olarak okuyup sayıları değer bazlı çözer, böylece özetler dosyanın parçalara nasıl bölündüğüne
+# bağlı değildir.
+# İki farklı satırın çakışma olasılığı yaklaşık n^2 / 2^65'tir (n: satır sayısı).
+
+_MISSING_DIGEST = np.uint64(0x9E3779B97F4A7C15)
+_DIGEST_SEED = np.uint64(0xCBF29CE484222325)
+_DIGEST_PRIME = np.uint64(0x100000001B3)
+
+
+def _column_digests(col, normalize=False, parse_numbers=False):
+    """
+    Bir sütunun satır bazlı 64-bit özetleri (kanonik biçim üzerinden).
+    normalize=True ise metinler karşılaştırmadan önce kırpılır, küçük harfe çevrilir ve
+    ardışık boşluklar teke indirilir.
+    parse_numbers=True ise sayı olarak çözülebilen metinler sayısal değerleriyle özetlenir
+    ("1", "1.0" ve 1 aynı özeti verir); karar değer bazlı olduğu için parçalardan bağımsızdır.
+    """
+    if parse_numbers and not pd.api.types.is_numeric_dtype(col):
+        numbers = pd.to_numeric(col, errors="coerce")
+        parsed = numbers.notna().to_numpy()
+        if parsed.any():
+            return np.where(parsed, _column_digests(numbers), _column_digests(col, normalize))
+    missing = col.isna().to_numpy()
+    if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+        # Tam sayılar float olarak özetlenir (eksik değerli parçalarda float okunurlar);
+        # 2^53'ü aşan değerler hassasiyet kaybı olmaması için kendi tipleriyle özetlenir.
+        if pd.api.types.is_integer_dtype(col) and len(col) and np.abs(col.to_numpy(dtype=np.float64, na_value=0)).max() > 2 ** 53:
+            values = col.to_numpy()
+        else:
+            # + 0.0: -0.0 ile 0.0 aynı özeti versin
+            values = col.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0
+        digests = pd.util.hash_pandas_object(pd.Series(values, copy=False), index=False).to_numpy()
+    elif pd.api.types.is_datetime64_any_dtype(col) or pd.api.types.is_timedelta64_dtype(col):
+        digests = pd.util.hash_pandas_object(col, index=False).to_numpy()
+    else:
+        # object/str/category/bool sütunlar kodlanır; kanonik biçim ve hash sadece benzersiz değerlere uygulanır.
+        codes, uniques = pd.factorize(col)
+        uniques = pd.Series(uniques)
+        if normalize:
+            uniques = uniques.astype("str").str.strip().str.lower().str.replace(r"\s+", " ", regex=True)
+        if normalize or (pd.api.types.is_string_dtype(uniques) and uniques.dtype != object):
+            canonical = ("s:" + uniques.astype("str")).to_numpy(dtype=object)
+        else:
+            canonical = np.array([_canonical_value(v) for v in uniques.to_numpy(dtype=object)], dtype=object)
+        canonical_digests = pd.util.hash_array(canonical, categorize=False)
+        digests = np.append(canonical_digests, _MISSING_DIGEST)[codes]
+    return np.where(missing, _MISSING_DIGEST, digests)
+
+
+def _canonical_value(value):
+    """
+    Tek bir değerin tip etiketli kanonik metin biçimi. Metinler "s:", sayılar "n:" ile etiketlenir;
+    True/1/1.0 (pandas eşitliğinde olduğu gibi) aynı biçime, "1" metni ise farklı bir biçime iner.
+    """
+    if isinstance(value, str):
+        return "s:" + value
+    if isinstance(value, (bool, int, np.bool_, np.integer)):
+        return f"n:{int(value)}"
+    if isinstance(value, (float, np.floating)):
+        value = float(value) + 0.0
+        return f"n:{int(value)}" if value.is_integer() else f"n:{value!r}"
+    return f"{type(value).__name__}:{value}"
+
+
+def _row_digests(df, subset=None, normalize=False, parse_numbers=False):
+    """
+    DataFrame satırlarının (subset verilirse sadece o sütunların) 64-bit özetleri.
+    Sütun özetleri sırayla katlanır; sütun sırası özeti değiştirir.
+    """
+    digests = np.full(len(df), _DIGEST_SEED, dtype=np.uint64)
+    for c in (df.columns if subset is None else subset):
+        digests ^= _column_digests(df[c], normalize, parse_numbers)
+        digests *= _DIGEST_PRIME
+    return digests
+
+
+class DigestIndex:
+    """
+    Görülmüş satır özetlerinin sıralı dizisi; her özet için toplam sayı ve son görüldüğü
+    satır konumu tutulur. Bellek satır sayısı veya genişliğiyle değil, benzersiz anahtar
+    sayısıyla büyür (anahtar başına 24 byte). Parçalar add() ile sırayla eklenir.
+    """
+
+    def __init__(self):
+        self.digests = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.last = np.empty(0, dtype=np.int64)
+        self.rows = 0
+
+    def __len__(self):
+        return len(self.digests)
+
+    def _locate(self, digests):
+        loc = np.searchsorted(self.digests, digests)
+        found = np.zeros(len(digests), dtype=bool)
+        inside = loc < len(self.digests)
+        found[inside] = self.digests[loc[inside]] == digests[inside]
+        return loc, found
+
+    def add(self, digests):
+        """
+        Bir parçanın özetlerini ekler (satır konumları önceki parçaların devamıdır).
+
+        Döndürür:
+        - Özeti ilk kez (bu ve önceki parçalarda) görülen satırlar için True olan maske
+        """
+        n = len(digests)
+        order = np.argsort(digests, kind="stable")
+        ordered = digests[order]
+        starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]]) if n else np.empty(0, dtype=np.int64)
+        ends = np.r_[starts[1:], n]
+        unique = ordered[starts]
+        first, last, counts = order[starts], order[ends - 1] + self.rows, ends - starts
+
+        loc, found = self._locate(unique)
+        self.counts[loc[found]] += counts[found]
+        self.last[loc[found]] = last[found]
+        new = ~found
+        self.digests = np.insert(self.digests, loc[new], unique[new])
+        self.counts = np.insert(self.counts, loc[new], counts[new])
+        self.last = np.insert(self.last, loc[new], last[new])
+        self.rows += n
+
+        is_first = np.zeros(n, dtype=bool)
+        is_first[first[new]] = True
+        return is_first
+
+    def lookup(self, digests):
+        """
+        Daha önce eklenmiş özetlerin toplam sayıları ve son görüldükleri satır konumları.
+        """
+        loc = self._locate(digests)[0]
+        return self.counts[loc], self.last[loc]
+
+
+# ---------------------------------------------------------------------------
+# Fit edilmiş dönüştürücüler (transformer)
+# ---------------------------------------------------------------------------
+# Her dönüştürücü önce istatistiklerini toplar (fit veya parça parça partial_fit +
+# finalize), ardından transform() ile istatistik hesaplamadan, tamamen vektörel
+# olarak uygulanır. Fit edilmiş durum get_state() ile JSON uyumlu bir sözlüğe
+# çevrilip TransformerPipeline.save() ile dosyaya yazılabilir; böylece eğitim
+# verisindeki istatistikler yeni veri parçalarına (inference) aynen uygulanır.
+# Akış (streaming) modunda bellek kullanımı dosya boyutuna değil parça boyutuna bağlı kalır.
+
+def _to_builtin(value):
+    """
+    NumPy/pandas skalerlerini JSON'a yazılabilir Python tiplerine çevirir.
+    """
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(v) for v in value]
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class Transformer:
+    """
+    Tüm dönüştürücülerin temel sınıfı.
+
+    needs_fit: İstatistik gerektirmeyen dönüştürücülerde False
+    drops_rows: Satır silen dönüştürücülerde True (sonraki tüm adımlar buna bağlıdır)
+    _params: Kurucu parametreleri, _state: fit sonucu oluşan öznitelikler
+    """
+    needs_fit = True
+    drops_rows = False
+    _params = ("column_name",)
+    _state = ("skip",)
+
+    def __init__(self, column_name):
+        self.column_name = column_name
+        self.fitted = not self.needs_fit
+        self.skip = False
+
+    def partial_fit(self, chunk):
+        pass
+
+    def finalize(self):
+        self.fitted = True
+
+    def fit(self, df):
+        """
+        Tüm veri üzerinde tek seferde fit eder.
+        """
+        self.partial_fit(df)
+        self.finalize()
+        return self
+
+    def transform(self, chunk):
+        return chunk
+
+    def get_state(self):
+        """
+        Dönüştürücünün tipini, parametrelerini ve fit edilmiş durumunu sözlük olarak döndürür.
+        """
+        return {
+            "type": type(self).__name__,
+            "params": {name: _to_builtin(getattr(self, name)) for name in self._params},
+            "state": {name: _to_builtin(getattr(self, name)) for name in self._state},
+        }
+
+    @staticmethod
+    def from_state(state):
+        """
+        get_state() çıktısından fit edilmiş bir dönüştürücü oluşturur.
+        """
+        cls = _TRANSFORMERS[state["type"]]
+        obj = cls(**state["params"])
+        for name, value in state["state"].items():
+            setattr(obj, name, value)
+        obj.fitted = True
+        return obj
+
+
+class MissingFiller(Transformer):
+    """
+    Eksik değerleri mean, median, mode veya sabit bir değerle doldurur.
+    median, fit() ile (tüm sütun bellekteyken) kesin; parça parça fit edilirken
+    QuantileSketch ile yaklaşık (sıra hatası <= eps) hesaplanır.
+    """
+    _params = ("column_name", "method", "value", "eps")
+    _state = ("skip", "fill_val")
+
+    def __init__(self, column_name, method="mean", value=None, eps=0.01):
+        self.method = method
+        self.value = value
+        self.eps = eps
+        self.needs_fit = method != "constant"
+        super().__init__(column_name)
+        self.count, self.mean, self.m2 = 0, 0.0, 0.0
+        self.counts = None
+        self.sketch = QuantileSketch(eps) if method == "median" else None
+        self.fill_val = value
+
+    def partial_fit(self, chunk):
+        col = chunk[self.column_name]
+        if self.method == "mean":
+            self.count, self.mean, self.m2 = _merge_moments(self.count, self.mean, self.m2, col)
+        elif self.method == "mode":
+            vc = col.value_counts(dropna=True)
+            self.counts = vc if self.counts is None else self.counts.add(vc, fill_value=0)
+        elif self.method == "median":
+            self.sketch.update(col.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    def fit(self, df):
+        if self.method == "median":
+            self.fill_val = df[self.column_name].median()
+            self.skip = pd.isna(self.fill_val)
+            self.fitted = True
+            return self
+        return super().fit(df)
+
+    def finalize(self):
+        if self.method == "mean":
+            self.fill_val = self.mean if self.count > 0 else None
+        elif self.method == "mode" and self.counts is not None and len(self.counts) > 0:
+            # pandas mode() ile aynı: en sık değerler arasından en küçüğü
+            top = self.counts[self.counts == self.counts.max()].index
+            self.fill_val = sorted(top)[0]
+        elif self.method == "median" and self.sketch.count > 0:
+            self.fill_val = self.sketch.median()
+        if self.fill_val is None:
+            self.skip = True
+        super().finalize()
+
+    def transform(self, chunk):
+        if not self.skip:
+            chunk[self.column_name] = chunk[self.column_name].fillna(self.fill_val)
+        return chunk
+
+
+class StandardScaler(Transformer):
+    """
+    (x - mean) / std standartlaştırması.
+    """
+    _state = ("skip", "mean", "std")
+
+    def __init__(self, column_name):
+        super().__init__(column_name)
+        self.count, self.mean, self.m2 = 0, 0.0, 0.0
+        self.std = None
+
+    def partial_fit(self, chunk):
+        self.count, self.mean, self.m2 = _merge_moments(self.count, self.mean, self.m2, chunk[self.column_name])
+
+    def finalize(self):
+        self.std = float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else 0.0
+        if self.std == 0:
+            _emit(f"'{self.column_name}' sütununda standart sapma 0, ölçekleme yapılamıyor.")
+            self.skip = True
+        super().finalize()
+
+    def transform(self, chunk):
+        if not self.skip:
+            chunk[self.column_name] = (chunk[self.column_name] - self.mean) / self.std
+        return chunk
+
+
+class MinMaxScaler(Transformer):
+    """
+    Min-max ölçekleme, feature_range=(min, max) aralığına.
+    """
+    _params = ("column_name", "feature_range")
+    _state = ("skip", "col_min", "col_max")
+
+    def __init__(self, column_name, feature_range=(0, 1)):
+        super().__init__(column_name)
+        self.feature_range = tuple(feature_range)
+        self.col_min = None
+        self.col_max = None
+
+    def partial_fit(self, chunk):
+        col = chunk[self.column_name]
+        c_min, c_max = col.min(), col.max()
+        if pd.isna(c_min):
+            return
+        self.col_min = c_min if self.col_min is None else min(self.col_min, c_min)
+        self.col_max = c_max if self.col_max is None else max(self.col_max, c_max)
+
+    def finalize(self):
+        if self.col_min is None or self.col_max == self.col_min:
+            _emit(f"'{self.column_name}' sütununda tüm değerler aynı, ölçekleme yapılamıyor.")
+            self.skip = True
+        super().finalize()
+
+    def transform(self, chunk):
+        if not self.skip:
+            min_range, max_range = self.feature_range
+            col = chunk[self.column_name]
+            chunk[self.column_name] = ((col - self.col_min) / (self.col_max - self.col_min)) * (max_range - min_range) + min_range
+        return chunk
+
+
+class OutlierHandler(Transformer):
+    """
+    Z-skor sınırlarının (mean ± z_threshold * std) dışındaki değerleri işler.
+    method: 'drop', 'cap', 'impute' (impute için fill_value verilmezse sütunun medyanı; parça
+    parça fit edilirken medyan QuantileSketch ile yaklaşık hesaplanır)
+    """
+    _params = ("column_name", "method", "z_threshold", "fill_value", "eps")
+    _state = ("skip", "lower", "upper", "fill_value")
+
+    def __init__(self, column_name, method="drop", z_threshold=3, fill_value=None, eps=0.01):
+        super().__init__(column_name)
+        self.method = method
+        self.drops_rows = method == "drop"
+        self.z_threshold = z_threshold
+        self.fill_value = fill_value
+        self.eps = eps
+        self.count, self.mean, self.m2 = 0, 0.0, 0.0
+        self.sketch = QuantileSketch(eps) if method == "impute" and fill_value is None else None
+        self.lower = None
+        self.upper = None
+
+    def partial_fit(self, chunk):
+        col = chunk[self.column_name]
+        self.count, self.mean, self.m2 = _merge_moments(self.count, self.mean, self.m2, col)
+        if self.sketch is not None:
+            self.sketch.update(col.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    def fit(self, df):
+        if self.method == "impute" and self.fill_value is None:
+            self.fill_value = df[self.column_name].median()
+        return super().fit(df)
+
+    def finalize(self):
+        std = float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else 0.0
+        if std == 0:
+            _emit(f"'{self.column_name}' sütununda standart sapma 0, aykırı değer yok.")
+            self.skip = True
+        elif self.method == "impute" and self.fill_value is None:
+            self.fill_value = self.sketch.median()
+        self.lower = float(self.mean - self.z_threshold * std)
+        self.upper = float(self.mean + self.z_threshold * std)
+        super().finalize()
+
+    def transform(self, chunk):
+        if self.skip:
+            return chunk
+        col = chunk[self.column_name]
+        if self.method == "cap":
+            chunk[self.column_name] = col.clip(lower=self.lower, upper=self.upper)
+            return chunk
+        mask = (col < self.lower) | (col > self.upper)
+        if self.method == "drop":
+            return chunk[~mask]
+        chunk[self.column_name] = col.mask(mask, self.fill_value)
+        return chunk
+
+
+class CategoryEncoder(Transformer):
+    """
+    Kategorik sütunu label (0..n-1 kodları) veya onehot (0-1 sütunları) olarak kodlar.
+    Fit sırasında görülmeyen değerler label modunda -1, onehot modunda tüm sütunlar 0 olur.
+
+    text_input: True ise sütun dosyadan metin olarak okunmuştur (stream_process); tüm değerler
+                sayı olarak çözülebiliyorsa sütun (tam yüklemede olduğu gibi) sayısal kabul edilir.
+    """
+    _params = ("column_name", "mode")
+    _state = ("skip", "categories")
+
+    def __init__(self, column_name, mode="label"):
+        super().__init__(column_name)
+        self.mode = mode
+        self.seen = {}
+        self.all_numeric = True
+        self.categories = None
+        self.text_input = False
+
+    def partial_fit(self, chunk):
+        col = chunk[self.column_name]
+        if self.text_input and not pd.api.types.is_numeric_dtype(col):
+            values = col.dropna()
+            numeric = pd.to_numeric(values, errors="coerce").notna().all()
+        else:
+            numeric = pd.api.types.is_numeric_dtype(col)
+        self.all_numeric = self.all_numeric and numeric
+        # dict ekleme sırasını korur; sıralanamayan değerlerde bu sıra kullanılır
+        for val in col.dropna().unique():
+            self.seen[val] = None
+
+    def finalize(self):
+        if self.all_numeric and self.seen:
+            _emit(f"'{self.column_name}' zaten sayısal.")
+            self.skip = True
+        try:
+            self.categories = sorted(self.seen)
+        except TypeError:
+            self.categories = list(self.seen)
+        self.categories = _to_builtin(self.categories)
+        super().finalize()
+
+    def transform(self, chunk):
+        if self.skip:
+            return chunk
+        cat = pd.Categorical(chunk[self.column_name], categories=self.categories)
+        if self.mode == "label":
+            chunk[self.column_name] = cat.codes
+            return chunk
+        onehot_df = pd.get_dummies(cat, prefix=self.column_name, dtype=int)
+        onehot_df.index = chunk.index
+        return pd.concat([chunk.drop(columns=[self.column_name]), onehot_df], axis=1)
+
+
+_TRANSFORMERS = {cls.__name__: cls for cls in (MissingFiller, StandardScaler, MinMaxScaler, OutlierHandler, CategoryEncoder)}
+
+
+class TransformerPipeline:
+    """
+    Sıralı dönüştürücü listesi. fit() istatistikleri veri üzerinden öğrenir, transform()
+    yeni bir veri parçasına istatistik hesaplamadan uygular. save()/load() ile fit edilmiş
+    durum JSON dosyasına yazılıp geri okunur.
+    """
+
+    def __init__(self, transformers):
+        self.transformers = list(transformers)
+
+    @property
+    def fitted(self):
+        return all(t.fitted for t in self.transformers)
+
+    def fit(self, df):
+        """
+        Dönüştürücüleri sırayla fit eder; her adım önceki adımların uygulandığı veri üzerinde
+        fit edilir. Verilen DataFrame değiştirilmez.
+        """
+        df = df.copy(deep=False)
+        for t in self.transformers:
+            t.fit(df)
+            df = t.transform(df)
+        return self
+
+    def transform(self, df):
+        """
+        Fit edilmiş dönüştürücüleri uygular ve yeni bir DataFrame döndürür (girdi değiştirilmez).
+        """
+        if not self.fitted:
+            _emit("Pipeline henüz fit edilmedi.")
+            return None
+        df = df.copy(deep=False)
+        for t in self.transformers:
+            df = t.transform(df)
+        return df
+
+    def save(self, file_path):
+        """
+        Fit edilmiş durumu kompakt bir JSON dosyasına yazar.
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump([t.get_state() for t in self.transformers], f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        save() ile yazılmış dosyadan fit edilmiş bir pipeline oluşturur.
+        """
+        with open(file_path, encoding="utf-8") as f:
+            return cls(Transformer.from_state(state) for state in json.load(f))
+
+
+# ---------------------------------------------------------------------------
+# Blok (2-D) sayısal çekirdekler
+# ---------------------------------------------------------------------------
+# Aynı işlem birden fazla sayısal sütuna uygulanırken sütunlar tek bir float
+# bloğa alınır; istatistikler axis=0 indirgemeleriyle hesaplanır ve dönüşüm blok
+# üzerinde yerinde yapılır. Her çekirdek X'i değiştirir ve hangi sütunların
+# gerçekten değiştiğini gösteren bir boolean dizi döndürür.
+
+_NAN_FREE = {np.nanmean: np.mean, np.nanmedian: np.median, np.nanmin: np.min, np.nanmax: np.max}
+
+
+def _nan_reduce(func, X):
+    """
+    Tamamı NaN olan sütunlarda uyarı vermeden NaN döndüren axis=0 indirgemesi.
+    Blokta hiç NaN yoksa daha hızlı olan NaN'sız karşılığı kullanılır.
+    """
+    if len(X) and not np.isnan(X).any():
+        return _NAN_FREE[func](X, axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return func(X, axis=0)
+
+
+def _nan_std(X):
+    if len(X) > 1 and not np.isnan(X).any():
+        return X.std(axis=0, ddof=1)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanstd(X, axis=0, ddof=1)
+
+
+def _nan_percentile(X, q):
+    if len(X) and not np.isnan(X).any():
+        return np.percentile(X, q, axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanpercentile(X, q, axis=0)
+
+
+def _nan_mad(X):
+    """
+    Ölçeklenmiş medyan mutlak sapma (normal dağılımda std ile aynı ölçek).
+    """
+    return 1.4826 * _nan_reduce(np.nanmedian, np.abs(X - _nan_reduce(np.nanmedian, X)))
+
+
+# Sütun bazlı (axis=0) istatistikler; Preprocessor._column_stats bunları önbellekli hesaplar
+# ve çekirdeklere stats sözlüğü olarak verir.
+_BLOCK_STATS = {
+    "mean": lambda X: _nan_reduce(np.nanmean, X),
+    "std": _nan_std,
+    "min": lambda X: _nan_reduce(np.nanmin, X),
+    "max": lambda X: _nan_reduce(np.nanmax, X),
+    "median": lambda X: _nan_reduce(np.nanmedian, X),
+    "q25": lambda X: _nan_percentile(X, 25),
+    "q75": lambda X: _nan_percentile(X, 75),
+    "mad": _nan_mad,
+}
+
+
+def _block_stats_from(X, names, stats):
+    """
+    stats sözlüğünde verilen (önbellekten gelen) istatistikleri, olmayanları X'ten hesaplayarak döndürür.
+    """
+    return [stats[name] if stats and name in stats else _BLOCK_STATS[name](X) for name in names]
+
+
+def _block_mode(X):
+    """
+    Her sütunun modu (eşitlikte en küçük değer, pandas mode() ile aynı).
+    """
+    modes = np.full(X.shape[1], np.nan)
+    for j in range(X.shape[1]):
+        values, counts = np.unique(X[:, j][~np.isnan(X[:, j])], return_counts=True)
+        if len(values):
+            modes[j] = values[np.argmax(counts)]
+    return modes
+
+
+def _fill_block(X, names, method="mean", value=None, stats=None):
+    missing = np.isnan(X)
+    changed = missing.any(axis=0)
+    if not changed.any():
+        return changed
+    if method in ("mean", "median"):
+        fill, = _block_stats_from(X, [method], stats)
+    elif method == "mode":
+        fill = _block_mode(X)
+    else:
+        # value skaler veya sütun başına bir değer (örn. yaklaşık medyanlar) olabilir
+        fill = np.broadcast_to(np.asarray(value, dtype=np.float64), X.shape[1:]).copy()
+    changed &= ~np.isnan(fill)
+    np.copyto(X, np.broadcast_to(fill, X.shape), where=missing & changed)
+    return changed
+
+
+def _restore_integer_dtypes(df, columns, block, dtypes):
+    """
+    Blok olarak float yazılan sütunlardan orijinal tipi tam sayı/boolean (örn. Int64) olup
+    değerlerinin hepsi tam sayı kalanları orijinal tiplerine geri çevirir (df yerinde güncellenir).
+    """
+    for j, c in enumerate(columns):
+        if not (pd.api.types.is_integer_dtype(dtypes[c]) or pd.api.types.is_bool_dtype(dtypes[c])):
+            continue
+        values = block[:, j]
+        if np.isfinite(values).all() and (values == np.round(values)).all():
+            df[c] = df[c].astype(dtypes[c])
+
+
+def _standard_scale_block(X, names, stats=None):
+    mean, std = _block_stats_from(X, ["mean", "std"], stats)
+    changed = std > 0
+    for name in np.asarray(names, dtype=object)[~changed]:
+        _emit(f"'{name}' sütununda standart sapma 0, ölçekleme yapılamıyor.")
+    np.subtract(X, mean, out=X, where=changed)
+    np.divide(X, std, out=X, where=changed)
+    return changed
+
+
+def _minmax_scale_block(X, names, feature_range=(0, 1), stats=None):
+    col_min, col_max = _block_stats_from(X, ["min", "max"], stats)
+    changed = col_max > col_min
+    for name in np.asarray(names, dtype=object)[~changed]:
+        _emit(f"'{name}' sütununda tüm değerler aynı, ölçekleme yapılamıyor.")
+    min_range, max_range = feature_range
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scale = (max_range - min_range) / (col_max - col_min)
+    np.subtract(X, col_min, out=X, where=changed)
+    np.multiply(X, scale, out=X, where=changed)
+    np.add(X, min_range, out=X, where=changed)
+    return changed
+
+
+_OUTLIER_THRESHOLDS = {"zscore": 3, "iqr": 1.5, "mad": 3.5}
+# Her tespit yönteminin ihtiyaç duyduğu _BLOCK_STATS istatistikleri
+_OUTLIER_STATS = {"zscore": ("mean", "std"), "iqr": ("q25", "q75"), "mad": ("median", "mad")}
+
+
+def _outlier_bounds(X, names, detection="zscore", threshold=None, stats=None):
+    """
+    Her sütun için aykırı değer sınırları (lower, upper) ve yayılımı 0'dan büyük olan
+    sütunları gösteren boolean dizi.
+    - zscore: mean ± threshold * std
+    - iqr: [Q1 - threshold * IQR, Q3 + threshold * IQR]
+    - mad: median ± threshold * 1.4826 * MAD (normal dağılımda std ile aynı ölçek)
+    """
+    if threshold is None:
+        threshold = _OUTLIER_THRESHOLDS[detection]
+    first, second = _block_stats_from(X, _OUTLIER_STATS[detection], stats)
+    if detection == "iqr":
+        scale = second - first
+        lower, upper = first - threshold * scale, second + threshold * scale
+    else:
+        scale = second
+        lower, upper = first - threshold * scale, first + threshold * scale
+    label = {"zscore": "standart sapma", "iqr": "IQR", "mad": "MAD"}[detection]
+    valid = scale > 0
+    for name in np.asarray(names, dtype=object)[~valid]:
+        _emit(f"'{name}' sütununda {label} 0, aykırı değer yok.")
+    return lower, upper, valid
+
+
+def _outlier_block(X, names, method="cap", z_threshold=3, fill_value=None, stats=None):
+    """
+    Z-skor sınırları dışındaki değerleri cap (sınıra çek) veya impute (fill_value ya da
+    sütun medyanı) ile işler. 'drop' satır sildiği için blok çekirdeği değildir.
+    """
+    lower, upper, valid = _outlier_bounds(X, names, "zscore", z_threshold, stats)
+    with np.errstate(invalid="ignore"):
+        mask = ((X < lower) | (X > upper)) & valid
+    changed = mask.any(axis=0)
+    if method == "cap":
+        np.clip(X, lower, upper, out=X, where=changed)
+    else:
+        fill = (_block_stats_from(X, ["median"], stats)[0] if fill_value is None
+                else np.broadcast_to(np.asarray(fill_value, dtype=np.float64), X.shape[1:]).copy())
+        np.copyto(X, np.broadcast_to(fill, X.shape), where=mask)
+    return changed
+
+
+_BLOCK_KERNELS = {
+    "fill_missing": _fill_block,
+    "standard_scale": _standard_scale_block,
+    "minmax_scale": _minmax_scale_block,
+    "handle_outliers": _outlier_block,
+}
+
+
+class LazyPipeline:
+    """
+    Preprocessor metotlarını hemen uygulamak yerine kaydeder ve execute() ile tek seferde
+    uygular. Planlama sırasında:
+    - Aynı sütun üzerindeki ardışık eleman bazlı sayısal adımlar (fill_missing, standard_scale,
+      minmax_scale, handle_outliers 'cap'/'impute') tek bir float dizi üzerinde art arda
+      uygulanıp sütuna bir kez yazılır (füzyon).
+    - Aynı adım zincirine sahip sütunlar tek bir 2-D blokta birlikte işlenir.
+    - Tüm onehot kodlamaları tek bir birleştirmeyle, sütun silmeleri tek seferde yapılır.
+    - handle_outliers(method='drop') satır sildiği için bir aşama sınırıdır; ardışık drop
+      adımlarının maskeleri aynı veri üzerinde hesaplanıp birleştirilir.
+
+    Kullanım:
+        pre.lazy().fill_missing("yas").standard_scale("yas").encode_column("sehir", mode="onehot").execute()
+    """
+
+    def __init__(self, preprocessor):
+        self.preprocessor = preprocessor
+        self.steps = []
+        data = preprocessor.data
+        self._schema = set(data.columns) if data is not None else set()
+        self._pending_prefixes = []
+
+    def _new_stage(self):
+        return {"chains": {}, "onehot": [], "drop_columns": [], "row_filter": []}
+
+    def _record(self, op, column_name, **params):
+        if self.preprocessor.data is None:
+            _emit("Veri yüklenmedi.")
+            return self
+        columns = [column_name] if isinstance(column_name, str) else list(column_name)
+        for col in columns:
+            from_onehot = any(col.startswith(prefix) for prefix in self._pending_prefixes)
+            if col not in self._schema and not from_onehot:
+                _emit(f"'{col}' isimli bir sütun bulunamadı.")
+                return self
+        if op == "drop_column":
+            self._schema -= set(columns)
+            self.steps.append((op, columns, params))
+            return self
+        for col in columns:
+            self.steps.append((op, col, params))
+            if op == "encode_column" and params.get("mode") == "onehot":
+                self._schema.discard(col)
+                self._pending_prefixes.append(f"{col}_")
+        return self
+
+    def fill_missing(self, column_name, method="mean", value=None):
+        if method not in ("mean", "median", "mode", "constant"):
+            _emit(f"Geçersiz method: {method}. ('mean', 'median', 'mode', 'constant')")
+            return self
+        if method == "constant" and value is None:
+            _emit("Lütfen constant metodunda doldurulacak bir değer belirtin.")
+            return self
+        return self._record("fill_missing", column_name, method=method, value=value)
+
+    def standard_scale(self, column_name):
+        return self._record("standard_scale", column_name)
+
+    def minmax_scale(self, column_name, feature_range=(0, 1)):
+        return self._record("minmax_scale", column_name, feature_range=tuple(feature_range))
+
+    def handle_outliers(self, column_name, method="drop", z_threshold=3, fill_value=None):
+        if method not in ("drop", "cap", "impute"):
+            _emit(f"Geçersiz method: {method}. ('drop', 'cap', 'impute')")
+            return self
+        return self._record("handle_outliers", column_name, method=method, z_threshold=z_threshold, fill_value=fill_value)
+
+    def encode_column(self, column_name, mode="label"):
+        if mode not in ("label", "onehot"):
+            _emit(f"Geçersiz mode: '{mode}'. 'label' veya 'onehot' olmalı.")
+            return self
+        return self._record("encode_column", column_name, mode=mode)
+
+    def drop_column(self, columns):
+        return self._record("drop_column", columns)
+
+    @staticmethod
+    def _is_fusable(op, params):
+        if op == "fill_missing" and params["method"] == "constant":
+            # Sayısal olmayan sabit float bloğa yazılamaz; fill_missing gibi adım adım doldurulur.
+            return isinstance(params["value"], (int, float, np.number))
+        return op in _BLOCK_KERNELS and not (op == "handle_outliers" and params["method"] == "drop")
+
+    def _plan(self):
+        """
+        Kaydedilen adımları aşamalara böler. Her aşamada sütun başına adım zinciri, onehot
+        kodlamaları, silinecek sütunlar ve aşamayı bitiren satır filtresi (drop) bulunur.
+        """
+        stages = [self._new_stage()]
+        created = set()
+        for op, col, params in self.steps:
+            stage = stages[-1]
+            is_drop_rows = op == "handle_outliers" and params["method"] == "drop"
+            # Satır filtresinden sonra gelen adımlar veya bu aşamada onehot ile oluşacak
+            # sütunlara başvuran adımlar yeni bir aşama başlatır.
+            touches_created = any(c in created or any(c.startswith(p) for p in created)
+                                  for c in (col if isinstance(col, list) else [col]))
+            if (stage["row_filter"] and not is_drop_rows) or touches_created:
+                stage = self._new_stage()
+                stages.append(stage)
+                created = set()
+            if is_drop_rows:
+                stage["row_filter"].append((col, params))
+            elif op == "drop_column":
+                stage["drop_columns"].extend(col)
+            elif op == "encode_column" and params["mode"] == "onehot":
+                stage["onehot"].append(col)
+                created.add(f"{col}_")
+            else:
+                stage["chains"].setdefault(col, []).append((op, params))
+        return [s for s in stages if any(s.values())]
+
+    @staticmethod
+    def _format_op(op, params):
+        shown = {k: v for k, v in params.items() if v is not None}
+        args = ", ".join(f"{k}={v}" for k, v in shown.items())
+        return f"{op}({args})"
+
+    def explain(self):
+        """
+        Füzyon uygulanmış çalıştırma planını metin olarak döndürür ve yazdırır.
+        """
+        lines = []
+        for i, stage in enumerate(self._plan(), 1):
+            lines.append(f"Aşama {i}:")
+            groups = {}
+            for col, chain in stage["chains"].items():
+                if all(self._is_fusable(op, params) for op, params in chain):
+                    key = tuple((op, tuple(sorted(params.items()))) for op, params in chain)
+                    groups.setdefault(key, []).append(col)
+                else:
+                    ops = " -> ".join(self._format_op(op, params) for op, params in chain)
+                    lines.append(f"  [sütun] '{col}': {ops}")
+            for key, cols in groups.items():
+                ops = " -> ".join(self._format_op(op, dict(params)) for op, params in key)
+                lines.append(f"  [füzyon, tek geçiş] {cols}: {ops}")
+            if stage["onehot"]:
+                lines.append(f"  [onehot, tek birleştirme] {stage['onehot']}")
+            if stage["drop_columns"]:
+                lines.append(f"  [drop_column] {stage['drop_columns']}")
+            for col, params in stage["row_filter"]:
+                lines.append(f"  [satır filtresi] {self._format_op('handle_outliers', dict(params, column_name=col))}")
+        plan = "\n".join(lines) if lines else "Boş plan."
+        _emit(plan)
+        return plan
+
+    def _run_block(self, df, cols, chain):
+        """
+        Aynı zincire sahip sayısal sütunları tek bir blokta işler ve değişenleri bir kez yazar.
+        """
+        numeric = [c for c in cols if pd.api.types.is_numeric_dtype(df[c])]
+        for col in cols:
+            if col not in numeric:
+                _emit(f"'{col}' sayısal bir sütun değil.")
+        if not numeric:
+            return df
+        X = df[numeric].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        changed = np.zeros(len(numeric), dtype=bool)
+        for op, params in chain:
+            changed |= _BLOCK_KERNELS[op](X, numeric, **params)
+        if changed.any():
+            written = [c for c, flag in zip(numeric, changed) if flag]
+            dtypes = df.dtypes[written]
+            df[written] = X[:, changed]
+            if all(op == "fill_missing" for op, _ in chain):
+                # Doldurma tam sayı sütunları float'a çevirmemeli (fill_missing ile aynı)
+                _restore_integer_dtypes(df, written, X[:, changed], dtypes)
+        return df
+
+    def _run_chain(self, df, col, chain):
+        """
+        Sütun zincirini sırayla uygular; ardışık sayısal adımlar tek blokta birleştirilir.
+        """
+        segment = []
+        for op, params in chain + [(None, None)]:
+            if op is not None and self._is_fusable(op, params) and pd.api.types.is_numeric_dtype(df[col]):
+                segment.append((op, params))
+                continue
+            if segment:
+                df = self._run_block(df, [col], segment)
+                segment = []
+            if op is None:
+                break
+            if op == "fill_missing":
+                series = df[col]
+                if params["method"] == "mode" and series.notna().any():
+                    df[col] = series.fillna(series.mode().iloc[0])
+                elif params["method"] == "constant":
+                    df[col] = series.fillna(params["value"])
+                else:
+                    _emit(f"'{col}' sayısal değil, {params['method']} ile dolduramazsınız.")
+            elif op == "encode_column":
+                if pd.api.types.is_numeric_dtype(df[col]):
+                    _emit(f"'{col}' zaten sayısal.")
+                else:
+                    df[col] = df[col].astype("category").cat.codes
+            else:
+                _emit(f"'{col}' sayısal bir sütun değil.")
+        return df
+
+    @_instrumented()
+    def execute(self):
+        """
+        Planı çalıştırır, sonucu preprocessor.data'ya yazar ve döndürür. Kaydedilen adımlar temizlenir.
+        """
+        pre = self.preprocessor
+        if pre.data is None:
+            _emit("Veri yüklenmedi.")
+            return None
+
+        df = pre.data.copy(deep=False)
+        touched = set()
+        rows_dropped = False
+        for stage in self._plan():
+            groups = {}
+            for col, chain in stage["chains"].items():
+                if col not in df.columns:
+                    _emit(f"'{col}' isimli bir sütun bulunamadı.")
+                    continue
+                touched.add(col)
+                fusable = all(self._is_fusable(op, params) for op, params in chain)
+                if fusable and pd.api.types.is_numeric_dtype(df[col]):
+                    key = tuple((op, tuple(sorted(params.items()))) for op, params in chain)
+                    groups.setdefault(key, (chain, []))[1].append(col)
+                else:
+                    df = self._run_chain(df, col, chain)
+            for chain, cols in groups.values():
+                df = self._run_block(df, cols, chain)
+
+            onehot_cols = [c for c in stage["onehot"] if c in df.columns]
+            if onehot_cols:
+                onehot_df = pd.get_dummies(df[onehot_cols], columns=onehot_cols, prefix=onehot_cols, dtype=int)
+                df = pd.concat([df.drop(columns=onehot_cols), onehot_df], axis=1)
+                touched.update(onehot_cols)
+                touched.update(onehot_df.columns)
+            if stage["drop_columns"]:
+                df = df.drop(columns=[c for c in stage["drop_columns"] if c in df.columns])
+                touched.update(stage["drop_columns"])
+
+            if stage["row_filter"]:
+                mask = np.zeros(len(df), dtype=bool)
+                for col, params in stage["row_filter"]:
+                    if col not in df.columns or not pd.api.types.is_numeric_dtype(df[col]):
+                        _emit(f"'{col}' sayısal bir sütun değil.")
+                        continue
+                    values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                    std = np.nanstd(values, ddof=1) if np.isfinite(values).sum() > 1 else 0.0
+                    if std > 0:
+                        with np.errstate(invalid="ignore"):
+                            mask |= np.abs(values - np.nanmean(values)) / std > params["z_threshold"]
+                if mask.any():
+                    df = df[~mask]
+                    rows_dropped = True
+                _emit(f"{int(mask.sum())} aykırı değer satırı drop edildi.")
+
+        pre.data = df
+        pre.header = list(df.columns)
+        pre._bump_version(None if rows_dropped else sorted(touched))
+        _emit(f"Lazy pipeline çalıştırıldı ({len(self.steps)} adım).")
+        self.steps = []
+        self._schema = set(df.columns)
+        self._pending_prefixes = []
+        return df
+
+
+# ---------------------------------------------------------------------------
+# Arka plan CSV yazıcı
+# ---------------------------------------------------------------------------
+# Veri sınırlı boyutlu satır parçaları halinde serileştirilip yazılır; isteğe bağlı olarak
+# gzip/bz2/xz ile sıkıştırılır. Yazma hedefle aynı klasördeki geçici bir dosyaya yapılır ve
+# bitince os.replace ile atomik olarak yerine taşınır; yarım kalmış bir dosya hedefte görünmez.
+
+_COMPRESSORS = {None: open, "gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+# pandas >= 3'te Copy-on-Write varsayılandır: sığ kopya, sonraki adımların değişikliklerinden etkilenmez.
+_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+
+class AsyncCsvWriter:
+    """
+    DataFrame'i parça parça (chunksize satır) CSV'ye yazan iş. start() ile arka plan iş
+    parçacığında, run() ile çağıranın iş parçacığında çalışır. Sıkıştırma yoksa çıktı
+    tek seferde yazılan to_csv ile byte byte aynıdır. Program sonlanırken devam eden yazmalar
+    tamamlanmadan çıkılmaz.
+
+    wait(timeout=None): Yazma bitene kadar bekler; başarılıysa True döndürür.
+    done(): Yazma bittiyse (başarılı veya hatalı) True döndürür.
+    rows, seconds, error: Yazılan satır sayısı, süre ve varsa hata.
+    """
+
+    def __init__(self, data, full_path, index=False, compression=None, chunksize=100_000):
+        self.data = data
+        self.path = full_path
+        self.index = index
+        self.compression = compression
+        self.chunksize = chunksize
+        self.rows = 0
+        self.seconds = None
+        self.error = None
+        self._thread = None
+
+    def run(self):
+        start = time.perf_counter()
+        # Geçici dosya hedefle aynı klasörde olmalı (os.replace dosya sistemleri arasında atomik değildir).
+        directory, name = os.path.split(os.path.abspath(self.path))
+        tmp_path = os.path.join(directory, f".{name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            with _COMPRESSORS[self.compression](tmp_path, "wt", encoding="utf-8", newline="") as f:
+                for offset in range(0, max(len(self.data), 1), self.chunksize):
+                    chunk = self.data.iloc[offset:offset + self.chunksize]
+                    chunk.to_csv(f, header=(offset == 0), index=self.index)
+                    self.rows += len(chunk)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            # Arka plan iş parçacığındaki hata wait() ile çağırana bildirilir.
+            self.error = e
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        finally:
+            # Yazma bitince anlık görüntü bırakılır.
+            self.data = None
+            self.seconds = time.perf_counter() - start
+        return self.error is None
+
+    def start(self):
+        # daemon değil: yorumlayıcı kapanırken devam eden yazma öldürülmez, bitmesi beklenir.
+        self._thread = threading.Thread(target=self.run, name=f"csv-writer:{self.path}", daemon=False)
+        self._thread.start()
+        return self
+
+    def done(self):
+        return self._thread is None or not self._thread.is_alive()
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                return False
+        if self.error is not None:
+            _emit(f"CSV yazılamadı ({self.path}): {self.error}")
+            return False
+        return True
+
+
+# ---------------------------------------------------------------------------
+# Paralel çalıştırma yardımcıları
+# ---------------------------------------------------------------------------
+
+def _resolve_jobs(n_jobs):
+    """
+    n_jobs=-1 (veya None) tüm çekirdekler, diğer değerler en az 1 işçi.
+    """
+    if n_jobs is None or n_jobs < 0:
+        return os.cpu_count() or 1
+    return max(int(n_jobs), 1)
+
+
+def _shared_block_stats(shm_name, shape, dtype, start, stop, z_threshold):
+    """
+    Süreç havuzu işçisi: paylaşılan bellekteki bloğun [start:stop) sütunları için
+    istatistikleri hesaplar. Blok işçilere pickle ile kopyalanmaz, isimle bağlanılır.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        block = np.ndarray(shape, dtype=dtype, buffer=shm.buf, order="F")
+        return Preprocessor._numeric_block_stats(block[:, start:stop], z_threshold)
+    finally:
+        del block
+        shm.close()
+
+
+class Preprocessor:
+    ENCODINGS = ['utf-8', 'latin-1', 'windows-1254']
+
+    def __init__(self, csv_file_path=None, verbose=True, sinks=None, stats_cache_size=4096):
+        """
+        İhtiyaç duyulan tüm parametreler burada tanımlanmalıdır.
+
+        verbose: False ise metotların ekran mesajları yazdırılmaz (olaylarda 'messages' alanına eklenir)
+        sinks: Her metot çağrısı için yapılandırılmış olay alan çağrılabilirler
+               (örn: MemorySink(), LoggingSink(), JsonLinesSink("olaylar.jsonl")); self.sinks listesine
+               sonradan da eklenebilir
+        stats_cache_size: İstatistik önbelleğindeki en fazla kayıt sayısı (LRU ile tahliye edilir)
+        """
+        self.data = None
+        self.header = None
+        self.encoding = None
+        self.manifest = None
+        self.verbose = verbose
+        self.sinks = list(sinks) if sinks else []
+        # İç içe çağrı derinliği iş parçacığına özeldir (paralel çağrılar birbirini bastırmaz).
+        self._instrument_state = threading.local()
+
+        # Sütun sürümleri: veriyi değiştiren her metot ilgili sütunların sürümünü artırır.
+        # İstatistik önbelleği (tip tahmini, profil, mean/std/medyan...) kayıtları sütun
+        # sürümü ve sütunun veri dizisinin parmak iziyle saklar; ikisi de değişmediği sürece
+        # yeniden hesaplama yapılmaz.
+        self._version_counter = 0
+        self._column_versions = {}
+        self.stats_cache_size = stats_cache_size
+        self._stats_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_data_id = None
+
+        if csv_file_path is not None:
+            self.load_csv(csv_file_path)
+
+    def invalidate_cache(self, columns=None):
+        """
+        Verilen sütunların (None ise tüm sütunların) önbellekteki istatistiklerini geçersiz kılar.
+        self.data'daki bir sütun yerine yenisi atandığında (örn. pre.data["a"] = pre.data["a"] * 100)
+        önbellek bunu kendisi fark eder; ancak değerler yerinde değiştirildiğinde
+        (örn. pre.data.loc[0, "a"] = 5) bu metot elle çağrılmalıdır.
+        """
+        self._bump_version(columns)
+
+    def _bump_version(self, columns=None):
+        """
+        Verilen sütunların (None ise tüm sütunların) sürümünü artırır.
+        """
+        if columns is None:
+            columns = list(self.data.columns) if self.data is not None else []
+            current = set(columns)
+            columns += [c for c in self._column_versions if c not in current]
+        elif isinstance(columns, str):
+            columns = [columns]
+        self._version_counter += 1
+        for col in columns:
+            self._column_versions[col] = self._version_counter
+        self._cache_data_id = id(self.data)
+
+    def _column_fingerprint(self, column):
+        """
+        Sütunun veri dizisinin kimliği (numpy dizileri için bellek adresi ve adımları, diğerleri için
+        dizi nesnesi). Sütuna yeni bir dizi atandığında değişir; yerinde değişiklikleri yakalamaz.
+        """
+        if self.data is None or column not in self.data.columns:
+            return None
+        series = self.data[column]
+        if isinstance(series, pd.DataFrame):
+            return None
+        if isinstance(series.array, pd.arrays.NumpyExtensionArray):
+            values = series.to_numpy(copy=False)
+            return values.__array_interface__["data"][0], values.strides, values.dtype, len(values)
+        return id(series.array), series.dtype, len(series)
+
+    def _cache_get(self, key):
+        """
+        İstatistik önbelleğinden okur. key[0] sütun adıdır; kayıt yalnızca sütunun sürümü ve
+        veri dizisi (_column_fingerprint) değişmediyse geçerlidir. self.data dışarıdan başka bir
+        DataFrame ile değiştirildiyse önbellek temizlenir.
+        """
+        with self._cache_lock:
+            if self._cache_data_id != id(self.data):
+                self._stats_cache.clear()
+                self._cache_data_id = id(self.data)
+                return None
+            entry = self._stats_cache.get(key)
+            if entry is None or entry[0] != self._column_versions.get(key[0]):
+                return None
+            if entry[1] != self._column_fingerprint(key[0]):
+                del self._stats_cache[key]
+                return None
+            self._stats_cache.move_to_end(key)
+            return entry[2]
+
+    def _cache_put(self, key, value):
+        """
+        Önbelleğe sütunun güncel sürümüyle yazar; boyut aşılırsa en eski kullanılan kayıtlar atılır.
+        """
+        with self._cache_lock:
+            self._stats_cache[key] = (self._column_versions.get(key[0]), self._column_fingerprint(key[0]), value)
+            self._stats_cache.move_to_end(key)
+            while len(self._stats_cache) > self.stats_cache_size:
+                self._stats_cache.popitem(last=False)
+
+    def _column_stats(self, columns, names, X=None):
+        """
+        Sayısal sütunların istatistiklerini (_BLOCK_STATS: mean, std, min, max, median, q25, q75, mad)
+        önbellekten okur; eksik olanları tek bir blok üzerinde bir kez hesaplayıp önbelleğe ekler.
+
+        X: columns sırasıyla hazır float64 blok (verilmezse gerektiğinde self.data'dan oluşturulur)
+
+        Döndürür:
+        - {istatistik: columns sırasıyla numpy dizi}
+        """
+        result = {}
+        for name in names:
+            values = np.empty(len(columns))
+            missing = []
+            for j, c in enumerate(columns):
+                cached = self._cache_get((c, name))
+                if cached is None:
+                    missing.append(j)
+                else:
+                    values[j] = cached
+            if missing:
+                if X is None or X.dtype != np.float64:
+                    X = self.data[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+                computed = _BLOCK_STATS[name](X if len(missing) == len(columns) else X[:, missing])
+                for j, value in zip(missing, computed):
+                    values[j] = value
+                    self._cache_put((columns[j], name), float(value))
+            result[name] = values
+        return result
+    
+    _DECOMPRESSORS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+    @staticmethod
+    def _open_binary(file_path):
+        """
+        Dosyayı byte olarak açar; .gz/.bz2/.xz/.zip uzantılı dosyalar (read_csv gibi) açılmış
+        içerikleriyle okunur, böylece kodlama sıkıştırılmış byte'lardan değil metinden tahmin edilir.
+        """
+        path = os.fspath(file_path)
+        suffix = os.path.splitext(path)[1].lower()
+        if suffix in Preprocessor._DECOMPRESSORS:
+            return Preprocessor._DECOMPRESSORS[suffix](path, "rb")
+        if suffix == ".zip":
+            with zipfile.ZipFile(path) as archive:
+                # Arşiv kapansa da açık üye dosyası kapanana kadar okunabilir.
+                return archive.open(archive.namelist()[0])
+        return open(path, "rb")
+
+    @staticmethod
+    def _is_local_path(file_path):
+        """
+        Yerel bir dosya yolu mu (URL veya dosya benzeri nesne değil)?
+        """
+        return isinstance(file_path, (str, os.PathLike)) and "://" not in os.fspath(file_path)
+
+    @staticmethod
+    def detect_encoding(file_path, encodings=None, sample_size=1 << 20, validate=False, block_size=1 << 22):
+        """
+        Dosyanın kodlamasını DataFrame oluşturmadan, ham byte'lar üzerinden tahmin eder.
+        Önce dosyanın başından sample_size byte'lık bir örnek her aday kodlamayla çözülür;
+        validate=True ise seçilen kodlama tüm dosya üzerinde blok blok doğrulanır.
+
+        Parametreler:
+        - file_path: Dosya yolu (.gz/.bz2/.xz/.zip dosyalarında açılmış içerik örneklenir)
+        - encodings: Denenecek kodlamalar (sırasıyla), varsayılan Preprocessor.ENCODINGS
+        - sample_size: Örnek olarak okunacak byte sayısı
+        - validate: Tüm dosyanın seçilen kodlamayla çözülebildiğini doğrula
+        - block_size: Doğrulama sırasında okunan blok boyutu (byte)
+
+        Döndürür:
+        - Uygun kodlama adı, hiçbiri uymazsa (veya file_path URL/dosya benzeri nesneyse) None
+        """
+        if not Preprocessor._is_local_path(file_path):
+            return None
+        encodings = encodings or Preprocessor.ENCODINGS
+        with Preprocessor._open_binary(file_path) as f:
+            sample = f.read(sample_size)
+            at_eof = not f.read(1)
+
+        for encoding in encodings:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            try:
+                # Örnek, çok byte'lı bir karakterin ortasında bitebilir; final=False bunu tolere eder.
+                decoder.decode(sample, final=at_eof)
+            except UnicodeDecodeError:
+                continue
+
+            if not validate or at_eof:
+                return encoding
+
+            decoder = codecs.getincrementaldecoder(encoding)()
+            try:
+                with Preprocessor._open_binary(file_path) as f:
+                    for block in iter(lambda: f.read(block_size), b""):
+                        decoder.decode(block)
+                decoder.decode(b"", final=True)
+            except UnicodeDecodeError:
+                continue
+            return encoding
+
+        return None
+
+    def _read_csv_file(self, file_path, encoding=None, validate_encoding=False, **read_kwargs):
+        """
+        Tek bir CSV dosyasını kodlama tahminiyle okur. URL ve dosya benzeri nesnelerde
+        kodlama tahmini yapılmaz; ENCODINGS sırayla denenir.
+
+        Döndürür:
+        - (DataFrame, kodlama) demeti; hata durumunda mesaj yazdırır ve None döndürür
+        """
+        if not self._is_local_path(file_path):
+            candidates = [encoding] if encoding else list(self.ENCODINGS)
+        elif encoding:
+            candidates = [encoding]
+        else:
+            try:
+                candidates = [self.detect_encoding(file_path, validate=validate_encoding)]
+            except FileNotFoundError:
+                # Dosya bulunamadıysa hemen None döndür.
+                return None
+            if candidates[0] is None:
+                _emit(f"Dosya kodlaması tespit edilemedi. Denenen kodlamalar: {self.ENCODINGS}")
+                return None
+            # Örnek geçip dosyanın ilerisinde hata çıkarsa sıradaki kodlamalara geçilir.
+            candidates += self.ENCODINGS[self.ENCODINGS.index(candidates[0]) + 1:]
+
+        for candidate in candidates:
+            if hasattr(file_path, "seek"):
+                # Önceki denemede okunan tampon başa alınır.
+                file_path.seek(0)
+            try:
+                return pd.read_csv(file_path, encoding=candidate, **read_kwargs), candidate
+            except UnicodeDecodeError:
+                continue
+            except (pd.errors.ParserError, pd.errors.EmptyDataError, ValueError) as e:
+                _emit(f"CSV okunamadı ({candidate}): {e}")
+                return None
+
+        _emit(f"Dosya hiçbir kodlamayla okunamadı: {candidates}")
+        return None
+
+    CSV_SUFFIXES = (".csv", ".csv.gz", ".csv.bz2", ".csv.xz", ".csv.zip")
+
+    @classmethod
+    def _resolve_shards(cls, file_path):
+        """
+        Klasör, glob deseni veya yol listesini sıralı dosya listesine çevirir.
+        Tek bir dosya yolu, URL veya dosya benzeri nesne için None döndürür.
+        """
+        if isinstance(file_path, (list, tuple)):
+            return list(file_path)
+        if not cls._is_local_path(file_path):
+            # URL ve dosya benzeri nesneler doğrudan read_csv'ye verilir.
+            return None
+        file_path = os.fspath(file_path)
+        if os.path.isdir(file_path):
+            return sorted(os.path.join(file_path, name) for name in os.listdir(file_path)
+                          if name.endswith(cls.CSV_SUFFIXES))
+        if glob.has_magic(file_path):
+            return sorted(glob.glob(file_path))
+        return None
+
+    @staticmethod
+    def _unify_dtype(dtypes, has_gaps):
+        """
+        Parçalardaki dtype'lardan ortak dtype'ı seçer (pd.concat ile aynı sonuç).
+        has_gaps: Sütun bazı parçalarda yoksa True (eksik değer gerektirir)
+        """
+        first = dtypes[0]
+        if all(dtype == first for dtype in dtypes) and not (has_gaps and isinstance(first, np.dtype)
+                                                             and first.kind in "iub"):
+            return first
+        if all(isinstance(dtype, np.dtype) and dtype.kind in "iuf" for dtype in dtypes):
+            common = np.result_type(*dtypes)
+            return np.dtype(np.float64) if has_gaps and common.kind in "iu" else common
+        return np.dtype(object)
+
+    def _combine_shards(self, frames):
+        """
+        Parçaları tek bir DataFrame'de birleştirir: sütun kümeleri birleştirilir (ilk görülme sırası),
+        dtype'lar ortaklaştırılır ve her sütun için çıktı dizisi bir kez ayrılıp parçalar doğrudan
+        ilgili dilimlere kopyalanır (ara birleştirme kopyası oluşmaz).
+        """
+        columns = list(dict.fromkeys(c for frame in frames for c in frame.columns))
+        lengths = [len(frame) for frame in frames]
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        total = int(offsets[-1])
+        combined = {}
+        for c in columns:
+            present = [frame[c] for frame in frames if c in frame.columns]
+            target = self._unify_dtype([col.dtype for col in present], len(present) < len(frames))
+            if isinstance(target, np.dtype) and target.kind in "iufbmM":
+                out = np.empty(total, dtype=target)
+                if len(present) < len(frames):
+                    out[:] = np.nan if target.kind == "f" else target.type("NaT")
+                for frame, start, stop in zip(frames, offsets[:-1], offsets[1:]):
+                    if c in frame.columns:
+                        out[start:stop] = frame[c].to_numpy()
+                combined[c] = out
+            else:
+                pieces = [frame[c].astype(target, copy=False) if c in frame.columns
+                          else pd.Series(np.full(len(frame), np.nan, dtype=object)).astype(target)
+                          for frame in frames]
+                combined[c] = pd.concat(pieces, ignore_index=True)
+        return pd.DataFrame(combined, index=pd.RangeIndex(total), columns=columns, copy=False)
+
+    def _set_loaded_frame(self, df, encoding, optimize, cast=False):
+        self.data = df
+        self.header = list(df.columns)
+        self.encoding = encoding
+        self._bump_version()
+        if cast:
+            self.auto_cast(verbose=False)
+        if optimize:
+            self.optimize_memory(verbose=False)
+
+    @_instrumented()
+    def load_csv(self, file_path, encoding=None, validate_encoding=False, usecols=None, dtype=None, nrows=None,
+                 optimize=False, n_jobs=-1, auto_cast=False, **read_kwargs):
+        """
+        CSV dosyasını okur ve self.data ile self.header'a kaydeder.
+        Kodlama, dosyanın bir byte örneğinden tahmin edilir ve dosya tek seferde okunur;
+        seçilen kodlama self.encoding'e yazılır.
+
+        file_path bir klasör (içindeki .csv dosyaları), glob deseni (örn: "parcalar/*.csv") veya
+        yol listesi olabilir. Bu durumda parçalar bir iş parçacığı havuzunda eşzamanlı okunur,
+        sütun kümeleri ve dtype'lar ortaklaştırılır ve birleşik veri tek bir son ayırmayla oluşturulur.
+        Her okuma için dosya yolu, satır/sütun sayısı, kodlama, boyut ve süre self.manifest'e yazılır.
+
+        Parametreler:
+        - file_path: Okunacak CSV dosyasının yolu, klasör, glob deseni veya yol listesi
+        - encoding: Kodlama biliniyorsa doğrudan verilebilir (tahmin atlanır)
+        - validate_encoding: Okumadan önce tüm dosyanın kodlamasını doğrula
+        - usecols, dtype, nrows: Doğrudan pd.read_csv'ye aktarılır (sadece gerekli sütun/satırlar okunur;
+          birden fazla parçada nrows her parçaya ayrı uygulanır)
+        - optimize: Yüklemeden sonra optimize_memory ile veri tiplerini küçült
+        - n_jobs: Parçaları okuyan iş parçacığı sayısı (-1: tüm çekirdekler)
+        - auto_cast: Yüklemeden sonra sütunları auto_cast ile tahmini tiplerine dönüştür
+        """
+        read_kwargs.update(usecols=usecols, dtype=dtype, nrows=nrows)
+        shards = self._resolve_shards(file_path)
+        if shards is None:
+            start = time.perf_counter()
+            result = self._read_csv_file(file_path, encoding, validate_encoding, **read_kwargs)
+            if result is None:
+                return False
+            df, used_encoding = result
+            self.manifest = self._manifest([(file_path, df, used_encoding, time.perf_counter() - start)])
+            self._set_loaded_frame(df, used_encoding, optimize, auto_cast)
+            return True
+
+        if not shards:
+            _emit(f"Eşleşen CSV dosyası bulunamadı: {file_path}")
+            return False
+
+        def read(path):
+            start = time.perf_counter()
+            result = self._read_csv_file(path, encoding, validate_encoding, **read_kwargs)
+            return result, time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=min(_resolve_jobs(n_jobs), len(shards))) as pool:
+            results = list(pool.map(_with_capture(read), shards))
+
+        failed = [path for path, (result, _) in zip(shards, results) if result is None]
+        if failed:
+            _emit(f"{len(failed)} parça okunamadı: {failed}")
+            return False
+
+        frames = [result[0] for result, _ in results]
+        self.manifest = self._manifest([(path, df, used_encoding, seconds)
+                                        for path, ((df, used_encoding), seconds) in zip(shards, results)])
+        self._set_loaded_frame(self._combine_shards(frames), results[0][0][1], optimize, auto_cast)
+        _emit(f"{len(shards)} parça yüklendi: {len(self.data)} satır, {self.data.shape[1]} sütun.")
+        return True
+
+    @staticmethod
+    def _manifest(entries):
+        """
+        (yol, DataFrame, kodlama, süre) kayıtlarından yükleme manifestosu oluşturur.
+        """
+        return pd.DataFrame([{
+            "path": os.fspath(path) if isinstance(path, (str, os.PathLike)) else repr(path),
+            "rows": len(df),
+            "columns": df.shape[1],
+            "encoding": used_encoding,
+            "bytes": os.path.getsize(path) if Preprocessor._is_local_path(path) and os.path.isfile(path) else None,
+            "seconds": seconds,
+        } for path, df, used_encoding, seconds in entries])
+    
+    @_instrumented()
+    def save_csv(self, file_name="processed_data.csv", path=None, index=False, background=False,
+                 compression=None, chunksize=None):
+        """
+        DataFrame'i CSV olarak kaydeder.
+        
+        file_name: Kaydedilecek dosya ismi (örn: 'my_data.csv')
+        path: Dosya yolu, eğer None ise sadece file_name kullanılır
+        index: CSV'ye index yazılsın mı?
+        background: True ise yazma arka plan iş parçacığında yapılır ve hemen bir AsyncCsvWriter
+                    döndürülür; sonraki adımlar yazmayla eşzamanlı çalışabilir (handle.wait() ile beklenir).
+                    Verinin o anki hali yazılır, sonraki değişiklikler dosyaya yansımaz.
+        compression: None, 'gzip', 'bz2' veya 'xz' (dosya adına uzantı eklenmez)
+        chunksize: Her seferde serileştirilen maksimum satır sayısı (None: 100000)
+        background, compression veya chunksize verilirse yazma geçici dosyaya yapılır ve bitince
+        atomik olarak hedefe taşınır.
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi, kaydedilemez.")
+            return
+        
+        if path:
+            full_path = f"{path}/{file_name}"
+        else:
+            full_path = file_name
+
+        if not background and compression is None and chunksize is None:
+            self.data.to_csv(full_path, index=index)
+            _emit(f"CSV kaydedildi: {full_path}")
+            return
+
+        if compression not in _COMPRESSORS:
+            _emit(f"Geçersiz compression: {compression}. {tuple(_COMPRESSORS)}")
+            return
+        writer = AsyncCsvWriter(self.data.copy(deep=not _COPY_ON_WRITE), full_path, index=index,
+                                compression=compression, chunksize=chunksize or 100_000)
+        if background:
+            _emit(f"CSV arka planda yazılıyor: {full_path}")
+            return writer.start()
+        if writer.run():
+            _emit(f"CSV kaydedildi: {full_path}")
+        else:
+            writer.wait()
+
+    @staticmethod
+    def _import_pyarrow():
+        """
+        pyarrow opsiyonel bir bağımlılıktır; yüklü değilse mesaj yazdırıp None döndürür.
+        """
+        try:
+            import pyarrow
+            import pyarrow.feather
+            import pyarrow.parquet
+        except ImportError:
+            _emit("Bu işlem için pyarrow gerekli: pip install pyarrow")
+            return None
+        return pyarrow
+
+    def _set_loaded_table(self, table, zero_copy):
+        """
+        Okunan Arrow tablosunu self.data'ya çevirir. zero_copy=True ise uygun sütunlar
+        (eksik değersiz sayısal sütunlar) kopyalanmadan Arrow belleğini paylaşır.
+        """
+        if zero_copy:
+            df = table.to_pandas(split_blocks=True)
+        else:
+            df = table.to_pandas()
+        self.data = df
+        self.header = list(df.columns)
+        self.encoding = None
+        self._bump_version()
+        return True
+
+    @_instrumented()
+    def save_parquet(self, file_name="processed_data.parquet", path=None, index=False, compression="snappy"):
+        """
+        DataFrame'i Parquet (sütunsal, sıkıştırılmış) olarak kaydeder. Veri tipleri
+        (category dahil) korunur; CSV'ye göre çok daha hızlı yazılıp okunur.
+
+        file_name: Kaydedilecek dosya ismi
+        path: Dosya yolu, eğer None ise sadece file_name kullanılır
+        index: Index kaydedilsin mi?
+        compression: 'snappy', 'gzip', 'zstd', None ...
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi, kaydedilemez.")
+            return
+        if self._import_pyarrow() is None:
+            return
+
+        full_path = f"{path}/{file_name}" if path else file_name
+        self.data.to_parquet(full_path, engine="pyarrow", index=index, compression=compression)
+        _emit(f"Parquet kaydedildi: {full_path}")
+
+    @_instrumented('columns')
+    def load_parquet(self, file_path, columns=None, memory_map=True, zero_copy=False):
+        """
+        Parquet dosyasını okur ve self.data ile self.header'a kaydeder.
+        Sadece columns ile verilen sütunlar diskten okunur.
+
+        file_path: Okunacak dosyanın yolu
+        columns: Okunacak sütunlar (None ise tümü)
+        memory_map: Dosyayı belleğe eşleyerek (mmap) oku
+        zero_copy: Mümkün olan sütunlarda Arrow belleğini kopyalamadan kullan
+                   (bu sütunlar salt okunurdur; yerinde değişiklikte hata verir)
+        """
+        pa = self._import_pyarrow()
+        if pa is None:
+            return False
+        try:
+            table = pa.parquet.read_table(file_path, columns=columns, memory_map=memory_map)
+        except FileNotFoundError:
+            return False
+        return self._set_loaded_table(table, zero_copy)
+
+    @_instrumented()
+    def save_feather(self, file_name="processed_data.feather", path=None, index=False, compression="uncompressed"):
+        """
+        DataFrame'i Feather (Arrow IPC) olarak kaydeder. Veri tipleri (category dahil) korunur.
+        Sıkıştırmasız dosyalar load_feather ile bellek eşlemeli ve kopyasız okunabilir;
+        bu yüzden aşamalar arası ara kayıtlar (checkpoint) için uygundur.
+
+        file_name: Kaydedilecek dosya ismi
+        path: Dosya yolu, eğer None ise sadece file_name kullanılır
+        index: Index kaydedilsin mi?
+        compression: 'uncompressed', 'lz4', 'zstd'
         """
-        İhtiyaç duyulan tüm parametreler burada tanımlanmalıdır.
+        if self.data is None:
+            _emit("Veri yüklenmedi, kaydedilemez.")
+            return
+        pa = self._import_pyarrow()
+        if pa is None:
+            return
+
+        full_path = f"{path}/{file_name}" if path else file_name
+        table = pa.Table.from_pandas(self.data, preserve_index=index)
+        pa.feather.write_feather(table, full_path, compression=compression)
+        _emit(f"Feather kaydedildi: {full_path}")
+
+    @_instrumented('columns')
+    def load_feather(self, file_path, columns=None, memory_map=True, zero_copy=False):
         """
-        self.data = None
-        self.header = None
+        Feather (Arrow IPC) dosyasını okur ve self.data ile self.header'a kaydeder.
+        Sadece columns ile verilen sütunlar okunur; memory_map=True ile dosya belleğe
+        eşlenir ve sıkıştırmasız dosyalarda veri diskten kopyalanmadan kullanılır.
 
-        if csv_file_path is not None:
-            self.load_csv(csv_file_path)
-    
-    def load_csv(self, file_path):
+        file_path: Okunacak dosyanın yolu
+        columns: Okunacak sütunlar (None ise tümü)
+        memory_map: Dosyayı belleğe eşleyerek (mmap) oku
+        zero_copy: Mümkün olan sütunlarda Arrow belleğini kopyalamadan kullan
+                   (bu sütunlar salt okunurdur; yerinde değişiklikte hata verir)
         """
-        CSV dosyasını okur ve self.data ile self.header'a kaydeder.
-        Kodlama hatası durumunda alternatif kodlamaları dener.
+        pa = self._import_pyarrow()
+        if pa is None:
+            return False
+        try:
+            table = pa.feather.read_table(file_path, columns=columns, memory_map=memory_map)
+        except FileNotFoundError:
+            return False
+        return self._set_loaded_table(table, zero_copy)
+
+    def iter_csv(self, file_path, chunksize=100_000, encoding=None, **read_kwargs):
         """
-        encodings = ['utf-8', 'latin-1', 'windows-1254']
-        for encoding in encodings:
-            try:
-                df = pd.read_csv(file_path, encoding=encoding)
-                self.data = df
-                self.header = list(df.columns)
-                return True
-            except FileNotFoundError:
-                # Dosya bulunamadıysa hemen False döndür, diğer kodlamaları deneme.
-                return False
-            except Exception:
-                # Başka bir hata (örn: kodlama hatası) olursa, sıradaki kodlamayı dene.
+        CSV dosyasını parça parça okur ve her seferinde en fazla chunksize satırlık
+        bir DataFrame döndürür (generator). self.data değiştirilmez.
+
+        file_path: Okunacak CSV dosyasının yolu
+        chunksize: Her parçadaki maksimum satır sayısı
+        encoding: Dosya kodlaması (None ise detect_encoding ile tüm dosya doğrulanarak tahmin edilir;
+                  akış ortasında kodlama değiştirilemeyeceği için)
+        """
+        if encoding is None:
+            encoding = self.detect_encoding(file_path, validate=True) or self.ENCODINGS[0]
+        with pd.read_csv(file_path, chunksize=chunksize, encoding=encoding, **read_kwargs) as reader:
+            for chunk in reader:
+                yield chunk
+
+    _STEP_TRANSFORMERS = {
+        "fill_missing": MissingFiller,
+        "standard_scale": StandardScaler,
+        "minmax_scale": MinMaxScaler,
+        "handle_outliers": OutlierHandler,
+        "encode_column": CategoryEncoder,
+    }
+
+    _NUMERIC_STEPS = ("standard_scale", "minmax_scale", "handle_outliers")
+
+    def _build_transformers(self, steps, dtypes):
+        """
+        (metot_adı, sütun_adı[, parametreler]) demetlerini doğrulayıp dönüştürücü listesine çevirir.
+        dtypes: Sütun adı -> dtype (örn. df.dtypes); ölçekleme ve aykırı değer adımlarının sütunu
+        sayısal olmalıdır (label kodlaması yapılan sütunlar sonraki adımlar için sayısal sayılır).
+        Hatalı bir adımda mesaj yazdırır ve None döndürür.
+        """
+        transformers = []
+        fill_methods = ("mean", "median", "mode", "constant")
+        columns = set(dtypes.index)
+        numeric = {c for c in columns if pd.api.types.is_numeric_dtype(dtypes[c])}
+        for step in steps:
+            method, column_name = step[0], step[1]
+            params = step[2] if len(step) > 2 else {}
+            if method not in self._STEP_TRANSFORMERS:
+                _emit(f"Geçersiz adım: {method}. ({', '.join(self._STEP_TRANSFORMERS)})")
+                return None
+            if column_name not in columns:
+                _emit(f"'{column_name}' isimli bir sütun bulunamadı.")
+                return None
+            if method in self._NUMERIC_STEPS and column_name not in numeric:
+                _emit(f"'{column_name}' sayısal bir sütun değil.")
+                return None
+            if method == "fill_missing":
+                if params.get("method", "mean") not in fill_methods:
+                    _emit(f"Geçersiz method: {params.get('method')}. {fill_methods}")
+                    return None
+                if params.get("method") == "constant" and params.get("value") is None:
+                    _emit("Lütfen constant metodunda doldurulacak bir değer belirtin.")
+                    return None
+            if method == "handle_outliers" and params.get("method", "drop") not in ("drop", "cap", "impute"):
+                _emit(f"Geçersiz method: {params.get('method')}. ('drop', 'cap', 'impute')")
+                return None
+            if method == "encode_column":
+                if params.get("mode", "label") not in ("label", "onehot"):
+                    _emit(f"Geçersiz mode: '{params.get('mode')}'. 'label' veya 'onehot' olmalı.")
+                    return None
+                if params.get("mode", "label") == "label":
+                    numeric.add(column_name)
+            transformers.append(self._STEP_TRANSFORMERS[method](column_name, **params))
+        return transformers
+
+    @_instrumented()
+    def fit_pipeline(self, steps):
+        """
+        Adımların istatistiklerini (mean/std, min/max, doldurma değerleri, kategori kodları,
+        aykırı değer sınırları) self.data üzerinden öğrenir; self.data değiştirilmez.
+        Dönen pipeline save() ile kaydedilip yeni verilere apply_pipeline() veya
+        pipeline.transform(df) ile istatistik hesaplamadan uygulanabilir.
+
+        steps: stream_process ile aynı biçimde adım listesi (median burada kesin hesaplanır).
+
+        Döndürür:
+        - Fit edilmiş TransformerPipeline (hata durumunda None)
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi.")
+            return None
+        transformers = self._build_transformers(steps, self.data.dtypes)
+        if transformers is None:
+            return None
+        return TransformerPipeline(transformers).fit(self.data)
+
+    @_instrumented()
+    def apply_pipeline(self, pipeline):
+        """
+        Fit edilmiş bir pipeline'ı self.data'ya uygular (istatistik yeniden hesaplanmaz).
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi.")
+            return
+        data = pipeline.transform(self.data)
+        if data is None:
+            return
+        self.data = data
+        self.header = list(self.data.columns)
+        self._bump_version()
+        _emit(f"Pipeline uygulandı ({len(pipeline.transformers)} adım).")
+
+    def lazy(self):
+        """
+        Adımları hemen uygulamak yerine kaydeden bir LazyPipeline döndürür.
+        Adımlar execute() çağrılınca birleştirilmiş (füzyon) bir planla tek seferde uygulanır;
+        explain() planı gösterir.
+
+        örn: pre.lazy().fill_missing("yas").standard_scale("yas").handle_outliers("yas", method="cap").execute()
+        """
+        return LazyPipeline(self)
+
+    @_instrumented()
+    def stream_process(self, file_path, steps, file_name="processed_data.csv", path=None,
+                       chunksize=100_000, index=False, encoding=None):
+        """
+        Dosyayı belleğe tamamen yüklemeden, parça parça işleyip CSV olarak kaydeder.
+        Önce istatistikler parçalar üzerinden toplanır (fit geçişi), ardından her parça
+        dönüştürülerek çıktı dosyasına eklenir (transform geçişi). Bellek kullanımı
+        parça boyutuyla orantılıdır.
+
+        Aynı sütun üzerinde birbirine bağlı adımlar varsa (örn: önce fill_missing sonra
+        standard_scale), sonraki adımın istatistikleri önceki adım uygulanmış veri üzerinden
+        ek bir fit geçişinde hesaplanır.
+
+        Parametreler:
+        - file_path: Okunacak CSV dosyasının yolu
+        - steps: (metot_adı, sütun_adı[, parametreler]) demetlerinden oluşan liste
+                 veya fit edilmiş bir TransformerPipeline (bu durumda fit geçişi yapılmaz).
+                 Desteklenen metotlar: 'fill_missing' ('mean', 'median', 'mode', 'constant'),
+                 'standard_scale', 'minmax_scale', 'handle_outliers', 'encode_column'.
+                 median (ve fill_value verilmeyen impute) QuantileSketch ile yaklaşık hesaplanır;
+                 hata sınırı adım parametrelerindeki eps ile ayarlanır (varsayılan 0.01).
+                 örn: [("fill_missing", "yas", {"method": "mean"}), ("standard_scale", "yas")]
+        - file_name, path, index: save_csv ile aynı
+        - chunksize: Her parçadaki maksimum satır sayısı
+        - encoding: Dosya kodlaması (None ise detect_encoding ile tüm dosya doğrulanarak tahmin edilir)
+
+        Döndürür:
+        - Yazılan toplam satır sayısı (hata durumunda None)
+        """
+        try:
+            if encoding is None:
+                encoding = self.detect_encoding(file_path, validate=True) or self.ENCODINGS[0]
+            # Adımların sütun tiplerini doğrulamak için dosyanın başından küçük bir örnek okunur.
+            head = pd.read_csv(file_path, nrows=1000, encoding=encoding)
+        except FileNotFoundError:
+            _emit(f"Dosya bulunamadı: {file_path}")
+            return None
+
+        if isinstance(steps, TransformerPipeline):
+            stream_steps = steps.transformers
+        else:
+            stream_steps = self._build_transformers(steps, head.dtypes)
+            if stream_steps is None:
+                return None
+
+        # Sadece kodlanan sütunlar metin olarak okunur: iter_csv tipleri her parça için ayrı çıkarır;
+        # bir parçada int64, diğerinde object okunan sütunda 1 ile "1" ayrı kategori olmamalı.
+        read_kwargs = {"chunksize": chunksize, "encoding": encoding,
+                       "dtype": dict.fromkeys(self._text_columns(stream_steps), str)}
+        for s in stream_steps:
+            if isinstance(s, CategoryEncoder) and s.column_name in read_kwargs["dtype"]:
+                s.text_input = True
+
+        # Fit geçişleri: bir adım ancak aynı sütundaki önceki adımlar (ve önceki satır silen
+        # adımlar) hazırsa fit edilir.
+        while not all(s.fitted for s in stream_steps):
+            fitting = []
+            for chunk in self.iter_csv(file_path, **read_kwargs):
+                blocked, blocked_all = set(), False
+                for s in stream_steps:
+                    if blocked_all or s.column_name in blocked:
+                        continue
+                    if s.fitted:
+                        chunk = s.transform(chunk)
+                    else:
+                        s.partial_fit(chunk)
+                        blocked.add(s.column_name)
+                        blocked_all = s.drops_rows
+                        if s not in fitting:
+                            fitting.append(s)
+            if not fitting:
+                # Dosya boş: kalan adımlar için fit edilecek veri yok
+                fitting = [s for s in stream_steps if not s.fitted]
+            for s in fitting:
+                s.finalize()
+
+        full_path = f"{path}/{file_name}" if path else file_name
+        total_rows = 0
+        with open(full_path, "w", newline="", encoding="utf-8") as f:
+            for i, chunk in enumerate(self.iter_csv(file_path, **read_kwargs)):
+                for s in stream_steps:
+                    chunk = s.transform(chunk)
+                chunk.to_csv(f, header=(i == 0), index=index)
+                total_rows += len(chunk)
+
+        _emit(f"CSV kaydedildi: {full_path} ({total_rows} satır, parça boyutu={chunksize})")
+        return total_rows
+
+    @staticmethod
+    def _text_columns(transformers):
+        """
+        Metin olarak okunabilecek sütunlar: kodlanan ve sayısal bir adımda (ölçekleme, aykırı değer,
+        mean/median doldurma) kullanılmayan sütunlar.
+        """
+        encoded = {t.column_name for t in transformers if isinstance(t, CategoryEncoder)}
+        numeric = {t.column_name for t in transformers
+                   if isinstance(t, (StandardScaler, MinMaxScaler, OutlierHandler))
+                   or isinstance(t, MissingFiller) and t.method in ("mean", "median")}
+        return sorted(encoded - numeric)
+
+        
+    _BOOL_MAP = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False}
+    DATETIME_FORMATS = ['%Y-%m-%d', '%Y/%m/%d', '%d-%m-%Y', '%d/%m/%Y', '%m/%d/%Y',
+                        '%Y-%m-%d %H:%M:%S', '%d-%m-%Y %H:%M:%S', '%m/%d/%Y %H:%M:%S']
+
+    @staticmethod
+    def _cast_series(col, col_type):
+        """
+        Sütunu tahmini tipine (guess_column_type sonucu) vektörel dönüşümlerle çevirir.
+        Zaten uygun dtype'taki sütunlar olduğu gibi döndürülür; dönüştürülemeyen değerler eksik olur.
+        - numeric: pd.to_numeric
+        - boolean: true/false/1/0/yes/no eşlemesi; eksik değer yoksa bool, varsa 'boolean'
+        - datetime: Örneklemi hatasız çözen ilk DATETIME_FORMATS biçimiyle pd.to_datetime
+        - categorical: 'category'
+        - string: değişmez
+        """
+        if col_type == "numeric":
+            if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+                return col
+            return pd.to_numeric(col, errors="coerce")
+
+        if col_type == "boolean":
+            if pd.api.types.is_bool_dtype(col):
+                return col
+            if pd.api.types.is_numeric_dtype(col):
+                mapped = col.map({0: False, 1: True})
+            else:
+                mapped = col.astype(str).str.strip().str.lower().map(Preprocessor._BOOL_MAP)
+            mapped = mapped.where(col.notna())
+            return mapped.astype(bool) if not mapped.isna().any() else mapped.astype("boolean")
+
+        if col_type == "datetime":
+            if pd.api.types.is_datetime64_any_dtype(col):
+                return col
+            sample = col.dropna().head(100)
+            for fmt in Preprocessor.DATETIME_FORMATS:
+                try:
+                    pd.to_datetime(sample, format=fmt, errors="raise")
+                except (ValueError, TypeError):
+                    continue
+                return pd.to_datetime(col, format=fmt, errors="coerce")
+            return pd.to_datetime(col, errors="coerce")
+
+        if col_type == "categorical" and not isinstance(col.dtype, pd.CategoricalDtype):
+            return col.astype("category")
+        return col
+
+    @staticmethod
+    def _downcast_numeric(col):
+        """
+        Sayısal bir sütunu değer kaybı olmadan en küçük uygun tipe indirger. Hedef tip
+        daha dar değilse (örn. int64 -> uint64) sütun olduğu gibi bırakılır.
+        """
+        def narrower(dtype):
+            return getattr(dtype, "numpy_dtype", dtype).itemsize < getattr(col.dtype, "numpy_dtype", col.dtype).itemsize
+
+        if pd.api.types.is_bool_dtype(col):
+            return col
+        if pd.api.types.is_integer_dtype(col):
+            downcast = pd.to_numeric(col, downcast="unsigned" if col.min() >= 0 else "integer")
+            integer = pd.api.types.is_integer_dtype(downcast) and not pd.api.types.is_bool_dtype(downcast)
+            return downcast if integer and narrower(downcast.dtype) else col
+        if pd.api.types.is_float_dtype(col):
+            values = col.to_numpy(dtype=np.float64, na_value=np.nan)
+            if len(values) and not np.isnan(values).any() and np.array_equal(values, np.round(values)):
+                as_int = pd.to_numeric(col, downcast="unsigned" if values.min() >= 0 else "integer")
+                if pd.api.types.is_integer_dtype(as_int) and narrower(as_int.dtype):
+                    return as_int
+            as_float32 = values.astype(np.float32)
+            if np.array_equal(as_float32.astype(np.float64), values, equal_nan=True):
+                return pd.Series(as_float32, index=col.index, name=col.name)
+        return col
+
+    @_instrumented('columns')
+    def optimize_memory(self, columns=None, cat_threshold=0.4, error_tolerance=0.09, verbose=True):
+        """
+        Sütunların bellek kullanımını azaltır:
+        - Tam sayı ve ondalıklı sütunlar değer kaybı olmadan en küçük genişliğe indirilir
+          (tam sayı değerli float sütunlar int'e, kayıpsız olanlar float32'ye)
+        - Tahmini tipi 'boolean' olan sütunlar gerçek bool'a (eksik değer varsa 'boolean') çevrilir
+        - Tahmini tipi 'categorical' olan metin sütunları 'category' tipine çevrilir
+        Dönüşüm sonrası eksik değer sayısı artacak sütunlar (kayıplı dönüşüm) uyarıyla atlanır.
+
+        Parametreler:
+        - columns: Sütun listesi, None ise tüm sütunlar
+        - cat_threshold, error_tolerance: Tip tahmini parametreleri (guess_column_type ile aynı)
+        - verbose: Sütun bazlı raporu yazdır
+
+        Döndürür:
+        - Sütun bazlı önce/sonra dtype ve bellek (byte) raporu (DataFrame)
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi.")
+            return None
+
+        columns = list(self.data.columns) if columns is None else columns
+        before = self.data[columns].memory_usage(deep=True, index=False)
+        dtypes_before = self.data[columns].dtypes.astype(str)
+        changed = []
+
+        for col_name in columns:
+            col = self.data[col_name]
+            if isinstance(col.dtype, pd.CategoricalDtype) or pd.api.types.is_datetime64_any_dtype(col):
+                continue
+            col_type = self.infer_column_type(col_name, cat_threshold=cat_threshold, error_tolerance=error_tolerance)[0]
+
+            if col_type == "boolean" and not pd.api.types.is_bool_dtype(col):
+                new_col = self._cast_series(col, "boolean")
+            elif pd.api.types.is_numeric_dtype(col):
+                new_col = self._downcast_numeric(col)
+            elif col_type == "categorical":
+                new_col = col.astype("category")
+            else:
                 continue
+
+            new_missing = int(new_col.isna().sum()) - int(col.isna().sum())
+            if new_missing > 0:
+                # Dönüşüm kayıpsız olmalı: yeni eksik değer üreten sütunlar olduğu gibi bırakılır.
+                _emit(f"Uyarı: '{col_name}' sütunu dönüştürülmedi ({col_type}); "
+                      f"{new_missing} değer eksik değere dönüşecekti.")
+                continue
+            if new_col.dtype != col.dtype:
+                self.data[col_name] = new_col
+                changed.append(col_name)
+
+        if changed:
+            self._bump_version(changed)
+
+        after = self.data[columns].memory_usage(deep=True, index=False)
+        report = pd.DataFrame({
+            "dtype_before": dtypes_before,
+            "dtype_after": self.data[columns].dtypes.astype(str),
+            "bytes_before": before,
+            "bytes_after": after,
+        })
+        report["saving_ratio"] = (1 - report["bytes_after"] / report["bytes_before"].where(report["bytes_before"] > 0)) * 100
+
+        if verbose:
+            _emit(report)
+            total_before, total_after = before.sum(), after.sum()
+            _emit(f"Bellek kullanımı: {total_before / 1024 ** 2:.2f} MB -> {total_after / 1024 ** 2:.2f} MB "
+                  f"({len(changed)} sütun dönüştürüldü)")
+        return report
+
+    @_instrumented('columns')
+    def auto_cast(self, columns=None, cat_threshold=0.4, error_tolerance=0.09, sample_size=10_000,
+                  min_confidence=0.99, verbose=True):
+        """
+        Sütunları tahmini tiplerine (infer_column_type) bir kez, vektörel olarak dönüştürür:
+        metin olarak saklanan sayılar sayısala, tarihler datetime64'e, true/false/1/0/yes/no
+        değerleri bool'a ('boolean'), kategorik metinler 'category'ye çevrilir. Sonraki adımlar
+        (profile, ölçekleme, kodlama, aykırı değer işlemleri) metni tekrar çözümlemek yerine
+        doğal dtype'lar üzerinde çalışır.
+
+        Parametreler:
+        - columns: Sütun listesi, None ise tüm sütunlar
+        - cat_threshold, error_tolerance, sample_size, min_confidence: Tip tahmini parametreleri
+          (infer_column_type ile aynı)
+        - verbose: Sütun bazlı raporu yazdır
+
+        Dönüştürülemeyip eksik değere çevrilen hücre varsa verbose'dan bağımsız olarak uyarı yazdırılır.
+
+        Döndürür:
+        - Sütun bazlı rapor (DataFrame): dtype_before, inferred_type, dtype_after ve
+          coerced (dönüştürülemeyip eksik değere çevrilen dolu hücre sayısı)
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi.")
+            return None
+
+        columns = list(self.data.columns) if columns is None else ([columns] if isinstance(columns, str) else list(columns))
+        for col_name in columns:
+            if col_name not in self.data.columns:
+                _emit(f"'{col_name}' isimli bir sütun bulunamadı.")
+                return None
+
+        params = dict(cat_threshold=cat_threshold, error_tolerance=error_tolerance,
+                      sample_size=sample_size, min_confidence=min_confidence)
+        rows = []
+        changed = {}
+        for col_name in columns:
+            col = self.data[col_name]
+            inferred = self.infer_column_type(col_name, **params)
+            new_col = self._cast_series(col, inferred[0])
+            coerced = int(new_col.isna().sum() - col.isna().sum()) if new_col is not col else 0
+            rows.append({"dtype_before": str(col.dtype), "inferred_type": inferred[0],
+                         "dtype_after": str(new_col.dtype), "coerced": coerced})
+            if coerced > 0:
+                _emit(f"Uyarı: '{col_name}' sütununda {coerced} değer {inferred[0]} tipine dönüştürülemedi "
+                      f"ve eksik değer oldu.")
+            if new_col is not col:
+                self.data[col_name] = new_col
+                changed[col_name] = (inferred, coerced)
+
+        if changed:
+            self._bump_version(list(changed))
+            # Kayıpsız dönüşüm tahmini tipi değiştirmez; yeni sürüm için tekrar tahmin yapılmaz.
+            for col_name, (inferred, coerced) in changed.items():
+                if not coerced:
+                    self._cache_put(self._type_key(col_name, **params), inferred)
+
+        report = pd.DataFrame(rows, index=pd.Index(columns, dtype=object))
+        if verbose:
+            _emit(report)
+        _emit(f"{len(changed)} sütun tahmini tipine dönüştürüldü.")
+        return report
+
+    def preview(self, n=-1):
+        """
+        CSV dosyasının ilk n satırı gösterilir.
+        """
+        if n == 0:
+            _emit(self.data)
+            return 
+        _emit(self.data.head(n))
         
-        # Tüm kodlamalar başarısız olursa False döndür.
+    _BOOL_TOKENS = {"true", "false", "0", "1", "yes", "no"}
+
+    @staticmethod
+    def _is_boolean_values(cleaned_uniques):
+        """
+        Kırpılmış/küçük harfe çevrilmiş benzersiz değerler en fazla iki boolean belirtecinden mi oluşuyor?
+        """
+        unique_vals = set(cleaned_uniques)
+        return unique_vals.issubset(Preprocessor._BOOL_TOKENS) and len(unique_vals) <= 2
+
+    @staticmethod
+    def _is_datetime_column(series):
+        """
+        Sütunun tamamı DATETIME_FORMATS biçimlerinden biriyle hatasız ve eksiksiz çözülebiliyor mu?
+        """
+        for fmt in Preprocessor.DATETIME_FORMATS:
+            try:
+                converted_series = pd.to_datetime(series, format=fmt, errors='raise')
+                if not converted_series.isnull().any():
+                    return True
+            except (ValueError, TypeError):
+                continue
         return False
-    
-    def save_csv(self, file_name="processed_data.csv", path=None, index=False):
+
+    @staticmethod
+    def _is_numeric_column(series):
         """
-        DataFrame'i CSV olarak kaydeder.
+        Sütun sayısal dtype'ta mı veya tamamı eksiksiz olarak float'a çevrilebiliyor mu?
+        """
+        if pd.api.types.is_numeric_dtype(series):
+            return True
+        try:
+            return bool(series.astype(float).notna().all())
+        except (ValueError, TypeError):
+            return False
+
+    @staticmethod
+    def _confirm_type(series, col_type):
+        """
+        Örneklemin seçtiği numeric/datetime/boolean tipini tüm sütun üzerinde vektörel olarak
+        doğrular (guess_column_type ile aynı kurallar). Boolean kontrolünde sadece benzersiz
+        değerler normalleştirilir.
+        """
+        if col_type == "boolean":
+            uniques = pd.Series(pd.unique(series.dropna())).astype(str).str.strip().str.lower()
+            return Preprocessor._is_boolean_values(uniques)
+        if col_type == "datetime":
+            return Preprocessor._is_datetime_column(series)
+        return Preprocessor._is_numeric_column(series)
+
+    @staticmethod
+    def _resolve_sampled_type(series, col_type, confidence, cat_threshold, error_tolerance, min_confidence):
+        """
+        Örneklem kararını sonuçlandırır: numeric/datetime/boolean tipler tüm sütunda doğrulanır
+        (doğrulanamazsa tam guess_column_type'a düşülür); diğer tiplerde güven min_confidence'ın
+        altındaysa karar tüm sütun üzerinde verilir.
+        """
+        if col_type in ("numeric", "datetime", "boolean"):
+            if Preprocessor._confirm_type(series, col_type):
+                return col_type, 1.0
+            return Preprocessor.guess_column_type(series, cat_threshold, error_tolerance), 1.0
+        if confidence < min_confidence:
+            return Preprocessor.guess_column_type(series, cat_threshold, error_tolerance), 1.0
+        return col_type, confidence
+
+    @staticmethod
+    def guess_column_type(series: pd.Series, cat_threshold: float = 0.4, error_tolerance: float = 0.09):
+        """
+        Sütunun tipini tahmin eder: numeric, datetime, boolean, categorical, string.
+        Bu versiyon, her bir benzersiz değerin frekansını hata toleransı ile karşılaştırır.
         
-        file_name: Kaydedilecek dosya ismi (örn: 'my_data.csv')
-        path: Dosya yolu, eğer None ise sadece file_name kullanılır
-        index: CSV'ye index yazılsın mı?
+        Parametreler:
+        series: Tahmin edilecek Pandas Serisi.
+        cat_threshold: Kategorik olarak kabul edilecek maksimum benzersiz değer oranı.
+        error_tolerance: Bir değerin anomali olarak kabul edilmesi için minimum frekans eşiği.
+                        Bu eşiğin altındaki değerler veri hatası olarak kabul edilir.
+        """
+        series_cleaned = series.dropna().astype(str).str.strip().str.lower()
+        if series_cleaned.empty:
+            return "string"
+
+        # 1. Boolean Kontrolü
+        if Preprocessor._is_boolean_values(series_cleaned.unique()):
+            return "boolean"
+
+        # 2. Datetime Kontrolü
+        if Preprocessor._is_datetime_column(series):
+            return "datetime"
+
+        # 3. Numeric Kontrolü
+        if Preprocessor._is_numeric_column(series):
+            return "numeric"
+                
+        # 4. Kategorik ve String Ayrımı (Yeni ve sadeleştirilmiş mantık)
+        nunique_ratio = series.nunique(dropna=True) / len(series)
+        if nunique_ratio <= cat_threshold:
+            value_counts = series.value_counts(normalize=True, dropna=True)
+            # Eğer herhangi bir değerin frekansı hata toleransından düşükse, string kabul et.
+            if (value_counts < error_tolerance).any():
+                return "string"
+            else:
+                return "categorical"
+
+        # Tüm koşullar sağlanamazsa string olarak kabul et
+        return "string"
+
+    @staticmethod
+    def _stratified_sample(series, sample_size, n_strata=10, seed=0):
+        """
+        Sütunu n_strata eşit parçaya bölüp her parçadan eşit sayıda rastgele satır seçer.
+        Sıralı verilerde başı, ortası ve sonu örneğe eşit şekilde temsil edilir.
+        """
+        n = len(series)
+        if n <= sample_size:
+            return series
+        rng = np.random.default_rng(seed)
+        bounds = np.linspace(0, n, n_strata + 1).astype(np.int64)
+        per_stratum = sample_size // n_strata
+        idx = np.concatenate([
+            lo + rng.choice(hi - lo, size=min(per_stratum, hi - lo), replace=False)
+            for lo, hi in zip(bounds[:-1], bounds[1:])
+        ])
+        idx.sort()
+        return series.iloc[idx]
+
+    @staticmethod
+    def infer_type_sampled(series: pd.Series, cat_threshold: float = 0.4, error_tolerance: float = 0.09,
+                           sample_size: int = 10_000, min_confidence: float = 0.99, seed: int = 0):
+        """
+        guess_column_type'ın örneklem tabanlı sürümü. Aday tip tabakalı bir örneklem üzerinde
+        seçilir. numeric/datetime/boolean adaylar her zaman tüm sütun üzerinde ucuz, vektörel bir
+        kontrolle doğrulanır (güven 1); diğer tipler için bir güven skoru hesaplanır ve güven
+        min_confidence'ın altındaysa (örneklem belirsizse) karar tüm sütun üzerinde verilir.
+
+        Güven skoru:
+        - categorical: En nadir değerin frekansının error_tolerance'tan kaç standart hata
+          uzakta olduğuna göre hesaplanır.
+        - string: Nadir bir değer veya (Chao1 alt sınır tahminiyle) yüksek benzersizlik oranı
+          ne kadar kesinse güven o kadar yüksektir.
+
+        Döndürür:
+        - (tip, güven) demeti
+        """
+        n = len(series)
+        if n <= sample_size:
+            return Preprocessor.guess_column_type(series, cat_threshold, error_tolerance), 1.0
+
+        sample = Preprocessor._stratified_sample(series, sample_size, seed=seed)
+        col_type, confidence = Preprocessor._type_from_sample(sample, n, Preprocessor._native_kind(series),
+                                                              cat_threshold, error_tolerance)
+        return Preprocessor._resolve_sampled_type(series, col_type, confidence, cat_threshold,
+                                                  error_tolerance, min_confidence)
+
+    @staticmethod
+    def _native_kind(series):
+        """
+        Sütunun dtype'ı zaten numeric/datetime/boolean ise bu tipi, değilse None döndürür.
+        """
+        if pd.api.types.is_bool_dtype(series):
+            return "boolean"
+        if pd.api.types.is_numeric_dtype(series):
+            return "numeric"
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return "datetime"
+        return None
+
+    @staticmethod
+    def _type_from_sample(sample, n, native_kind, cat_threshold, error_tolerance):
+        """
+        Örneklem üzerinde tip kararı ve güven skoru (infer_type_sampled'ın örneklem adımı).
+        Sadece örneklemi ve birkaç skaler kullandığı için ayrı süreçlerde de çalıştırılabilir.
+
+        n: Sütunun tamamının uzunluğu
+        native_kind: _native_kind(series) sonucu
+        """
+        col_type = Preprocessor.guess_column_type(sample, cat_threshold, error_tolerance)
+        non_null = sample.dropna()
+        m = max(len(non_null), 1)
+
+        if col_type in ("numeric", "datetime", "boolean"):
+            confidence = 1.0 if native_kind == col_type else 1.0 - 3.0 / m
+        else:
+            counts = non_null.value_counts()
+            freqs = counts.to_numpy(dtype=float) / m
+            se = np.sqrt(np.maximum(freqs * (1 - freqs), 1e-12) / m)
+            z = (freqs - error_tolerance) / se
+            if col_type == "categorical":
+                confidence = 0.5 * (1 + math.erf(z.min() / math.sqrt(2))) * (1.0 - 3.0 / m)
+            elif non_null.nunique() / len(sample) <= cat_threshold:
+                # Oran eşiği geçildi, bir değerin frekansı toleransın altında kaldığı için string
+                confidence = 0.5 * (1 + math.erf(-z.min() / math.sqrt(2)))
+            else:
+                # Chao1: popülasyondaki benzersiz değer sayısı için alt sınır tahmini
+                f1 = int((counts == 1).sum())
+                f2 = int((counts == 2).sum())
+                d = len(counts) + (f1 * f1 / (2 * f2) if f2 > 0 else f1 * (f1 - 1) / 2)
+                ratio_confidence = 1.0 - 3.0 / m if d / n > cat_threshold else 0.5
+                # Oran eşiğin altında kalsa bile frekansı toleransın belirgin şekilde altındaki bir değer
+                # sütunu string yapar (yüksek kardinaliteli serbest metinde frekanslar ~1/m'dir).
+                rare_confidence = 0.5 * (1 + math.erf(-z.min() / math.sqrt(2)))
+                confidence = max(ratio_confidence, rare_confidence)
+        return col_type, float(confidence)
+
+    @staticmethod
+    def _type_key(column_name, cat_threshold, error_tolerance, sample_size, min_confidence):
+        """
+        Tip tahmini sonuçlarının önbellek anahtarı (key[0] sütun adıdır).
+        """
+        return column_name, "type", cat_threshold, error_tolerance, sample_size, min_confidence
+
+    def infer_column_type(self, column_name, cat_threshold=0.4, error_tolerance=0.09,
+                          sample_size=10_000, min_confidence=0.99):
+        """
+        Sütun tipini infer_type_sampled ile tahmin eder ve sonucu önbelleğe alır.
+        Sütun değiştirilmediği sürece (sürümü aynı kaldığı sürece) tekrar hesaplama yapılmaz.
+
+        Döndürür:
+        - (tip, güven) demeti, sütun bulunamazsa None
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi.")
+            return None
+
+        if column_name not in self.data.columns:
+            _emit(f"'{column_name}' isimli bir sütun bulunamadı.")
+            return None
+
+        key = self._type_key(column_name, cat_threshold, error_tolerance, sample_size, min_confidence)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        result = self.infer_type_sampled(self.data[column_name], cat_threshold, error_tolerance,
+                                         sample_size=sample_size, min_confidence=min_confidence)
+        self._cache_put(key, result)
+        return result
+
+    @_instrumented('columns')
+    def infer_types(self, columns=None, n_jobs=1, executor="thread", cat_threshold=0.4, error_tolerance=0.09,
+                    sample_size=10_000, min_confidence=0.99):
+        """
+        Birden fazla sütunun tipini (önbellekli) tahmin eder.
+
+        columns: Sütun listesi, None ise tüm sütunlar
+        n_jobs: Paralel işçi sayısı (1: seri, -1: tüm çekirdekler)
+        executor: 'thread' (sütunlar bellek paylaşılarak işlenir) veya 'process'
+                  (işçilere sütunun tamamı değil sadece örneklemi gönderilir; belirsiz
+                  kalan sütunlar ana süreçte tüm sütun üzerinde doğrulanır)
+        Diğer parametreler: infer_column_type ile aynı
+
+        Döndürür:
+        - {sütun: (tip, güven)} sözlüğü (columns sırasıyla)
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi.")
+            return None
+        columns = list(self.data.columns) if columns is None else columns
+        params = dict(cat_threshold=cat_threshold, error_tolerance=error_tolerance,
+                      sample_size=sample_size, min_confidence=min_confidence)
+        n_jobs = _resolve_jobs(n_jobs)
+        if n_jobs == 1 or len(columns) < 2:
+            return {col: self.infer_column_type(col, **params) for col in columns}
+
+        if executor == "thread":
+            with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+                results = list(pool.map(_with_capture(lambda col: self.infer_column_type(col, **params)), columns))
+            return dict(zip(columns, results))
+
+        # Süreç havuzu: önbellekte olmayan uzun sütunların sadece örneklemi gönderilir.
+        results = {}
+        pending = []
+        for col in columns:
+            key = self._type_key(col, cat_threshold, error_tolerance, sample_size, min_confidence)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[col] = cached
+            elif len(self.data) <= sample_size:
+                results[col] = self.infer_column_type(col, **params)
+            else:
+                pending.append((col, key))
+
+        series = [self.data[col] for col, _ in pending]
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            decisions = list(pool.map(
+                self._type_from_sample,
+                [self._stratified_sample(s, sample_size) for s in series],
+                [len(s) for s in series],
+                [self._native_kind(s) for s in series],
+                [cat_threshold] * len(series),
+                [error_tolerance] * len(series),
+            ))
+        for (col, key), s, (col_type, confidence) in zip(pending, series, decisions):
+            results[col] = self._resolve_sampled_type(s, col_type, confidence, cat_threshold,
+                                                      error_tolerance, min_confidence)
+            self._cache_put(key, results[col])
+        return {col: results[col] for col in columns}
+
+
+    @staticmethod
+    def _numeric_block_stats(block, z_threshold=3):
+        """
+        (satır, sütun) şeklindeki float bir NumPy bloğu için tüm sütun istatistiklerini
+        hesaplar. NaN değerler eksik kabul edilir. Her sütunun dolu değerleri tek bir satır uzunluğundaki çalışma tamponuna alınır ve tampon
+        yerinde sıralanır; benzersiz değer sayısı, min, max ve medyan buradan, std ve aykırı değer
+        sayısı da aynı tampon üzerinde yerinde işlemlerle çıkarılır. Ek bellek bloğun kendisine
+        değil, tek bir sütuna orantılıdır.
+        """
+        n_rows, n_cols = block.shape
+        missing = np.isnan(block).sum(axis=0)
+        count = n_rows - missing
+        stats = {"count": count, "missing": missing}
+        for key in ("min", "max", "median", "mean", "std"):
+            stats[key] = np.full(n_cols, np.nan)
+        stats["unique"] = np.zeros(n_cols, dtype=np.int64)
+        stats["outliers"] = np.zeros(n_cols, dtype=np.int64)
+
+        scratch = np.empty(n_rows, dtype=np.float64)
+        for j in range(n_cols):
+            k = int(count[j])
+            if k == 0:
+                continue
+            values = scratch[:k]
+            column = block[:, j]
+            if k == n_rows:
+                np.copyto(values, column)
+            else:
+                np.compress(~np.isnan(column), column, out=values)
+            mean = values.sum() / k
+
+            values.sort()
+            stats["unique"][j] = np.count_nonzero(values[1:] != values[:-1]) + 1
+            stats["min"][j], stats["max"][j] = values[0], values[-1]
+            stats["median"][j] = (values[(k - 1) // 2] + values[k // 2]) / 2
+            stats["mean"][j] = mean
+            if k < 2:
+                continue
+
+            np.subtract(values, mean, out=values)
+            std = np.sqrt(np.dot(values, values) / (k - 1))
+            stats["std"][j] = std
+            if std > 0:
+                np.abs(values, out=values)
+                np.divide(values, std, out=values)
+                stats["outliers"][j] = np.count_nonzero(values > z_threshold)
+        return stats
+
+    PROFILE_COLUMNS = ["dtype", "count", "missing", "missing_ratio", "unique", "unique_ratio",
+                       "mean", "std", "min", "median", "max", "outliers"]
+
+    def _block_stats(self, df, columns, z_threshold, n_jobs=1, executor="thread"):
         """
-        if self.data is None:
-            print("Veri yüklenmedi, kaydedilemez.")
-            return
-        
-        if path:
-            full_path = f"{path}/{file_name}"
+        Sayısal sütunların istatistiklerini hesaplar. n_jobs > 1 ise sütunlar ardışık gruplara
+        bölünüp işçilere dağıtılır; sonuçlar sütun sırasıyla birleştirildiği için çıktı seri
+        çalıştırmayla birebir aynıdır.
+        - 'thread': İşçiler aynı NumPy bloğunu paylaşır (NumPy indirgemeleri GIL'i bırakır).
+        - 'process': Blok doğrudan paylaşılan belleğe (shared_memory) yazılır, işçiler bloğa
+          isimle bağlanır; sütunlar pickle ile kopyalanmaz.
+        """
+        n_jobs = min(_resolve_jobs(n_jobs), len(columns))
+        if n_jobs <= 1:
+            block = np.asfortranarray(df[columns].to_numpy(dtype=np.float64, na_value=np.nan))
+            return self._numeric_block_stats(block, z_threshold)
+
+        bounds = np.linspace(0, len(columns), n_jobs + 1).astype(int)
+        ranges = list(zip(bounds[:-1], bounds[1:]))
+        shape = (len(df), len(columns))
+
+        if executor == "process":
+            shm = shared_memory.SharedMemory(create=True, size=max(shape[0] * shape[1] * 8, 1))
+            try:
+                # Sütun sıralı (Fortran) düzen: her işçinin sütun aralığı bellekte bitişiktir.
+                block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order="F")
+                for j, c in enumerate(columns):
+                    block[:, j] = df[c].to_numpy(dtype=np.float64, na_value=np.nan)
+                del block
+                with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                    parts = list(pool.map(_shared_block_stats, *zip(*[
+                        (shm.name, shape, np.float64, start, stop, z_threshold) for start, stop in ranges])))
+            finally:
+                shm.close()
+                shm.unlink()
         else:
-            full_path = file_name
-        
-        self.data.to_csv(full_path, index=index)
-        print(f"CSV kaydedildi: {full_path}")
-   
-        
-    def preview(self, n=-1):
+            block = np.asfortranarray(df[columns].to_numpy(dtype=np.float64, na_value=np.nan))
+            with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+                parts = list(pool.map(_with_capture(lambda r: self._numeric_block_stats(block[:, r[0]:r[1]], z_threshold)), ranges))
+
+        return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+    @_instrumented('columns')
+    def profile(self, columns=None, z_threshold=3, n_jobs=1, executor="thread"):
         """
-        CSV dosyasının ilk n satırı gösterilir.
+        Tüm sütunların istatistiklerini yazdırmadan hesaplar ve bir DataFrame olarak döndürür.
+        Sayısal sütunlar tek bir float blokta, diğer sütunlar tek bir object blokta toplu
+        olarak işlenir (sütun başına ayrı geçiş yapılmaz). check_csv ve check_column bu
+        raporu ekrana yazar.
+
+        Parametreler:
+        - columns: Sütun listesi, None ise tüm sütunlar
+        - z_threshold: Sayısal sütunlarda aykırı değer tespiti için Z-skor eşiği
+        - n_jobs: Paralel işçi sayısı (1: seri, -1: tüm çekirdekler)
+        - executor: 'thread' veya 'process' (ayrıntılar için _block_stats)
+
+        Döndürür:
+        - Satırları sütun isimleri olan rapor DataFrame'i (kolonlar: Preprocessor.PROFILE_COLUMNS).
+          Oranlar yüzde cinsindendir; sayısal olmayan sütunlarda sayısal istatistikler NaN'dır.
         """
-        if n == 0:
-            print(self.data)
-            return 
-        print(self.data.head(n))
-        
+        if self.data is None:
+            _emit("Veri yüklenmedi.")
+            return None
+
+        columns = list(self.data.columns) if columns is None else list(columns)
+        # Sürümü değişmemiş sütunların satırları önbellekten okunur, yalnızca kalanlar hesaplanır.
+        rows, stale = {}, []
+        for c in columns:
+            cached = self._cache_get((c, "profile", z_threshold))
+            if cached is None:
+                stale.append(c)
+            else:
+                rows[c] = cached
+        if stale:
+            part = self._profile_columns(stale, z_threshold, n_jobs, executor)
+            for c, row in zip(stale, part.itertuples(index=False, name=None)):
+                rows[c] = row
+                self._cache_put((c, "profile", z_threshold), row)
+
+        report = pd.DataFrame([rows[c] for c in columns], index=pd.Index(columns, dtype=object),
+                              columns=self.PROFILE_COLUMNS, dtype=object)
+        report["dtype"] = [str(dtype) for dtype in report["dtype"]]
+        for key in ("count", "missing", "unique"):
+            report[key] = report[key].astype(np.int64)
+        # Sayısal olmayan sütunlarda aykırı değer sayısı tanımsızdır (<NA>).
+        report["outliers"] = report["outliers"].astype("Int64")
+        for key in ("mean", "std", "median"):
+            report[key] = report[key].astype(np.float64)
+        for key in ("min", "max"):
+            report[key] = self._numeric_report_column(report[key])
+        total = len(self.data)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            report["missing_ratio"] = report["missing"].astype(float) / total * 100
+            report["unique_ratio"] = report["unique"].astype(float) / total * 100
+        return report
+
     @staticmethod
-    def guess_column_type(series: pd.Series, cat_threshold: float = 0.4, error_tolerance: float = 0.09):
+    def _numeric_report_column(values):
         """
-        Sütunun tipini tahmin eder: numeric, datetime, boolean, categorical, string.
-        Bu versiyon, her bir benzersiz değerin frekansını hata toleransı ile karşılaştırır.
-        
-        Parametreler:
-        series: Tahmin edilecek Pandas Serisi.
-        cat_threshold: Kategorik olarak kabul edilecek maksimum benzersiz değer oranı.
-        error_tolerance: Bir değerin anomali olarak kabul edilmesi için minimum frekans eşiği.
-                        Bu eşiğin altındaki değerler veri hatası olarak kabul edilir.
+        profile() raporunun min/max kolonunu sayısal tipe çevirir: değerlerin hepsi tam sayıysa int64,
+        değilse float64. 2^53'ü aşan tam sayılar float64'te hassasiyet kaybedeceği için ondalıklı
+        veya eksik değerlerle karışıksa kolon object olarak bırakılır.
         """
-        series_cleaned = series.dropna().astype(str).str.strip().str.lower()
-        if series_cleaned.empty:
-            return "string"
+        integers = [isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in values]
+        if all(integers):
+            return pd.to_numeric(values)
+        if any(i and abs(int(v)) > 2 ** 53 for i, v in zip(integers, values)):
+            return values
+        return values.astype(np.float64)
 
-        # 1. Boolean Kontrolü
-        bool_candidates = {"true", "false", "0", "1", "yes", "no"}
-        unique_vals = set(series_cleaned.unique())
-        if unique_vals.issubset(bool_candidates) and len(unique_vals) <= 2:
-            return "boolean"
+    def _profile_columns(self, columns, z_threshold, n_jobs=1, executor="thread"):
+        """
+        profile() raporunun oranlar dışındaki kolonlarını verilen sütunlar için hesaplar.
+        Sayısal sütunların mean/std/min/max/medyan değerleri istatistik önbelleğine de yazılır.
+        """
+        df = self.data[columns]
+        total = len(df)
+        report = pd.DataFrame(index=pd.Index(columns, dtype=object), columns=self.PROFILE_COLUMNS, dtype=object)
+        report["dtype"] = [str(dtype) for dtype in df.dtypes]
 
-        # 2. Datetime Kontrolü
-        possible_formats = ['%Y-%m-%d', '%Y/%m/%d', '%d-%m-%Y', '%d/%m/%Y', '%m/%d/%Y',
-                            '%Y-%m-%d %H:%M:%S', '%d-%m-%Y %H:%M:%S', '%m/%d/%Y %H:%M:%S']
-        for fmt in possible_formats:
-            try:
-                converted_series = pd.to_datetime(series, format=fmt, errors='raise')
-                if not converted_series.isnull().any():
-                    return "datetime"
-            except (ValueError, TypeError):
-                continue
+        num_cols = [c for c in columns if pd.api.types.is_numeric_dtype(df[c])]
+        other_cols = [c for c in columns if c not in set(num_cols)]
 
-        # 3. Numeric Kontrolü
-        if pd.api.types.is_numeric_dtype(series):
-            return "numeric"
-        else:
-            try:
-                if series.astype(float).notna().all():
-                    return "numeric"
-            except (ValueError, TypeError):
-                pass
-                
-        # 4. Kategorik ve String Ayrımı (Yeni ve sadeleştirilmiş mantık)
-        nunique_ratio = series.nunique(dropna=True) / len(series)
-        if nunique_ratio <= cat_threshold:
-            value_counts = series.value_counts(normalize=True, dropna=True)
-            # Eğer herhangi bir değerin frekansı hata toleransından düşükse, string kabul et.
-            if (value_counts < error_tolerance).any():
-                return "string"
+        if num_cols:
+            stats = self._block_stats(df, num_cols, z_threshold, n_jobs=n_jobs, executor=executor)
+            for key in ("count", "missing", "unique", "outliers"):
+                report.loc[num_cols, key] = stats[key].astype(np.int64)
+            for key in ("mean", "std", "min", "median", "max"):
+                report.loc[num_cols, key] = stats[key]
+                for c, value in zip(num_cols, stats[key]):
+                    self._cache_put((c, key), float(value))
+            # Tam sayı sütunlarında min/max orijinal tipiyle raporlanır. float64 blok 2^53'ü aşan
+            # tam sayıları ayırt edemediği için bu sütunlarda unique/min/max kendi tipleri üzerinden hesaplanır.
+            for i, c in enumerate(num_cols):
+                if pd.api.types.is_integer_dtype(df[c]) and stats["count"][i] > 0:
+                    if max(abs(stats["min"][i]), abs(stats["max"][i])) > 2 ** 53:
+                        report.at[c, "unique"] = int(df[c].nunique(dropna=True))
+                        report.at[c, "min"] = int(df[c].min())
+                        report.at[c, "max"] = int(df[c].max())
+                    else:
+                        report.at[c, "min"] = int(stats["min"][i])
+                        report.at[c, "max"] = int(stats["max"][i])
+
+        if other_cols:
+            missing = df[other_cols].isna().sum().to_numpy()
+            report.loc[other_cols, "missing"] = missing.astype(np.int64)
+            report.loc[other_cols, "count"] = (total - missing).astype(np.int64)
+            n_jobs = min(_resolve_jobs(n_jobs), len(other_cols))
+            if n_jobs > 1:
+                # Object sütunlar süreçler arasında paylaşılamadığı için her iki modda da iş parçacığı kullanılır.
+                with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+                    unique = list(pool.map(_with_capture(lambda c: df[c].nunique(dropna=True)), other_cols))
             else:
-                return "categorical"
+                unique = df[other_cols].nunique(dropna=True).to_numpy()
+            report.loc[other_cols, "unique"] = np.asarray(unique, dtype=np.int64)
+        return report
 
-        # Tüm koşullar sağlanamazsa string olarak kabul et
-        return "string"
+    @_instrumented('columns')
+    def sketch(self, columns=None, chunksize=1_000_000, quantile_eps=0.01, distinct_eps=0.01, heavy_eps=0.001):
+        """
+        Sütunları parça parça okuyarak birleştirilebilir özetler (ColumnSketch) çıkarır.
+        Her özet moment (kesin), kantil (sıra hatası <= quantile_eps), benzersiz değer
+        (göreli hata ~ distinct_eps) ve en sık değer (sayım hatası <= heavy_eps * n) tutar.
+        Farklı Preprocessor'lardan/işçilerden gelen özetler merge() ile birleştirilebilir:
+            a = pre1.sketch(["yas"])["yas"]; a.merge(pre2.sketch(["yas"])["yas"])
+
+        Döndürür:
+        - {sütun_adı: ColumnSketch} sözlüğü (hata durumunda None)
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi.")
+            return None
+        columns = list(self.data.columns) if columns is None else ([columns] if isinstance(columns, str) else list(columns))
+        for c in columns:
+            if c not in self.data.columns:
+                _emit(f"'{c}' isimli bir sütun bulunamadı.")
+                return None
+        sketches = {c: ColumnSketch(quantile_eps, distinct_eps, heavy_eps) for c in columns}
+        for start in range(0, len(self.data), chunksize):
+            chunk = self.data.iloc[start:start + chunksize]
+            for c in columns:
+                sketches[c].update(chunk[c])
+        return sketches
+
+    @_instrumented('columns')
+    def sketch_csv(self, file_path, columns=None, chunksize=100_000, encoding=None,
+                   quantile_eps=0.01, distinct_eps=0.01, heavy_eps=0.001):
+        """
+        Dosyayı belleğe yüklemeden iter_csv ile okuyup sütun özetlerini (ColumnSketch) çıkarır.
+        Parametreler sketch() ile aynıdır; bellek kullanımı parça boyutu ve eps değerleriyle sınırlıdır.
+
+        Döndürür:
+        - {sütun_adı: ColumnSketch} sözlüğü (hata durumunda None)
+        """
+        sketches = None
+        for chunk in self.iter_csv(file_path, chunksize=chunksize, encoding=encoding,
+                                   usecols=[columns] if isinstance(columns, str) else columns):
+            if sketches is None:
+                sketches = {c: ColumnSketch(quantile_eps, distinct_eps, heavy_eps) for c in chunk.columns}
+            for c in chunk.columns:
+                sketches[c].update(chunk[c])
+        return sketches
 
+    def _approx_medians(self, columns, eps=0.01, chunksize=1_000_000):
+        """
+        Sayısal sütunların QuantileSketch ile yaklaşık medyanları. Sütun tam olarak kopyalanmaz veya
+        sıralanmaz: en fazla chunksize'lık parçalar float64'e çevrilir ve sketch'e
+        QuantileSketch.BLOCK_SIZE'lık bloklar halinde eklenir. Süre bellek içi tam medyanla (np.nanmedian)
+        benzerdir; avantajı ek belleğin parça boyutuyla sınırlı olmasıdır.
+        """
+        medians = np.empty(len(columns))
+        for j, c in enumerate(columns):
+            sketch = QuantileSketch(eps)
+            values = self.data[c]
+            for start in range(0, len(values), chunksize):
+                sketch.update(values.iloc[start:start + chunksize].to_numpy(dtype=np.float64, na_value=np.nan))
+            medians[j] = sketch.median()
+        return medians
+
+    @staticmethod
+    def _sketch_stats(sk, values, total_count, z_threshold=3):
+        """
+        ColumnSketch özetinden profile() satırıyla aynı anahtarlara sahip istatistikler.
+        """
+        unique = sk.distinct.estimate()
+        stats = {"missing": sk.missing, "missing_ratio": sk.missing / total_count * 100 if total_count else 0.0,
+                 "unique": unique, "unique_ratio": unique / total_count * 100 if total_count else 0.0}
+        stats.update(mean=np.nan, std=np.nan, min=np.nan, max=np.nan, median=np.nan, outliers=0)
+        if sk.numeric and sk.moments.count:
+            moments = sk.moments
+            std = moments.std
+            arr = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            with np.errstate(invalid="ignore"):
+                outliers = int((np.abs(arr - moments.mean) > z_threshold * std).sum()) if std > 0 else 0
+            stats.update(mean=moments.mean, std=std, min=moments.min, max=moments.max,
+                         median=sk.quantiles.median(), outliers=outliers)
+        return stats
 
-    def check_column(self, column_name=None, cat_threshold_value=0.4, error_rate=0.09):
+    @_instrumented('column_name')
+    def check_column(self, column_name=None, cat_threshold_value=0.4, error_rate=0.09, approx=False, eps=0.01):
         """
         Bir sütunun temel istatistiklerini ve özelliklerini gösterir.
         Sütun tipi tahmini yapılarak analiz edilir.
+        approx=True ise benzersiz değer sayısı, medyan ve en sık değerler tam sıralama/sayım
+        yerine sketch() özetlerinden yaklaşık hesaplanır (eps: hedef hata).
         """
         if self.data is None:
-            print("Veri yüklenmedi.")
+            _emit("Veri yüklenmedi.")
             return
         
         if column_name not in self.header:
-            print(f"'{column_name}' isimli bir sütun bulunamadı.")
+            _emit(f"'{column_name}' isimli bir sütun bulunamadı.")
             return
         
         col = self.data[column_name]
         total_count = len(col)
+        col_type, confidence = self.infer_column_type(column_name, cat_threshold=cat_threshold_value, error_tolerance=error_rate)
+        if approx:
+            values = self._cast_series(col, "numeric") if col_type == "numeric" else col
+            sk = ColumnSketch(eps, eps, eps / 10).update(values)
+            stats = self._sketch_stats(sk, values, total_count)
+            top_values = sk.heavy.top(5)
+        else:
+            stats = self.profile([column_name]).loc[column_name]
+            top_values = col.value_counts(dropna=False).head(5)
         
-        print(f"\n📌 Sütun: {column_name}")
+        _emit(f"\n📌 Sütun: {column_name}")
         
         # Tip tahmini
-        col_type = self.guess_column_type(col, cat_threshold=cat_threshold_value, error_tolerance=error_rate)
-        print(f"📄 Tahmini Tip: {col_type}")
+        _emit(f"📄 Tahmini Tip: {col_type} (güven: {confidence:.3f})")
         
         # Eksik veri analizi
-        missing_count = col.isna().sum()
-        missing_ratio = (missing_count / total_count) * 100
-        print(f"❌ Eksik veri sayısı: {missing_count} ({missing_ratio:.2f}%)")
+        _emit(f"❌ Eksik veri sayısı: {stats['missing']} ({stats['missing_ratio']:.2f}%)")
         
         # Eşsiz değer sayısı
-        unique_count = col.nunique(dropna=True)
-        unique_ratio = (unique_count / total_count) * 100
-        print(f"🔢 Eşsiz değer sayısı: {unique_count} ({unique_ratio:.2f}%)")
+        approx_mark = "~" if approx else ""
+        _emit(f"🔢 Eşsiz değer sayısı: {approx_mark}{stats['unique']} ({stats['unique_ratio']:.2f}%)")
         
         # En çok tekrar eden değerler
-        print("\n🏆 En çok tekrar eden 5 değer:")
-        print(col.value_counts(dropna=False).head(5))
+        _emit(f"\n🏆 En çok tekrar eden 5 değer{' (yaklaşık)' if approx else ''}:")
+        _emit(top_values)
         
         # Tip bazlı istatistikler
         if col_type == "numeric":
-            print("\n📊 Sayısal İstatistikler:")
-            mean_val = col.mean()
-            std_val = col.std()
-            print(f"Ortalama: {mean_val:.2f}")
-            print(f"Medyan: {col.median():.2f}")
-            print(f"Std Sapma: {std_val:.2f}")
-            print(f"Min: {col.min()}")
-            print(f"Max: {col.max()}")
-
-            # Z-skor ile aykırı değer sayısı
             z_threshold = 3
-            if std_val > 0:
-                z_scores = (col - mean_val) / std_val
-                outliers = (z_scores.abs() > z_threshold).sum()
-            else:
-                outliers = 0
+            if not pd.api.types.is_numeric_dtype(col) and not approx:
+                # Metin olarak saklanan sayılar: istatistikler dönüştürülmüş değerler üzerinden
+                block = self._cast_series(col, "numeric").to_numpy(dtype=np.float64, na_value=np.nan)[:, None]
+                stats = {key: value[0] for key, value in self._numeric_block_stats(block, z_threshold).items()}
 
-            print(f"Aykırı değer sayısı (Z>{z_threshold}): {outliers}")
+            _emit("\n📊 Sayısal İstatistikler:")
+            _emit(f"Ortalama: {stats['mean']:.2f}")
+            _emit(f"Medyan: {approx_mark}{stats['median']:.2f}")
+            _emit(f"Std Sapma: {stats['std']:.2f}")
+            _emit(f"Min: {stats['min']}")
+            _emit(f"Max: {stats['max']}")
+
+            # Z-skor ile aykırı değer sayısı
+            _emit(f"Aykırı değer sayısı (Z>{z_threshold}): {stats['outliers']}")
         
         elif col_type == "string":
-            lengths = col.dropna().apply(len)
-            print("\n📝 Metin İstatistikleri:")
-            print(f"Ortalama metin uzunluğu: {lengths.mean():.2f}")
-            print(f"En kısa metin uzunluğu: {lengths.min()}")
-            print(f"En uzun metin uzunluğu: {lengths.max()}")
+            lengths = col.dropna().astype(str).str.len()
+            _emit("\n📝 Metin İstatistikleri:")
+            _emit(f"Ortalama metin uzunluğu: {lengths.mean():.2f}")
+            _emit(f"En kısa metin uzunluğu: {lengths.min()}")
+            _emit(f"En uzun metin uzunluğu: {lengths.max()}")
         
         elif col_type == "datetime":
-            parsed = pd.to_datetime(col, errors="coerce")
-            print("\n📅 Tarih İstatistikleri:")
-            print(f"En eski tarih: {parsed.min()}")
-            print(f"En yeni tarih: {parsed.max()}")
-            print(f"Tarih aralığı (gün): {(parsed.max() - parsed.min()).days}")
-            print(f"En sık görülen tarih: {parsed.mode().iloc[0]}")
+            parsed = self._cast_series(col, "datetime")
+            _emit("\n📅 Tarih İstatistikleri:")
+            _emit(f"En eski tarih: {parsed.min()}")
+            _emit(f"En yeni tarih: {parsed.max()}")
+            _emit(f"Tarih aralığı (gün): {(parsed.max() - parsed.min()).days}")
+            _emit(f"En sık görülen tarih: {parsed.mode().iloc[0]}")
         
         elif col_type == "boolean":
             # True/False sayısını hesapla (0/1 veya "true"/"false" olabilir)
-            bool_series = col.dropna().apply(lambda x: str(x).lower() in {"true","1","yes"})
-            true_count = bool_series.sum()
+            bool_series = self._cast_series(col, "boolean").dropna()
+            true_count = int(bool_series.sum())
             false_count = len(bool_series) - true_count
-            print("\n🔘 Boolean İstatistikleri:")
-            print(f"True sayısı: {true_count} (%{true_count/len(col)*100:.1f})")
-            print(f"False sayısı: {false_count} (%{false_count/len(col)*100:.1f})")
+            _emit("\n🔘 Boolean İstatistikleri:")
+            _emit(f"True sayısı: {true_count} (%{true_count/len(col)*100:.1f})")
+            _emit(f"False sayısı: {false_count} (%{false_count/len(col)*100:.1f})")
         
         elif col_type == "categorical":
-            print("\n🏷️ Kategorik İstatistikler:")
-            print(f"Benzersiz değer sayısı: {col.nunique()}")
-            print(f"En sık görülen: {col.mode().iloc[0]}")
-            print("Değer dağılımı:")
-            print(col.value_counts(normalize=True).head(10).apply(lambda x: f"%{x*100:.1f}"))
+            _emit("\n🏷️ Kategorik İstatistikler:")
+            _emit(f"Benzersiz değer sayısı: {approx_mark}{stats['unique']}")
+            _emit(f"En sık görülen: {top_values.index[0] if approx else col.mode().iloc[0]}")
+            _emit("Değer dağılımı:")
+            _emit(col.value_counts(normalize=True).head(10).apply(lambda x: f"%{x*100:.1f}"))
         
         else:
-            print("\n⚠️ Karışık Tipli Sütun:")
-            print(col.apply(type).value_counts())
+            _emit("\n⚠️ Karışık Tipli Sütun:")
+            _emit(col.apply(type).value_counts())
 
 
-    def check_csv(self, z_threshold=3):
+    @_instrumented()
+    def check_csv(self, z_threshold=3, n_jobs=1, executor="thread"):
         """
         CSV hakkında genel bilgiler verir:
         - Toplam satır ve sütun sayısı
@@ -223,146 +3199,206 @@ class Preprocessor:
         - Eksik değer oranı
         - Benzersiz değer oranı
         - Sayısal sütunlarda aykırı değer sayısı (Z-skor yöntemi)
+        İstatistikler profile() ile tek bir toplu geçişte hesaplanır
+        (n_jobs ve executor profile() ile aynı).
         """
         if self.data is None:
-            print("Veri yüklenmedi.")
+            _emit("Veri yüklenmedi.")
             return
         
-        print("=== Genel Bilgiler ===")
-        print(f"Toplam satır sayısı: {self.data.shape[0]}")
-        print(f"Toplam sütun sayısı: {self.data.shape[1]}")
-        print(f"Sütun isimleri: {list(self.data.columns)}")
+        _emit("=== Genel Bilgiler ===")
+        _emit(f"Toplam satır sayısı: {self.data.shape[0]}")
+        _emit(f"Toplam sütun sayısı: {self.data.shape[1]}")
+        _emit(f"Sütun isimleri: {list(self.data.columns)}")
         
-        print("\n=== Sütun Detayları ===")
-        for col_name in self.header:
-            col = self.data[col_name]
-            total = len(col)
-            
-            missing_count = col.isna().sum()
-            missing_ratio = (missing_count / total) * 100
-            
-            unique_count = col.nunique(dropna=True)
-            unique_ratio = (unique_count / total) * 100
-            
-            print(f"\n📌 Sütun: {col_name}")
-            print(f"  Veri tipi: {col.dtype}")
-            print(f"  Eksik değer: {missing_count} ({missing_ratio:.2f}%)")
-            print(f"  Benzersiz değer: {unique_count} ({unique_ratio:.2f}%)")
+        _emit("\n=== Sütun Detayları ===")
+        report = self.profile([c for c in self.header if c in self.data.columns], z_threshold=z_threshold,
+                              n_jobs=n_jobs, executor=executor)
+        for col_name, stats in report.iterrows():
+            _emit(f"\n📌 Sütun: {col_name}")
+            _emit(f"  Veri tipi: {stats['dtype']}")
+            _emit(f"  Eksik değer: {stats['missing']} ({stats['missing_ratio']:.2f}%)")
+            _emit(f"  Benzersiz değer: {stats['unique']} ({stats['unique_ratio']:.2f}%)")
             
-            if pd.api.types.is_numeric_dtype(col):
-                # Z-skor ile aykırı değer sayısı
-                mean_val = col.mean()
-                std_val = col.std()
-                if std_val > 0:
-                    z_scores = (col - mean_val) / std_val
-                    outliers = ((z_scores.abs() > z_threshold).sum())
-                else:
-                    outliers = 0
-                print(f"  Aykırı değer sayısı (Z>{z_threshold}): {outliers}")
+            if not pd.isna(stats["outliers"]):
+                _emit(f"  Aykırı değer sayısı (Z>{z_threshold}): {stats['outliers']}")
 
-    def standard_scale(self, column_name):
+    def _select_columns(self, column_name, select_dtypes=None):
+        """
+        column_name (tek sütun adı veya liste) ya da select_dtypes (örn: 'number', 'float64')
+        ile seçilen sütunların listesini döndürür. Bulunamayan sütun varsa veya ikisi de verilmemişse
+        mesaj yazdırıp None döndürür.
+        """
+        if select_dtypes is not None:
+            return list(self.data.select_dtypes(include=select_dtypes).columns)
+        if column_name is None:
+            _emit("Lütfen column_name veya select_dtypes belirtin.")
+            return None
+        columns = [column_name] if isinstance(column_name, str) else list(column_name)
+        missing = [c for c in columns if c not in self.header]
+        for c in missing:
+            _emit(f"'{c}' isimli bir sütun bulunamadı.")
+        return None if missing else columns
+
+    def _split_numeric(self, columns):
+        """
+        Sütunları sayısal ve sayısal olmayan olarak ayırır.
         """
-        Belirtilen sayısal sütunu standartlaştırır: (x - mean) / std
+        numeric = [c for c in columns if pd.api.types.is_numeric_dtype(self.data[c])]
+        return numeric, [c for c in columns if c not in set(numeric)]
+
+    def _apply_block(self, columns, kernel, float32=False, stats=(), keep_integer_dtypes=False, **params):
+        """
+        Sayısal sütunları tek bir bitişik float bloğa alır, blok çekirdeğini axis=0
+        indirgemeleriyle uygular ve yalnızca değişen sütunları tek atamayla geri yazar.
+        float32=True ise blok (ve yazılan sütunlar) float32 olur, bellek yarıya iner.
+        stats: Çekirdeğin ihtiyaç duyduğu istatistikler; önbellekten (_column_stats) okunup verilir.
+        keep_integer_dtypes: True ise (float32 değilken) tam sayı/boolean tipli (örn. Int64) yazılan
+                             sütunlar, sonuç değerleri tam sayıysa orijinal tiplerine geri çevrilir.
+
+        Döndürür:
+        - Değişen sütunların listesi
+        """
+        X = self.data[columns].to_numpy(dtype=np.float32 if float32 else np.float64, na_value=np.nan, copy=True)
+        if stats:
+            params["stats"] = {name: values.astype(X.dtype)
+                               for name, values in self._column_stats(columns, stats, X).items()}
+        changed = kernel(X, columns, **params)
+        written = [c for c, flag in zip(columns, changed) if flag]
+        if written:
+            block = X if len(written) == len(columns) else X[:, changed]
+            dtypes = self.data.dtypes[written]
+            self.data[written] = block
+            if keep_integer_dtypes and not float32:
+                _restore_integer_dtypes(self.data, written, block, dtypes)
+            self._bump_version(written)
+        return written
+
+    @_instrumented('column_name')
+    def standard_scale(self, column_name=None, select_dtypes=None, float32=False):
+        """
+        Belirtilen sayısal sütun(lar)ı standartlaştırır: (x - mean) / std
+        Birden fazla sütun tek bir 2-D blokta, tek bir vektörel işlemle ölçeklenir.
+
+        column_name: Sütun adı veya sütun listesi
+        select_dtypes: column_name yerine dtype seçicisi (örn: 'number')
+        float32: Sonucu float32 olarak yaz (bellek yarıya iner)
         """
         if self.data is None:
-            print("Veri yüklenmedi.")
+            _emit("Veri yüklenmedi.")
             return
         
-        if column_name not in self.header:
-            print(f"'{column_name}' isimli bir sütun bulunamadı.")
-            return
-        
-        col = self.data[column_name]
-        if not pd.api.types.is_numeric_dtype(col):
-            print(f"'{column_name}' sayısal bir sütun değil.")
+        columns = self._select_columns(column_name, select_dtypes)
+        if columns is None:
             return
         
-        mean_val = col.mean()
-        std_val = col.std()
-        
-        if std_val == 0:
-            print(f"'{column_name}' sütununda standart sapma 0, ölçekleme yapılamıyor.")
+        numeric, others = self._split_numeric(columns)
+        for c in others:
+            _emit(f"'{c}' sayısal bir sütun değil.")
+        if not numeric:
             return
         
         # Standartlaştırma
-        self.data[column_name] = (col - mean_val) / std_val
-        print(f"'{column_name}' sütunu standart ölçeklendi (mean=0, std=1 olacak şekilde).")
+        written = self._apply_block(numeric, _standard_scale_block, float32=float32, stats=("mean", "std"))
+        if len(columns) == 1 and written:
+            _emit(f"'{written[0]}' sütunu standart ölçeklendi (mean=0, std=1 olacak şekilde).")
+        elif written:
+            _emit(f"{len(written)} sütun standart ölçeklendi (mean=0, std=1 olacak şekilde).")
 
-    def minmax_scale(self, column_name, feature_range=(0, 1)):
+    @_instrumented('column_name')
+    def minmax_scale(self, column_name=None, feature_range=(0, 1), select_dtypes=None, float32=False):
         """
-        Belirtilen sayısal sütunu min-max ölçekler.
+        Belirtilen sayısal sütun(lar)ı min-max ölçekler.
         feature_range: ölçek aralığı (min, max)
+        column_name: Sütun adı veya sütun listesi
+        select_dtypes: column_name yerine dtype seçicisi (örn: 'number')
+        float32: Sonucu float32 olarak yaz (bellek yarıya iner)
         """
         if self.data is None:
-            print("Veri yüklenmedi.")
-            return
-        
-        if column_name not in self.header:
-            print(f"'{column_name}' isimli bir sütun bulunamadı.")
+            _emit("Veri yüklenmedi.")
             return
         
-        col = self.data[column_name]
-        if not pd.api.types.is_numeric_dtype(col):
-            print(f"'{column_name}' sayısal bir sütun değil.")
+        columns = self._select_columns(column_name, select_dtypes)
+        if columns is None:
             return
         
-        col_min = col.min()
-        col_max = col.max()
-        
-        if col_max == col_min:
-            print(f"'{column_name}' sütununda tüm değerler aynı, ölçekleme yapılamıyor.")
+        numeric, others = self._split_numeric(columns)
+        for c in others:
+            _emit(f"'{c}' sayısal bir sütun değil.")
+        if not numeric:
             return
         
         min_range, max_range = feature_range
-        self.data[column_name] = ((col - col_min) / (col_max - col_min)) * (max_range - min_range) + min_range
-        print(f"'{column_name}' sütunu min-max ölçeklendi ({min_range}-{max_range} aralığında).")
+        written = self._apply_block(numeric, _minmax_scale_block, float32=float32, stats=("min", "max"),
+                                    feature_range=feature_range)
+        if len(columns) == 1 and written:
+            _emit(f"'{written[0]}' sütunu min-max ölçeklendi ({min_range}-{max_range} aralığında).")
+        elif written:
+            _emit(f"{len(written)} sütun min-max ölçeklendi ({min_range}-{max_range} aralığında).")
 
-    def fill_missing(self, column_name, method="mean", value=None):
+    @_instrumented('column_name')
+    def fill_missing(self, column_name=None, method="mean", value=None, select_dtypes=None, float32=False,
+                     approx=False, eps=0.01):
         """
-        Belirtilen sütundaki eksik değerleri doldurur.
+        Belirtilen sütun(lar)daki eksik değerleri doldurur.
+        Sayısal sütunlar tek bir 2-D blokta birlikte doldurulur.
         
         method: 'mean', 'median', 'mode', 'constant'
         value: method='constant' ise doldurulacak değer
+        column_name: Sütun adı veya sütun listesi
+        select_dtypes: column_name yerine dtype seçicisi (örn: 'number')
+        float32: Doldurulan sayısal sütunları float32 olarak yaz
+        approx: True ise median, sütun sıralanmadan QuantileSketch ile yaklaşık hesaplanır
+                (sıra hatası <= eps)
         """
         if self.data is None:
-            print("Veri yüklenmedi.")
+            _emit("Veri yüklenmedi.")
             return
         
-        if column_name not in self.header:
-            print(f"'{column_name}' isimli sütun bulunamadı.")
+        if method not in ("mean", "median", "mode", "constant"):
+            _emit(f"Geçersiz method: {method}. ('mean', 'median', 'mode', 'constant')")
             return
         
-        col = self.data[column_name]
+        if method == "constant" and value is None:
+            _emit("Lütfen constant metodunda doldurulacak bir değer belirtin.")
+            return
         
-        if col.isna().sum() == 0:
-            print(f"'{column_name}' sütununda eksik değer bulunmuyor.")
+        columns = self._select_columns(column_name, select_dtypes)
+        if columns is None:
             return
         
-        if method == "mean":
-            if pd.api.types.is_numeric_dtype(col):
-                fill_val = col.mean()
-            else:
-                print(f"'{column_name}' sayısal değil, mean ile dolduramazsınız.")
-                return
-        elif method == "median":
-            if pd.api.types.is_numeric_dtype(col):
-                fill_val = col.median()
-            else:
-                print(f"'{column_name}' sayısal değil, median ile dolduramazsınız.")
-                return
-        elif method == "mode":
-            fill_val = col.mode().iloc[0]
-        elif method == "constant":
-            if value is None:
-                print("Lütfen constant metodunda doldurulacak bir değer belirtin.")
-                return
-            fill_val = value
-        else:
-            print(f"Geçersiz method: {method}. ('mean', 'median', 'mode', 'constant')")
+        missing_counts = self.data[columns].isna().sum()
+        if len(columns) == 1 and missing_counts.iloc[0] == 0:
+            _emit(f"'{columns[0]}' sütununda eksik değer bulunmuyor.")
             return
+        columns = [c for c in columns if missing_counts[c] > 0]
+        
+        numeric, others = self._split_numeric(columns)
+        if method == "constant" and not isinstance(value, (int, float, np.number)):
+            numeric, others = [], columns
+        elif method in ("mean", "median"):
+            # boolean sütunların ortalaması/medyanı (örn. 0.667) sütunu float'a çevirirdi
+            others += [c for c in numeric if pd.api.types.is_bool_dtype(self.data[c])]
+            numeric = [c for c in numeric if c not in set(others)]
+        if numeric and approx and method == "median":
+            medians = self._approx_medians(numeric, eps)
+            self._apply_block(numeric, _fill_block, float32=float32, keep_integer_dtypes=True,
+                              method="constant", value=medians)
+        elif numeric:
+            stats = (method,) if method in ("mean", "median") else ()
+            self._apply_block(numeric, _fill_block, float32=float32, stats=stats, keep_integer_dtypes=True,
+                              method=method, value=value)
         
-        self.data[column_name].fillna(fill_val, inplace=True)
+        for c in others:
+            col = self.data[c]
+            if method in ("mean", "median"):
+                _emit(f"'{c}' sayısal değil, {method} ile dolduramazsınız.")
+                continue
+            fill_val = col.mode().iloc[0] if method == "mode" else value
+            self.data[c] = col.fillna(fill_val)
+            self._bump_version(c)
 
+    @_instrumented('columns')
     def drop_column(self, columns):
         """
         Verilen sütun(lar)ı veri setinden düşürür.
@@ -370,7 +3406,7 @@ class Preprocessor:
         columns: str (tek sütun) veya list (birden fazla sütun)
         """
         if self.data is None:
-            print("Veri yüklenmedi.")
+            _emit("Veri yüklenmedi.")
             return
 
         # Tek sütun string olarak verilmişse listeye çevir
@@ -382,152 +3418,502 @@ class Preprocessor:
         missing_cols = [col for col in columns if col not in self.data.columns]
         
         if missing_cols:
-            print(f"Uyarı: Aşağıdaki sütunlar bulunamadı ve düşürülemedi: {missing_cols}")
+            _emit(f"Uyarı: Aşağıdaki sütunlar bulunamadı ve düşürülemedi: {missing_cols}")
         
         if existing_cols:
             self.data.drop(columns=existing_cols, inplace=True)
-            print(f"Sütun(lar) düşürüldü: {existing_cols}")
+            self.header = list(self.data.columns)
+            self._bump_version(existing_cols)
+            _emit(f"Sütun(lar) düşürüldü: {existing_cols}")
 
-    def handle_outliers(self, column_name, method="drop", z_threshold=3, fill_value=None):
+    _KEEP_OPTIONS = ("first", "last", False)
+
+    @staticmethod
+    def _dedup_report(rows, distinct, removed):
+        report = {"rows": rows, "distinct": distinct, "duplicates": rows - distinct,
+                  "removed": removed, "kept": rows - removed}
+        _emit(f"Tekrar eden satırlar: {report['duplicates']} ({report['distinct']} benzersiz anahtar), "
+              f"{report['removed']} satır silindi.")
+        return report
+
+    @_instrumented('subset')
+    def deduplicate(self, subset=None, keep="first", normalize=False):
+        """
+        Tekrar eden satırları satır (veya subset sütunları) özetleri üzerinden siler.
+        Satırlar 64-bit özetlere indirgendiği için geniş object sütunlarda drop_duplicates'ten
+        hızlıdır ve ek bellek satır genişliğinden bağımsızdır. Satır indeksi korunur.
+
+        Parametreler:
+        - subset: Anahtar sütun(lar); None ise tüm sütunlar
+        - keep: 'first' (ilk görüleni tut), 'last' (son görüleni tut) veya False (tekrar edenlerin hepsini sil)
+        - normalize: Metinleri karşılaştırmadan önce kırp, küçük harfe çevir ve boşlukları sadeleştir
+
+        Döndürür:
+        - Rapor sözlüğü: rows, distinct, duplicates (ilk görülmeden sonraki tekrar sayısı), removed, kept
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi.")
+            return None
+        if keep not in self._KEEP_OPTIONS:
+            _emit(f"Geçersiz keep: {keep}. {self._KEEP_OPTIONS}")
+            return None
+        subset = [subset] if isinstance(subset, str) else subset
+        for c in subset or []:
+            if c not in self.data.columns:
+                _emit(f"'{c}' isimli bir sütun bulunamadı.")
+                return None
+
+        # Bellekteki veride özetler pandas'ın uint64 hash tablosuyla karşılaştırılır.
+        digests = pd.Index(_row_digests(self.data, subset, normalize))
+        keep_rows = ~digests.duplicated(keep=keep)
+
+        removed = int(len(keep_rows) - keep_rows.sum())
+        if removed:
+            self.data = self.data[keep_rows]
+            self._bump_version()
+        return self._dedup_report(len(digests), digests.nunique(), removed)
+
+    @_instrumented('subset')
+    def deduplicate_csv(self, file_path, file_name="deduplicated.csv", path=None, subset=None, keep="first",
+                        normalize=False, chunksize=100_000, index=False, encoding=None):
+        """
+        Dosyayı belleğe yüklemeden parça parça okuyup tekrar eden satırları silerek CSV olarak kaydeder.
+        Sadece DigestIndex (benzersiz anahtar başına 24 byte) ve bir parça bellekte tutulur.
+        keep='first' tek geçişte yapılır; keep='last' ve keep=False için ilk geçişte özetlerin
+        sayıları ve son konumları toplanır, ikinci geçişte satırlar süzülerek yazılır.
+        Sayı olarak çözülebilen değerler sayısal olarak, diğerleri metin olarak karşılaştırılır
+        (örn. "1" ile "1.0" aynı, "1" ile "01x" farklı kabul edilir); sonuç parça boyutuna bağlı değildir.
+
+        Parametreler:
+        - file_path: Okunacak CSV dosyasının yolu
+        - file_name, path, index: save_csv ile aynı
+        - subset, keep, normalize: deduplicate ile aynı
+        - chunksize: Her parçadaki maksimum satır sayısı
+        - encoding: Dosya kodlaması (None ise detect_encoding ile tüm dosya doğrulanarak tahmin edilir)
+
+        Döndürür:
+        - Rapor sözlüğü (deduplicate ile aynı; hata durumunda None)
+        """
+        if keep not in self._KEEP_OPTIONS:
+            _emit(f"Geçersiz keep: {keep}. {self._KEEP_OPTIONS}")
+            return None
+        try:
+            if encoding is None:
+                encoding = self.detect_encoding(file_path, validate=True) or self.ENCODINGS[0]
+            columns = list(pd.read_csv(file_path, nrows=0, encoding=encoding).columns)
+        except FileNotFoundError:
+            _emit(f"Dosya bulunamadı: {file_path}")
+            return None
+        subset = [subset] if isinstance(subset, str) else subset
+        for c in subset or []:
+            if c not in columns:
+                _emit(f"'{c}' isimli bir sütun bulunamadı.")
+                return None
+
+        # Parçalar metin olarak okunur ve sayılar değer bazlı çözülür: bir parçada int, diğerinde (tek bir
+        # hatalı değer yüzünden) object okunan sütunlar aynı değerler için aynı özeti verir; dosyadaki
+        # değerler de aynen yazılır.
+        read_kwargs = {"chunksize": chunksize, "encoding": encoding, "dtype": str}
+        digest_index = DigestIndex()
+        if keep != "first":
+            for chunk in self.iter_csv(file_path, **read_kwargs):
+                digest_index.add(_row_digests(chunk, subset, normalize, parse_numbers=True))
+
+        full_path = f"{path}/{file_name}" if path else file_name
+        total_rows = kept = 0
+        with open(full_path, "w", newline="", encoding="utf-8") as f:
+            for i, chunk in enumerate(self.iter_csv(file_path, **read_kwargs)):
+                digests = _row_digests(chunk, subset, normalize, parse_numbers=True)
+                if keep == "first":
+                    keep_rows = digest_index.add(digests)
+                else:
+                    counts, last = digest_index.lookup(digests)
+                    keep_rows = (last == total_rows + np.arange(len(chunk))) if keep == "last" else counts == 1
+                chunk[keep_rows].to_csv(f, header=(i == 0), index=index)
+                total_rows += len(chunk)
+                kept += int(keep_rows.sum())
+
+        _emit(f"CSV kaydedildi: {full_path} ({kept} satır, parça boyutu={chunksize})")
+        return self._dedup_report(total_rows, len(digest_index), total_rows - kept)
+
+    def _outlier_engine(self, columns, method="drop", detection="zscore", threshold=None, fill_value=None,
+                        float32=False, approx=False, eps=0.01):
+        """
+        Birden fazla sayısal sütunun aykırı değerlerini tek geçişte işler: sınırlar tüm sütunlar
+        için tek bir 2-D blok üzerinde hesaplanır, birleşik boolean maske oluşturulur ve
+        drop/cap/impute tek seferde uygulanır. Tüm sütunlar aynı (işlem öncesi) veri üzerinden
+        değerlendirilir.
+
+        Döndürür:
+        - Sütun bazlı özet DataFrame (lower, upper, outliers, outlier_ratio)
+        """
+        X = self.data[columns].to_numpy(dtype=np.float32 if float32 else np.float64, na_value=np.nan, copy=True)
+        lower, upper, valid = _outlier_bounds(X, columns, detection, threshold,
+                                              self._column_stats(columns, _OUTLIER_STATS[detection], X))
+        with np.errstate(invalid="ignore"):
+            mask = ((X < lower) | (X > upper)) & valid
+        counts = mask.sum(axis=0)
+        summary = pd.DataFrame({"lower": lower, "upper": upper, "outliers": counts,
+                                "outlier_ratio": counts / len(X) * 100 if len(X) else 0.0}, index=columns)
+        
+        if method == "drop":
+            rows = mask.any(axis=1)
+            if rows.any():
+                # Tüm sütunların maskesi birleştirilip satırlar tek filtreyle silinir
+                self.data = self.data[~rows]
+                self._bump_version()
+            _emit(f"{len(columns)} sütundaki aykırı değerler için {int(rows.sum())} satır drop edildi ({detection}).")
+            return summary
+        
+        changed = counts > 0
+        if method == "cap":
+            np.clip(X, lower, upper, out=X, where=changed)
+        else:
+            if fill_value is not None:
+                fill = np.broadcast_to(np.asarray(fill_value, dtype=np.float64), X.shape[1:])
+            elif approx:
+                fill = self._approx_medians(columns, eps)
+            else:
+                fill = self._column_stats(columns, ("median",), X)["median"]
+            np.copyto(X, np.broadcast_to(fill, X.shape), where=mask, casting="unsafe")
+        written = [c for c, flag in zip(columns, changed) if flag]
+        if written:
+            self.data[written] = X if len(written) == len(columns) else X[:, changed]
+            self._bump_version(written)
+        _emit(f"{len(written)} sütundaki {int(counts.sum())} aykırı değer {method} yöntemiyle işlendi ({detection}): {written}")
+        return summary
+
+    @_instrumented('column_name')
+    def handle_outliers(self, column_name=None, method="drop", z_threshold=3, fill_value=None, select_dtypes=None, float32=False,
+                        approx=False, eps=0.01, detection="zscore", threshold=None):
         """
-        Belirtilen sütundaki aykırı değerleri işler.
+        Belirtilen sütun(lar)daki aykırı değerleri işler.
         
         method: 'drop', 'cap', 'impute'
         z_threshold: aykırı değer tespiti için Z-skor eşiği (default 3)
         fill_value: method='impute' ise doldurulacak değer (default medyan)
+        column_name: Sütun adı veya sütun listesi. Birden fazla sütun tek bir 2-D blokta,
+                     birleşik maskeyle tek geçişte işlenir (drop'ta satırlar bir kez silinir)
+        select_dtypes: column_name yerine dtype seçicisi (örn: 'number')
+        float32: cap/impute sonucunu float32 olarak yaz
+        approx: True ise impute medyanı QuantileSketch ile yaklaşık hesaplanır (sıra hatası <= eps)
+        detection: 'zscore', 'iqr' veya 'mad' (medyan mutlak sapma)
+        threshold: detection eşiği; verilmezse zscore için z_threshold, iqr için 1.5, mad için 3.5
+
+        Döndürür:
+        - Sütun bazlı özet DataFrame (lower, upper, outliers, outlier_ratio); hata durumunda None
         """
         if self.data is None:
-            print("Veri yüklenmedi.")
+            _emit("Veri yüklenmedi.")
             return
         
-        if column_name not in self.header:
-            print(f"'{column_name}' sütunu bulunamadı.")
+        if method not in ("drop", "cap", "impute"):
+            _emit(f"Geçersiz method: {method}. ('drop', 'cap', 'impute')")
             return
         
-        col = self.data[column_name]
-        
-        if not pd.api.types.is_numeric_dtype(col):
-            print(f"'{column_name}' sayısal bir sütun değil.")
+        if detection not in _OUTLIER_THRESHOLDS:
+            _emit(f"Geçersiz detection: {detection}. ('zscore', 'iqr', 'mad')")
             return
         
-        mean_val = col.mean()
-        std_val = col.std()
+        if detection == "zscore":
+            z_threshold = threshold = z_threshold if threshold is None else threshold
         
-        if std_val == 0:
-            print(f"'{column_name}' sütununda standart sapma 0, aykırı değer yok.")
+        columns = self._select_columns(column_name, select_dtypes)
+        if columns is None:
             return
-        
-        z_scores = (col - mean_val) / std_val
-        outlier_idx = z_scores[ z_scores.abs() > z_threshold ].index
-        
-        if len(outlier_idx) == 0:
-            print(f"'{column_name}' sütununda Z>{z_threshold} aykırı değer bulunamadı.")
+        numeric, others = self._split_numeric(columns)
+        for c in others:
+            _emit(f"'{c}' sayısal bir sütun değil.")
+        if not numeric:
             return
-        
-        if method == "drop":
-            self.data.drop(index=outlier_idx, inplace=True)
-            print(f"'{column_name}' sütunundaki {len(outlier_idx)} aykırı değer satırları drop edildi.")
-        
-        elif method == "cap":
-            upper = mean_val + z_threshold * std_val
-            lower = mean_val - z_threshold * std_val
-            self.data.loc[col > upper, column_name] = upper
-            self.data.loc[col < lower, column_name] = lower
-            print(f"'{column_name}' sütunundaki {len(outlier_idx)} aykırı değer cap yöntemiyle sınırlandırıldı.")
-        
-        elif method == "impute":
-            if fill_value is None:
-                fill_value = col.median()
-            self.data.loc[outlier_idx, column_name] = fill_value
-            print(f"'{column_name}' sütunundaki {len(outlier_idx)} aykırı değer impute yöntemiyle dolduruldu (değer={fill_value}).")
-        
-        else:
-            print(f"Geçersiz method: {method}. ('drop', 'cap', 'impute')")
+        return self._outlier_engine(numeric, method=method, detection=detection, threshold=threshold,
+                                    fill_value=fill_value, float32=float32, approx=approx, eps=eps)
 
-    def encode_column(self, column_name, mode="label"):
+    @staticmethod
+    def _indicator_frame(codes, n_categories, dtype=int, sparse=False):
+        """
+        Kategori kodlarından (-1: hiçbiri) 0-1 gösterge sütunları üretir.
+        Yoğun modda tek bir Fortran sıralı 2-D blok oluşturulur; seyrek modda kodlar
+        get_dummies(sparse=True) ile her sütunda yalnızca 1 olan satırları saklayan
+        SparseArray'lere çevrilir (yoğun blok oluşturulmaz).
+        """
+        dtype = np.dtype(dtype)
+        if sparse:
+            categorical = pd.Categorical.from_codes(codes, categories=pd.RangeIndex(n_categories))
+            return pd.get_dummies(categorical, sparse=True, dtype=dtype)
+        valid = codes >= 0
+        block = np.zeros((len(codes), n_categories), dtype=dtype, order="F")
+        block[np.flatnonzero(valid), codes[valid]] = 1
+        return pd.DataFrame(block, copy=False)
+
+    @_instrumented('column_name')
+    def encode_column(self, column_name, mode="label", dtype=int, sparse=False, top_k=None, n_features=None):
         """
         Kategorik sütunu sayısala çevirir.
         
-        mode: 'label' veya 'onehot'
+        mode: 'label', 'onehot' veya 'hashing'
+        dtype: onehot/hashing gösterge sütunlarının tipi (örn: np.uint8 ile int64'e göre 8 kat az bellek)
+        sparse: True ise gösterge sütunları seyrek (Sparse) tutulur; yüksek kardinalitede yalnızca
+                1 olan hücreler saklanır
+        top_k: onehot'ta yalnızca en sık k kategori için sütun açılır, diğerleri '<sütun>_other'
+               sütununda toplanır ('other' adlı bir kategori varsa '<sütun>__other' kullanılır)
+        n_features: hashing modunda sabit sütun sayısı; değerler hash'lenip n_features kovaya
+                    dağıtılır (kategori sayısından bağımsız genişlik, çakışmalar olabilir)
+        Yeni sütunlar veri kopyalanmadan eklenir (sütun silinir, göstergeler sona eklenir).
         """
         if self.data is None:
-            print("Veri yüklenmedi.")
+            _emit("Veri yüklenmedi.")
             return
         
         if column_name not in self.header:
-            print(f"'{column_name}' sütunu bulunamadı.")
+            _emit(f"'{column_name}' sütunu bulunamadı.")
+            return
+        
+        if mode not in ("label", "onehot", "hashing"):
+            _emit(f"Geçersiz mode: '{mode}'. 'label', 'onehot' veya 'hashing' olmalı.")
             return
         
         col = self.data[column_name]
         
-        if pd.api.types.is_numeric_dtype(col):
-            print(f"'{column_name}' zaten sayısal.")
+        if pd.api.types.is_numeric_dtype(col) and mode != "hashing":
+            _emit(f"'{column_name}' zaten sayısal.")
             return
         
         if mode == "label":
             self.data[column_name] = col.astype('category').cat.codes
-            print(f"'{column_name}' sütununa label encoding uygulandı.")
+            self._bump_version(column_name)
+            _emit(f"'{column_name}' sütununa label encoding uygulandı.")
+            return
         
-        elif mode == "onehot":
-            onehot_df = pd.get_dummies(col, prefix=column_name, dtype=int)  # 0-1 garantili
-            self.data = pd.concat([self.data.drop(columns=[column_name]), onehot_df], axis=1)
-            self.header = list(self.data.columns)
-            print(f"'{column_name}' sütununa one-hot encoding uygulandı.")
+        if mode == "hashing":
+            if not n_features or n_features < 1:
+                _emit("Lütfen hashing modunda n_features (sütun sayısı) belirtin.")
+                return
+            # NaN -> -1 (tüm sütunlar 0); hash değerleri çalıştırmalar arasında sabittir
+            codes = np.full(len(col), -1, dtype=np.int64)
+            valid = col.notna().to_numpy()
+            codes[valid] = (pd.util.hash_array(col[valid].to_numpy()) % np.uint64(n_features)).astype(np.int64)
+            names = [f"hash_{i}" for i in range(n_features)]
+        elif top_k is not None:
+            top = col.value_counts().index[:top_k]
+            try:
+                top = sorted(top)
+            except TypeError:
+                top = list(top)
+            codes = pd.Index(top).get_indexer(col)
+            codes[(codes == -1) & col.notna().to_numpy()] = len(top)
+            # Toplama sütununun adı gerçek bir kategoriyle çakışmamalı.
+            other = "other"
+            while other in {str(name) for name in top}:
+                other = f"_{other}"
+            names = top + [other]
+        else:
+            categorical = pd.Categorical(col)
+            codes = categorical.codes
+            names = list(categorical.categories)
         
+        indicators = self._indicator_frame(codes, len(names), dtype, sparse)
+        indicators.columns = [f"{column_name}_{name}" for name in names]
+        indicators.index = self.data.index
+        
+        # copy-on-write ile drop ve concat mevcut sütunları kopyalamaz; self.data'ya atanmış
+        # (çağıranın) DataFrame'i değiştirilmez.
+        self.data = pd.concat([self.data.drop(columns=[column_name]), indicators], axis=1)
+        self.header = list(self.data.columns)
+        self._bump_version([column_name] + list(indicators.columns))
+        if mode == "hashing":
+            _emit(f"'{column_name}' sütununa hashing encoding uygulandı ({n_features} sütun).")
+        else:
+            _emit(f"'{column_name}' sütununa one-hot encoding uygulandı ({len(names)} sütun).")
+
+    def _stratified_ranks(self, stratify, order):
+        """
+        order sırasındaki satırları sınıflara göre (sınıf içi sıra korunarak) gruplar;
+        gruplanmış sırayı, her satırın sınıf içi sırasını ve sınıf büyüklüğünü döndürür.
+        """
+        codes = pd.factorize(self.data[stratify], use_na_sentinel=False)[0]
+        order = order[np.argsort(codes[order], kind="stable")]
+        grouped = codes[order]
+        rank = np.arange(len(order)) - np.searchsorted(grouped, grouped, side="left")
+        sizes = np.bincount(grouped)[grouped]
+        return order, rank, sizes
+
+    def split_indices(self, train_size=0.7, val_size=0.15, random_state=None, stratify=None, shuffle=True):
+        """
+        Veriyi kopyalamadan Train, Validation ve Test satır konumlarını (iloc indeksleri) döndürür.
+        Global NumPy RNG'si değiştirilmez; karıştırma yerel bir np.random.default_rng ile yapılır.
+
+        Parametreler:
+        - train_size, val_size: split_data ile aynı (val_size=0 ise validation boş dizi olur)
+        - random_state: seed
+        - stratify: Sınıf oranları her parçada korunacak sütun (örn: hedef sütun)
+        - shuffle: False ise satırlar sırayla bölünür
+
+        Döndürür:
+        - (train_idx, val_idx, test_idx) numpy dizileri; self.data.iloc[train_idx] ile kullanılır
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi.")
+            return None
+
+        if train_size + val_size > 1.0:
+            _emit("train_size + val_size toplamı 1'den küçük veya eşit olmalı.")
+            return None
+
+        if stratify is not None and stratify not in self.data.columns:
+            _emit(f"'{stratify}' isimli bir sütun bulunamadı.")
+            return None
+
+        rng = np.random.default_rng(random_state)
+        n_total = len(self.data)
+        order = rng.permutation(n_total) if shuffle else np.arange(n_total)
+
+        if stratify is None:
+            n_train = int(n_total * train_size)
+            n_val = int(n_total * val_size)
+            return order[:n_train], order[n_train:n_train + n_val], order[n_train + n_val:]
+
+        # Her sınıf kendi içinde train/val/test oranlarıyla bölünür
+        order, rank, sizes = self._stratified_ranks(stratify, order)
+        n_train = (sizes * train_size).astype(np.int64)
+        n_val = (sizes * val_size).astype(np.int64)
+        part = np.where(rank < n_train, 0, np.where(rank < n_train + n_val, 1, 2))
+        splits = [order[part == k] for k in range(3)]
+        # Sınıflara göre gruplanmış sırayı tekrar karıştır
+        return tuple(idx[rng.permutation(len(idx))] if shuffle else np.sort(idx) for idx in splits)
+
+    def kfold(self, n_splits=5, shuffle=True, random_state=None, stratify=None):
+        """
+        K-katlı çapraz doğrulama için (train_idx, val_idx) satır konumlarını tembel (lazy)
+        olarak üreten bir generator. Her katın dizileri yalnızca sırası gelince oluşturulur.
+
+        Parametreler:
+        - n_splits: Kat sayısı
+        - shuffle, random_state: split_indices ile aynı
+        - stratify: Sınıf oranları her katta korunacak sütun
+
+        örn: for train_idx, val_idx in pre.kfold(5, stratify="hedef"): ...
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi.")
+            return
+
+        if n_splits < 2 or n_splits > len(self.data):
+            _emit(f"n_splits 2 ile satır sayısı ({len(self.data)}) arasında olmalı.")
+            return
+
+        if stratify is not None and stratify not in self.data.columns:
+            _emit(f"'{stratify}' isimli bir sütun bulunamadı.")
+            return
+
+        rng = np.random.default_rng(random_state)
+        n_total = len(self.data)
+        order = rng.permutation(n_total) if shuffle else np.arange(n_total)
+        if stratify is None:
+            # np.array_split ile aynı kat büyüklükleri
+            sizes = np.full(n_splits, n_total // n_splits)
+            sizes[:n_total % n_splits] += 1
+            fold = np.repeat(np.arange(n_splits), sizes)
+        else:
+            # Her sınıfın satırları katlara sırayla dağıtılır
+            order, rank, _ = self._stratified_ranks(stratify, order)
+            fold = rank % n_splits
+        for k in range(n_splits):
+            in_fold = fold == k
+            yield order[~in_fold], order[in_fold]
+
+    def iter_batches(self, batch_size=1024, columns=None, target_column=None, indices=None,
+                     shuffle=True, random_state=None, dtype=np.float32, drop_last=False):
+        """
+        Eğitim döngüleri için karıştırılmış mini-batch'ler üreten generator. Veri seti kopyalanmaz;
+        her batch için yalnızca o batch'in satırları bitişik (C sıralı) bir numpy dizisine alınır.
+
+        Parametreler:
+        - batch_size: Batch başına satır sayısı
+        - columns: Özellik sütunları (verilmezse target_column dışındaki sayısal sütunlar)
+        - target_column: Verilirse (X, y) çiftleri üretilir
+        - indices: Yalnızca bu satır konumları kullanılır (örn: split_indices'ten train_idx)
+        - shuffle, random_state: Her çağrıda satır sırası yerel bir RNG ile karıştırılır
+        - dtype: X dizisinin tipi (default float32)
+        - drop_last: Son eksik batch atlanır
+
+        örn: for X, y in pre.iter_batches(256, target_column="hedef", indices=train_idx): ...
+        """
+        if self.data is None:
+            _emit("Veri yüklenmedi.")
+            return
+
+        if target_column is not None and target_column not in self.data.columns:
+            _emit(f"Hedef sütun '{target_column}' bulunamadı.")
+            return
+
+        if columns is None:
+            columns = [c for c in self.data.select_dtypes(include="number").columns if c != target_column]
         else:
-            print(f"Geçersiz mode: '{mode}'. 'label' veya 'onehot' olmalı.")
+            columns = self._select_columns(columns)
+            if columns is None:
+                return
+
+        # Sütun dizileri bir kez alınır (sayısal numpy sütunlarında kopyasız görünüm)
+        arrays = [self.data[c].to_numpy() for c in columns]
+        target = self.data[target_column].to_numpy() if target_column is not None else None
+
+        indices = np.arange(len(self.data)) if indices is None else np.asarray(indices)
+        if shuffle:
+            indices = indices[np.random.default_rng(random_state).permutation(len(indices))]
+
+        stop = len(indices) - len(indices) % batch_size if drop_last else len(indices)
+        for start in range(0, stop, batch_size):
+            # Batch içi sıralama bellek erişimini ardışık yapar; batch üyeleri yine rastgeledir
+            rows = np.sort(indices[start:start + batch_size]) if shuffle else indices[start:start + batch_size]
+            X = np.empty((len(rows), len(arrays)), dtype=dtype)
+            for j, values in enumerate(arrays):
+                X[:, j] = values[rows]
+            yield (X, target[rows]) if target is not None else X
 
-    def split_data(self, target_column, train_size=0.7, val_size=0.15, random_state=None):
+    @_instrumented('target_column')
+    def split_data(self, target_column, train_size=0.7, val_size=0.15, random_state=None, stratify=None):
         """
         Veri setini Train, Validation (opsiyonel) ve Test olarak ayırır, X ve y olarak böler.
+        Satır konumları split_indices ile hesaplanır; her parça yalnızca bir kez oluşturulur.
 
         Parametreler:
         - target_column: hedef sütun (y)
         - train_size: Train seti oranı
         - val_size: Validation seti oranı (0 ise validation set oluşturulmaz)
         - random_state: seed
+        - stratify: Sınıf oranları korunacak sütun (örn: target_column)
 
         Döndürür:
         - train_X, train_y, val_X, val_y, test_X, test_y
         """
         if self.data is None:
-            print("Veri yüklenmedi.")
+            _emit("Veri yüklenmedi.")
             return None
 
         if target_column not in self.data.columns:
-            print(f"Hedef sütun '{target_column}' bulunamadı.")
+            _emit(f"Hedef sütun '{target_column}' bulunamadı.")
             return None
 
-        if train_size + val_size > 1.0:
-            print("train_size + val_size toplamı 1'den küçük veya eşit olmalı.")
+        splits = self.split_indices(train_size, val_size, random_state=random_state, stratify=stratify)
+        if splits is None:
             return None
+        train_idx, val_idx, test_idx = splits
 
-        X = self.data.drop(columns=[target_column]).copy()
-        y = self.data[target_column].copy()
-
-        # Shuffle
-        np.random.seed(random_state)
-        shuffled_idx = np.random.permutation(len(X))
-        X = X.iloc[shuffled_idx].reset_index(drop=True)
-        y = y.iloc[shuffled_idx].reset_index(drop=True)
+        # drop() copy-on-write ile kopya oluşturmaz; satırlar her parça için tek take ile alınır
+        X = self.data.drop(columns=[target_column])
+        y = self.data[target_column]
 
-        n_total = len(X)
-        n_train = int(n_total * train_size)
-        n_val = int(n_total * val_size)
+        def take(idx):
+            return X.iloc[idx].reset_index(drop=True), y.iloc[idx].reset_index(drop=True)
 
-        # Slice ile ayır
-        X_train = X.iloc[:n_train]
-        y_train = y.iloc[:n_train]
+        X_train, y_train = take(train_idx)
+        X_test, y_test = take(test_idx)
 
-        X_test = X.iloc[n_train+n_val:]
-        y_test = y.iloc[n_train+n_val:]
-
-        if n_val > 0:
-            X_val = X.iloc[n_train:n_train+n_val]
-            y_val = y.iloc[n_train:n_train+n_val]
-            print(f"Train: {X_train.shape}, Validation: {X_val.shape}, Test: {X_test.shape}")
+        if len(val_idx) > 0:
+            X_val, y_val = take(val_idx)
+            _emit(f"Train: {X_train.shape}, Validation: {X_val.shape}, Test: {X_test.shape}")
             return X_train, y_train, X_val, y_val, X_test, y_test
         else:
-            print(f"Train: {X_train.shape}, Test: {X_test.shape} (Validation yok)")
+            _emit(f"Train: {X_train.shape}, Test: {X_test.shape} (Validation yok)")
             return X_train, y_train, X_test, y_test
-
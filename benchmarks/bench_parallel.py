@@ -0,0 +1,64 @@
+"""
+Paralel profil çıkarma ve tip tahmini için seri/paralel karşılaştırma benchmark'ı.
+
+Kullanım:
+    python benchmarks/bench_parallel.py --rows 1000000 --numeric 200 --text 50 --jobs 1 4 16 64
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from Preprocess4data import Preprocessor  # noqa: E402
+from datagen import make_dataset  # noqa: E402
+
+
+def make_frame(rows, numeric, text, seed=0):
+    # Metin sütunları 50 değerli kategorik sütunlardır (eksik/aykırı değer yok)
+    return make_dataset(rows, numeric=numeric, datetime=0, boolean=0, categorical=text, text=0,
+                        missing_rate=0.0, outlier_rate=0.0, seed=seed)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--numeric", type=int, default=100)
+    parser.add_argument("--text", type=int, default=20)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--executor", choices=["thread", "process"], nargs="+", default=["thread", "process"])
+    args = parser.parse_args()
+
+    pre = Preprocessor()
+    pre.data = make_frame(args.rows, args.numeric, args.text)
+    pre.header = list(pre.data.columns)
+    print(f"Veri: {pre.data.shape[0]} satır x {pre.data.shape[1]} sütun, {os.cpu_count()} çekirdek")
+
+    base_profile, reference = timed(lambda: pre.profile())
+    pre.invalidate_cache()
+    base_infer, reference_types = timed(lambda: pre.infer_types())
+
+    print(f"{'işlem':<14}{'executor':<10}{'n_jobs':>7}{'süre (s)':>12}{'hızlanma':>10}  aynı sonuç")
+    print(f"{'profile':<14}{'serial':<10}{1:>7}{base_profile:>12.3f}{1.0:>10.2f}")
+    print(f"{'infer_types':<14}{'serial':<10}{1:>7}{base_infer:>12.3f}{1.0:>10.2f}")
+    for executor in args.executor:
+        for n_jobs in args.jobs:
+            if n_jobs == 1:
+                continue
+            pre.invalidate_cache()  # önbellekten okunmasın
+            elapsed, report = timed(lambda: pre.profile(n_jobs=n_jobs, executor=executor))
+            print(f"{'profile':<14}{executor:<10}{n_jobs:>7}{elapsed:>12.3f}{base_profile / elapsed:>10.2f}  {report.equals(reference)}")
+            pre.invalidate_cache()
+            elapsed, types = timed(lambda: pre.infer_types(n_jobs=n_jobs, executor=executor))
+            print(f"{'infer_types':<14}{executor:<10}{n_jobs:>7}{elapsed:>12.3f}{base_infer / elapsed:>10.2f}  {types == reference_types}")
+
+
+if __name__ == "__main__":
+    main()
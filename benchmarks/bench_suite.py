@@ -0,0 +1,157 @@
+"""
+Preprocessor metotları için süre ve bellek (tracemalloc tepe değeri) benchmark'ı.
+
+Her satır sayısı için datagen.make_dataset ile deterministik bir veri seti üretilir; her metot
+taze bir Preprocessor üzerinde (veri kopyası ölçüme dahil edilmeden) çalıştırılır. Süre,
+tracemalloc kapalıyken --repeat çalıştırmanın en iyisidir; bellek ayrı bir çalıştırmada ölçülür.
+Sonuçlar JSON ve CSV olarak kaydedilir; --compare ile önceki bir JSON çıktısıyla karşılaştırılır.
+
+Kullanım:
+    python benchmarks/bench_suite.py --rows 10000 100000 1000000 --repeat 3
+    python benchmarks/bench_suite.py --rows 10000000 --methods load_csv save_csv --compare results/onceki.json
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from Preprocess4data import Preprocessor  # noqa: E402
+from datagen import make_dataset  # noqa: E402
+
+NUMERIC = ["num_0", "num_1", "num_2", "num_3"]
+
+
+def _guess_all(pre, ctx):
+    for column in pre.data.columns:
+        Preprocessor.guess_column_type(pre.data[column])
+
+
+# metot adı -> (ön yükleme gerekli mi, ölçülen işlem)
+CASES = {
+    "load_csv": (False, lambda pre, ctx: pre.load_csv(ctx["csv_path"])),
+    "guess_column_type": (True, _guess_all),
+    "check_csv": (True, lambda pre, ctx: pre.check_csv()),
+    "fill_missing": (True, lambda pre, ctx: pre.fill_missing(NUMERIC, method="mean")),
+    "handle_outliers": (True, lambda pre, ctx: pre.handle_outliers(NUMERIC, method="cap")),
+    "encode_column": (True, lambda pre, ctx: pre.encode_column("cat_0", mode="onehot")),
+    "split_data": (True, lambda pre, ctx: pre.split_data("flag_0", random_state=0)),
+    "save_csv": (True, lambda pre, ctx: pre.save_csv("bench_output.csv", path=ctx["tmp_dir"])),
+}
+
+
+def _fresh(df, preload):
+    pre = Preprocessor()
+    if preload:
+        pre.data = df.copy()
+        pre.header = list(df.columns)
+    return pre
+
+
+def measure(name, df, ctx, repeat):
+    """
+    Bir metodu ölçer: en iyi süre (saniye) ve tracemalloc tepe belleği (MB).
+    """
+    preload, run = CASES[name]
+    times = []
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for _ in range(repeat):
+            pre = _fresh(df, preload)
+            start = time.perf_counter()
+            run(pre, ctx)
+            times.append(time.perf_counter() - start)
+        pre = _fresh(df, preload)
+        tracemalloc.start()
+        run(pre, ctx)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return min(times), peak / 1024 ** 2
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(results, previous_path):
+    with open(previous_path, encoding="utf-8") as f:
+        previous = {(r["method"], r["rows"]): r for r in json.load(f)["results"]}
+    print(f"\nKarşılaştırma: {previous_path} (oran < 1 daha iyi)")
+    print(f"{'metot':<20}{'satır':>10}{'süre oranı':>12}{'bellek oranı':>14}")
+    for r in results:
+        old = previous.get((r["method"], r["rows"]))
+        if old is None:
+            continue
+        time_ratio = r["seconds"] / old["seconds"] if old["seconds"] else float("nan")
+        mem_ratio = r["peak_mb"] / old["peak_mb"] if old["peak_mb"] else float("nan")
+        print(f"{r['method']:<20}{r['rows']:>10}{time_ratio:>12.2f}{mem_ratio:>14.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--methods", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--missing-rate", type=float, default=0.05)
+    parser.add_argument("--outlier-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "results"))
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki JSON sonuç dosyası")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'metot':<20}{'satır':>10}{'süre (s)':>12}{'tepe bellek (MB)':>18}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in args.rows:
+            df = make_dataset(rows, missing_rate=args.missing_rate, outlier_rate=args.outlier_rate, seed=args.seed)
+            ctx = {"tmp_dir": tmp_dir, "csv_path": os.path.join(tmp_dir, f"bench_{rows}.csv")}
+            if "load_csv" in args.methods:
+                df.to_csv(ctx["csv_path"], index=False)
+            for name in args.methods:
+                seconds, peak_mb = measure(name, df, ctx, args.repeat)
+                results.append({"method": name, "rows": rows, "columns": df.shape[1],
+                                "seconds": round(seconds, 6), "peak_mb": round(peak_mb, 3)})
+                print(f"{name:<20}{rows:>10}{seconds:>12.4f}{peak_mb:>18.1f}")
+
+    meta = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "missing_rate": args.missing_rate,
+        "outlier_rate": args.outlier_rate,
+    }
+    os.makedirs(args.out, exist_ok=True)
+    stem = os.path.join(args.out, f"bench_{time.strftime('%Y%m%d_%H%M%S')}")
+    with open(f"{stem}.json", "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+    with open(f"{stem}.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0]) + ["commit"])
+        writer.writeheader()
+        writer.writerows({**r, "commit": meta["commit"]} for r in results)
+    print(f"\nSonuçlar kaydedildi: {stem}.json, {stem}.csv")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
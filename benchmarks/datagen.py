@@ -0,0 +1,88 @@
+"""
+Benchmark'lar için deterministik sentetik veri üreteci.
+
+Aynı seed ve parametrelerle her çalıştırmada aynı veri üretilir. Sayısal, tarih, boolean,
+kategorik ve serbest metin sütunları; kontrollü eksik değer ve aykırı değer oranlarıyla oluşturulur.
+
+Kullanım:
+    from datagen import make_dataset
+    df = make_dataset(100_000, missing_rate=0.05, outlier_rate=0.01)
+"""
+import numpy as np
+import pandas as pd
+
+WORDS = np.array([
+    "veri", "analiz", "model", "tahmin", "sonuç", "hızlı", "yavaş", "büyük", "küçük", "müşteri",
+    "ürün", "sipariş", "teslimat", "fiyat", "indirim", "kampanya", "şehir", "mağaza", "ödeme", "iade",
+    "kalite", "destek", "talep", "stok", "rapor", "günlük", "aylık", "yıllık", "yeni", "eski",
+])
+
+
+def _with_missing(values, rng, missing_rate):
+    """
+    values (pandas dizisi) içinde missing_rate oranında rastgele hücreyi eksik yapar.
+    """
+    if missing_rate > 0:
+        values = values.copy()
+        values[rng.random(len(values)) < missing_rate] = None
+    return values
+
+
+def _sentences(rng, count, min_words=3, max_words=12):
+    lengths = rng.integers(min_words, max_words + 1, count)
+    words = WORDS[rng.integers(0, len(WORDS), lengths.sum())]
+    bounds = np.concatenate([[0], np.cumsum(lengths)])
+    return np.array([" ".join(words[bounds[i]:bounds[i + 1]]) for i in range(count)], dtype=object)
+
+
+def make_dataset(rows, numeric=4, datetime=1, boolean=1, categorical=2, text=1,
+                 missing_rate=0.05, outlier_rate=0.01, n_categories=50, text_pool=20_000, seed=0):
+    """
+    Karışık tipli sentetik bir DataFrame üretir.
+
+    Parametreler:
+    - rows: Satır sayısı
+    - numeric, datetime, boolean, categorical, text: Her tipten sütun sayısı
+    - missing_rate: Her sütundaki eksik değer oranı
+    - outlier_rate: Sayısal sütunlarda ortalamadan 8-15 std uzağa itilen değerlerin oranı
+    - n_categories: Kategorik sütunlardaki farklı değer sayısı (Zipf benzeri dağılım)
+    - text_pool: Serbest metin sütunları için üretilen farklı cümle sayısı
+    - seed: Rastgelelik tohumu
+
+    Döndürür:
+    - pd.DataFrame (sütunlar: num_i, date_i, flag_i, cat_i, text_i)
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+
+    for j in range(numeric):
+        loc, scale = rng.uniform(-100, 100), rng.uniform(1, 50)
+        values = rng.normal(loc, scale, rows)
+        outliers = rng.random(rows) < outlier_rate
+        signs = rng.choice([-1.0, 1.0], outliers.sum())
+        values[outliers] = loc + signs * rng.uniform(8, 15, outliers.sum()) * scale
+        if j % 2:
+            # Tek indisli sütunlar tam sayı değerli (eksik değer varsa float olarak saklanır)
+            values = np.round(values)
+        columns[f"num_{j}"] = _with_missing(pd.Series(values), rng, missing_rate)
+
+    start = np.datetime64("2015-01-01T00:00:00", "s")
+    for j in range(datetime):
+        offsets = rng.integers(0, 10 * 365 * 24 * 3600, rows).astype("timedelta64[s]")
+        columns[f"date_{j}"] = _with_missing(pd.Series(start + offsets), rng, missing_rate)
+
+    for j in range(boolean):
+        columns[f"flag_{j}"] = _with_missing(pd.Series(rng.random(rows) < 0.3, dtype="boolean"), rng, missing_rate)
+
+    weights = 1.0 / np.arange(1, n_categories + 1)
+    weights /= weights.sum()
+    labels = np.array([f"kategori_{i}" for i in range(n_categories)], dtype=object)
+    for j in range(categorical):
+        columns[f"cat_{j}"] = _with_missing(pd.Series(labels[rng.choice(n_categories, rows, p=weights)]),
+                                           rng, missing_rate)
+
+    pool = _sentences(rng, min(text_pool, max(rows, 1)))
+    for j in range(text):
+        columns[f"text_{j}"] = _with_missing(pd.Series(pool[rng.integers(0, len(pool), rows)]), rng, missing_rate)
+
+    return pd.DataFrame(columns)
@@ -0,0 +1,26 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Preprocess4data import MemorySink, Preprocessor
+
+
+def test_silent_call_captures_thread_pool_messages(tmp_path, capsys):
+    # Parçalar iş parçacığı havuzunda okunur; okunamayan parçanın mesajı da çağrının
+    # tamponuna gitmeli, ekrana yazılmamalı.
+    good = tmp_path / "a.csv"
+    pd.DataFrame({"x": [1, 2]}).to_csv(good, index=False)
+    bad = tmp_path / "b.csv"
+    bad.write_bytes(b"")
+
+    sink = MemorySink()
+    pre = Preprocessor(verbose=False, sinks=[sink])
+    assert pre.load_csv([str(good), str(bad)], n_jobs=2) is False
+
+    assert capsys.readouterr().out == ""
+    messages = sink.events[-1]["messages"]
+    assert any("CSV okunamadı" in m for m in messages)
+    assert any("parça okunamadı" in m for m in messages)
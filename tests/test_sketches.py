@@ -0,0 +1,43 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Preprocess4data import QuantileSketch
+
+
+@pytest.mark.parametrize("eps", [0.05, 0.01])
+@pytest.mark.parametrize("seed", range(8))
+def test_quantile_rank_error_within_eps(eps, seed):
+    # Sıra hatası sadece medyanda değil, tüm kantillerde eps içinde kalmalı.
+    rng = np.random.default_rng(seed)
+    data = rng.lognormal(size=200_000) if seed % 2 else rng.normal(size=200_000)
+    sketch = QuantileSketch(eps=eps, seed=seed)
+    for part in np.array_split(data, 5):
+        sketch.update(part)
+
+    qs = np.linspace(0.01, 0.99, 99)
+    estimates = sketch.quantile(qs)
+    ordered = np.sort(data)
+    low = np.searchsorted(ordered, estimates, side="left") / len(data)
+    high = np.searchsorted(ordered, estimates, side="right") / len(data)
+    rank_error = np.maximum(low - qs, qs - high).clip(min=0)
+    assert rank_error.max() <= eps
+
+    exact = np.quantile(data, qs)
+    assert np.all(np.abs(np.searchsorted(ordered, exact) / len(data) - qs) <= eps)
+
+
+def test_merged_quantiles_within_eps():
+    rng = np.random.default_rng(42)
+    parts = [rng.normal(loc, size=100_000) for loc in (0, 3, 6)]
+    sketches = [QuantileSketch(eps=0.01, seed=i).update(part) for i, part in enumerate(parts)]
+    merged = sketches[0].merge(sketches[1]).merge(sketches[2])
+
+    data = np.sort(np.concatenate(parts))
+    qs = np.array([0.05, 0.25, 0.5, 0.75, 0.95])
+    ranks = np.searchsorted(data, merged.quantile(qs)) / len(data)
+    assert np.abs(ranks - qs).max() <= 0.01
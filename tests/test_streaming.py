@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Preprocess4data import Preprocessor
+
+
+@pytest.mark.parametrize("chunksize", [3, 4, 100])
+def test_stream_label_codes_match_eager(tmp_path, chunksize):
+    # Parçalar ayrı ayrı okununca ilk parçalar int64, sonrakiler object çıkar; kodlar yine de
+    # tüm dosya yüklenip encode_column uygulanmış haliyle aynı olmalı.
+    values = ["1", "2", "1", "2", "1", "2", "x", "1", "2", "y"]
+    source = tmp_path / "data.csv"
+    pd.DataFrame({"v": values, "n": range(len(values))}).to_csv(source, index=False)
+
+    streamed = Preprocessor(verbose=False)
+    streamed.stream_process(str(source), [("encode_column", "v")], file_name="out.csv",
+                            path=str(tmp_path), chunksize=chunksize)
+    eager = Preprocessor(verbose=False)
+    eager.load_csv(str(source))
+    eager.encode_column("v")
+
+    assert pd.read_csv(tmp_path / "out.csv")["v"].tolist() == eager.data["v"].tolist()
+
+
+def test_stream_skips_numeric_column(tmp_path):
+    source = tmp_path / "data.csv"
+    pd.DataFrame({"n": [3, 1, 2, 1]}).to_csv(source, index=False)
+
+    Preprocessor(verbose=False).stream_process(str(source), [("encode_column", "n")], file_name="out.csv",
+                                               path=str(tmp_path), chunksize=2)
+
+    assert pd.read_csv(tmp_path / "out.csv")["n"].tolist() == [3, 1, 2, 1]